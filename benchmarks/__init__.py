@@ -0,0 +1,13 @@
+"""
+Benchmarks of the PolarsPulse profiling functions on synthetic data.
+
+Run with `python -m benchmarks.run` from the repository root; compare two runs with
+`python -m benchmarks.compare`.
+"""
+
+from .generate import DTYPE_MIX, generate
+
+__all__ = [
+    "DTYPE_MIX",
+    "generate",
+]
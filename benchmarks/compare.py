@@ -0,0 +1,51 @@
+# benchmarks/compare.py
+import argparse
+import json
+
+# Helper to format a ratio of a new value to a baseline value
+def _ratio(base: float, new: float) -> str:
+    if base is None or new is None or base == 0:
+        return "-"
+    return f"{new / base:.2f}x"
+
+def compare(baseline: dict, new: dict) -> list:
+    """
+    Compares two results of `benchmarks.run`, function by function.
+
+    :param baseline: Result of the baseline run.
+    :param new: Result of the new run.
+    :return: Rows of (function, baseline time, new time, time ratio, baseline memory, new memory, memory ratio).
+    :rtype: list
+    """
+    rows = []
+    for name in new["results"]:
+        if name not in baseline["results"]:
+            continue
+        b, n = baseline["results"][name], new["results"][name]
+        rows.append((name, b["time_s"], n["time_s"], _ratio(b["time_s"], n["time_s"]),
+                     b["peak_mem_mb"], n["peak_mem_mb"], _ratio(b["peak_mem_mb"], n["peak_mem_mb"])))
+    return rows
+
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline", help="JSON result of the baseline run.")
+    parser.add_argument("new", help="JSON result of the new run.")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+
+    for key in ("rows", "cols", "lazy", "generate_params"):
+        if baseline["meta"].get(key) != new["meta"].get(key):
+            print(f"Warning: runs differ in {key}: {baseline['meta'].get(key)} vs {new['meta'].get(key)}.")
+
+    print(f"baseline: {baseline['meta']['commit']}   new: {new['meta']['commit']}")
+    print(f"{'function':<20} {'base s':>9} {'new s':>9} {'ratio':>7} {'base MB':>9} {'new MB':>9} {'ratio':>7}")
+    fmt = lambda v, spec: "-" if v is None else format(v, spec)
+    for name, bt, nt, tr, bm, nm, mr in compare(baseline, new):
+        print(f"{name:<20} {bt:>9.3f} {nt:>9.3f} {tr:>7} {fmt(bm, '>9.1f')} {fmt(nm, '>9.1f')} {mr:>7}")
+
+if __name__ == "__main__":
+    main()
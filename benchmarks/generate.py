@@ -0,0 +1,116 @@
+# benchmarks/generate.py
+import datetime
+import numpy as np
+import polars as pl
+
+# Default share of columns per generated kind
+DTYPE_MIX = {"float": 0.4, "int": 0.2, "cat": 0.2, "str": 0.1, "bool": 0.05, "date": 0.05}
+
+# --- Helper Functions ---
+
+# Helper to split a number of columns by the dtype mix (largest remainder rounding)
+def _column_counts(cols: int, dtype_mix: dict) -> dict:
+    total = sum(dtype_mix.values())
+    shares = {kind: cols * share / total for kind, share in dtype_mix.items()}
+    counts = {kind: int(share) for kind, share in shares.items()}
+    for kind in sorted(shares, key=lambda k: shares[k] - counts[k], reverse=True)[:cols - sum(counts.values())]:
+        counts[kind] += 1
+    return counts
+
+# Helper to pick random row positions with the given rate (a binomial number of positions,
+# drawn with replacement, which is much cheaper than one uniform draw per row)
+def _positions(rng: np.random.Generator, rows: int, rate: float) -> np.ndarray:
+    return np.unique(rng.integers(0, rows, rng.binomial(rows, rate)))
+
+# Helper to generate the values of one column of a kind
+def _column(rng: np.random.Generator, kind: str, rows: int, cardinality: int, outlier_rate: float,
+            nan_rate: float, inf_rate: float) -> pl.Series:
+    if kind == "float":
+        values = rng.standard_normal(rows)
+        outliers = _positions(rng, rows, outlier_rate)
+        values[outliers] = rng.choice([-1, 1], len(outliers)) * rng.uniform(20, 50, len(outliers)) # 20 to 50 std away
+        values[_positions(rng, rows, nan_rate)] = np.nan
+        values[_positions(rng, rows, inf_rate)] = np.inf
+        return pl.Series(values)
+    if kind == "int":
+        values = rng.integers(0, 1_000_000, rows)
+        outliers = _positions(rng, rows, outlier_rate)
+        values[outliers] = rng.integers(10**9, 2 * 10**9, len(outliers))
+        return pl.Series(values)
+    if kind == "cat":
+        # Zipf-like level frequencies, so the last levels are rare
+        cdf = np.cumsum(1 / np.arange(1, cardinality + 1))
+        codes = np.searchsorted(cdf / cdf[-1], rng.random(rows), side="right").clip(max=cardinality - 1)
+        return "L" + pl.Series(codes).cast(pl.String).str.pad_start(len(str(cardinality - 1)), "0")
+    if kind == "str":
+        # High-cardinality identifiers
+        return pl.Series(rng.integers(0, 2**62, rows)).cast(pl.String)
+    if kind == "bool":
+        return pl.Series(rng.random(rows) < 0.5)
+    if kind == "date":
+        start = (datetime.date(2005, 1, 1) - datetime.date(1970, 1, 1)).days
+        return pl.Series(rng.integers(start, start + 7305, rows)).cast(pl.Int32).cast(pl.Date)
+    raise ValueError(f"Unknown column kind '{kind}'.")
+
+# --- Main Function ---
+def generate(rows: int = 100_000,
+             cols: int = 20,
+             dtype_mix: dict = None,
+             null_rate: float = 0.05,
+             nan_rate: float = 0.01,
+             inf_rate: float = 0.001,
+             outlier_rate: float = 0.01,
+             cardinality: int = 8,
+             dup_row_rate: float = 0.01,
+             dup_col_n: int = 1,
+             seed: int = 0,
+             ) -> pl.DataFrame:
+    """
+    Generates a synthetic DataFrame with controllable data issues, using vectorized NumPy draws
+    (no per-value Python calls), so generation is much faster than profiling.
+
+    :param rows: Number of rows.
+    :param cols: Number of generated columns (before duplicate columns are added).
+    :param dtype_mix: Share of columns per kind: "float", "int", "cat" (low-cardinality strings),
+        "str" (high-cardinality strings), "bool" and "date". Defaults to `DTYPE_MIX`.
+    :param null_rate: Proportion of Nulls in each column.
+    :param nan_rate: Proportion of NaNs in float columns.
+    :param inf_rate: Proportion of Infinite values in float columns.
+    :param outlier_rate: Proportion of outliers in float and int columns.
+    :param cardinality: Number of levels of the "cat" columns. With Nulls a column has one more
+        distinct value, so keep it below `profile()`'s `unique_n_threshold` (10) for the columns to
+        be classified as categorical.
+    :param dup_row_rate: Proportion of rows that are copies of other rows.
+    :param dup_col_n: Number of columns duplicated under a new name ("<column>_dup").
+    :param seed: Seed of the generator.
+    :return: The generated DataFrame.
+    :rtype: pl.DataFrame
+    :raises ValueError: If a parameter is invalid.
+    """
+    if rows <= 0 or cols <= 0:
+        raise ValueError("rows and cols must be positive.")
+    if cardinality <= 0:
+        raise ValueError("cardinality must be positive.")
+    for name, rate in [("null_rate", null_rate), ("nan_rate", nan_rate), ("inf_rate", inf_rate),
+                       ("outlier_rate", outlier_rate), ("dup_row_rate", dup_row_rate)]:
+        if not 0 <= rate < 1:
+            raise ValueError(f"{name} must be between 0 and 1 (exclusive of 1).")
+
+    rng = np.random.default_rng(seed)
+    counts = _column_counts(cols, dtype_mix or DTYPE_MIX)
+
+    columns = {}
+    for kind, n in counts.items():
+        for i in range(n):
+            values = _column(rng, kind, rows, cardinality, outlier_rate, nan_rate, inf_rate)
+            columns[f"{kind}_{i + 1}"] = values.scatter(_positions(rng, rows, null_rate), None)
+    df = pl.DataFrame(columns)
+
+    # Duplicate columns: copies of the first columns
+    df = df.with_columns(pl.col(c).alias(f"{c}_dup") for c in df.columns[:dup_col_n])
+
+    # Duplicate rows: replace a share of the rows with copies of other rows
+    index = np.arange(rows)
+    targets = _positions(rng, rows, dup_row_rate)
+    index[targets] = rng.integers(0, rows, len(targets))
+    return df[index]
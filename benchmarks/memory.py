@@ -0,0 +1,122 @@
+# benchmarks/memory.py
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Benchmark the checkout, not an installed copy
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Measured calls on a lazy scan `lf`. Each runs in a fresh process, so its peak RSS is its own.
+CALLS = {
+    "profile": "pp.profile(lf)",
+    "profile_bitmask": "pp.profile(lf, get_dup_stats=False, row_output='bitmask')",
+    "profile_no_rows": "pp.profile(lf, get_dup_stats=False, get_outlier_stats=False, row_output='flagged')",
+    "column_missing_prop": "pp.column_missing_prop(lf)",
+    "num_stats": "pp.num_stats(lf)",
+    "cat_stats": "pp.cat_stats(lf)",
+}
+
+# Code run in the measuring process: profile the scan, then print the peak RSS as JSON
+_MEASURE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+import polars as pl
+import polarspulse as pp
+from benchmarks.run import _PeakMemory
+lf = pl.scan_parquet({pattern!r})
+with _PeakMemory() as mem:
+    start = time.perf_counter()
+    {call}
+    time_s = time.perf_counter() - start
+print(json.dumps({{"time_s": time_s, "base_rss_mb": mem.start_mb, "peak_rss_mb": mem.peak_mb}}))
+"""
+
+# --- Helper Functions ---
+
+# Helper to write the rows as Parquet files of `chunk_rows` rows, generated one chunk at a time
+def _write_data(directory: str, rows: int, cols: int, chunk_rows: int, row_group_size: int) -> str:
+    from benchmarks.generate import generate
+    for i, start in enumerate(range(0, rows, chunk_rows)):
+        df = generate(rows=min(chunk_rows, rows - start), cols=cols, dup_col_n=0, seed=i)
+        df.write_parquet(os.path.join(directory, f"part-{i:05d}.parquet"), row_group_size=row_group_size)
+    return os.path.join(directory, "*.parquet")
+
+# Helper to measure one call in a fresh process
+def _measure(call: str, pattern: str) -> dict:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = _MEASURE.format(root=root, pattern=pattern, call=CALLS[call])
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+# --- Main Function ---
+def run(sizes: list = None,
+        cols: int = 4,
+        calls: list = None,
+        chunk_rows: int = 1_000_000,
+        row_group_size: int = 100_000) -> dict:
+    """
+    Measures the peak resident memory of profiling a lazy Parquet scan at growing row counts.
+
+    For each size, synthetic data is written as Parquet files (generated chunk by chunk, so the
+    data never has to fit in memory), and each call runs in a fresh process on
+    `pl.scan_parquet(...)`. Peak RSS is sampled on a thread with psutil (the `ru_maxrss`
+    high-water mark is inherited from the parent process on Linux), and includes the output frames.
+
+    :param sizes: Row counts to measure. Defaults to 1M, 2M and 4M rows.
+    :param cols: Number of generated columns.
+    :param calls: Names of the measured calls (see `CALLS`). Defaults to all.
+    :param chunk_rows: Rows per generated Parquet file.
+    :param row_group_size: Rows per Parquet row group.
+    :return: Dict with the run parameters ("meta") and a list of results ("results").
+    :rtype: dict
+    :raises ValueError: If a call name or a size is invalid, or psutil is not installed.
+    """
+    sizes = sizes or [1_000_000, 2_000_000, 4_000_000]
+    calls = calls or list(CALLS)
+    unknown = [c for c in calls if c not in CALLS]
+    if unknown:
+        raise ValueError(f"Unknown calls: {unknown}. Available: {list(CALLS)}.")
+    if any(size <= 0 for size in sizes):
+        raise ValueError("sizes must be positive.")
+    if psutil is None:
+        raise ValueError("psutil is required to measure the peak memory.")
+
+    results = []
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            pattern = _write_data(directory, rows, cols, chunk_rows, row_group_size)
+            for call in calls:
+                result = {"call": call, "rows": rows, **_measure(call, pattern)}
+                results.append(result)
+                print(f"{call:<20} {rows:>12,} rows {result['time_s']:>9.2f} s {result['peak_rss_mb']:>9.1f} MB")
+
+    meta = {"sizes": sizes, "cols": cols, "chunk_rows": chunk_rows, "row_group_size": row_group_size,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    return {"meta": meta, "results": results}
+
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure the peak memory of profiling a lazy Parquet scan at growing row counts.")
+    parser.add_argument("--sizes", type=int, nargs="+", help="Row counts (default: 1M, 2M, 4M).")
+    parser.add_argument("--cols", type=int, default=4)
+    parser.add_argument("--calls", nargs="+", choices=list(CALLS), help="Calls to measure (default: all).")
+    parser.add_argument("--chunk-rows", type=int, default=1_000_000)
+    parser.add_argument("--row-group-size", type=int, default=100_000)
+    parser.add_argument("--output", "-o", help="Write the results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    result = run(sizes=args.sizes, cols=args.cols, calls=args.calls, chunk_rows=args.chunk_rows,
+                 row_group_size=args.row_group_size)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# benchmarks/run.py
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import polars as pl
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Benchmark the checkout, not an installed copy
+import polarspulse as pp
+from benchmarks.generate import generate
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Benchmarked functions. Functions taking column types get them precomputed, so each
+# benchmark measures the function's own work only.
+FUNCTIONS = {
+    "column_type_ident": lambda df, col_types: pp.column_type_ident(df),
+    "column_dup_ind": lambda df, col_types: pp.column_dup_ind(df),
+    "row_dup_ind": lambda df, col_types: pp.row_dup_ind(df),
+    "num_stats": lambda df, col_types: pp.num_stats(df, df_col_types=col_types),
+    "num_outlier_stats": lambda df, col_types: pp.num_outlier_stats(df, df_col_types=col_types),
+    "cat_stats": lambda df, col_types: pp.cat_stats(df, df_col_types=col_types),
+    "profile": lambda df, col_types: pp.profile(df),
+}
+
+# Column classes a function needs, so a benchmark on data without them is not a no-op
+REQUIRED_CLASSES = {
+    "num_stats": ["num"],
+    "num_outlier_stats": ["num"],
+    "cat_stats": ["cat"],
+    "profile": ["num", "cat"],
+}
+
+# --- Helper Functions ---
+
+# Helper to sample the peak resident memory of this process while a call runs
+class _PeakMemory:
+    def __init__(self, interval: float = 0.002):
+        self.interval = interval
+        self.start_mb = None
+        self.peak_mb = None
+
+    def _rss_mb(self) -> float:
+        return self._process.memory_info().rss / 1024 ** 2
+
+    def _poll(self) -> None:
+        while not self._done.is_set():
+            self.peak_mb = max(self.peak_mb, self._rss_mb())
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        if psutil is None:
+            return self
+        self._process = psutil.Process()
+        self._done = threading.Event()
+        self.start_mb = self.peak_mb = self._rss_mb()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        if psutil is None:
+            return
+        self._done.set()
+        self._thread.join()
+        self.peak_mb = max(self.peak_mb, self._rss_mb())
+
+    @property
+    def increase_mb(self) -> float:
+        return None if psutil is None else self.peak_mb - self.start_mb
+
+# Helper to get the current git commit of the checkout, if any
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# Helper to time one function over repeats
+def _bench(fn, df: pl.DataFrame, col_types: pl.DataFrame, repeat: int) -> dict:
+    times, peaks = [], []
+    for _ in range(repeat):
+        gc.collect()
+        with _PeakMemory() as mem:
+            start = time.perf_counter()
+            fn(df, col_types)
+            times.append(time.perf_counter() - start)
+        peaks.append(mem.increase_mb)
+    return {
+        "time_s": min(times),
+        "times_s": times,
+        "peak_mem_mb": None if psutil is None else max(peaks),
+    }
+
+# --- Main Function ---
+def run(rows: int = 100_000,
+        cols: int = 20,
+        functions: list = None,
+        repeat: int = 3,
+        lazy: bool = False,
+        **generate_params) -> dict:
+    """
+    Generates a synthetic DataFrame and benchmarks the profiling functions on it.
+
+    Wall time is the best of `repeat` runs. Peak memory is the largest increase of the
+    process resident memory during a run (sampled on a thread with psutil; None if psutil is
+    not installed), so it includes the output and any memory Polars does not release.
+
+    :param rows: Number of rows of the generated data.
+    :param cols: Number of columns of the generated data.
+    :param functions: Names of the benchmarked functions (see `FUNCTIONS`). Defaults to all.
+    :param repeat: Number of runs of each function.
+    :param lazy: If True, functions get a LazyFrame over the data (streaming engine).
+    :param generate_params: Other parameters of `generate()`.
+    :return: Dict with the run metadata ("meta") and a result per function ("results").
+    :rtype: dict
+    :raises ValueError: If a function name is unknown, repeat is not positive, or the data has no
+        columns of a class a function needs (see `REQUIRED_CLASSES`).
+    """
+    functions = functions or list(FUNCTIONS)
+    unknown = [f for f in functions if f not in FUNCTIONS]
+    if unknown:
+        raise ValueError(f"Unknown functions: {unknown}. Available: {list(FUNCTIONS)}.")
+    if repeat <= 0:
+        raise ValueError("repeat must be positive.")
+    if psutil is None:
+        print("Warning: psutil is not installed, peak memory is not recorded.")
+
+    start = time.perf_counter()
+    df = generate(rows=rows, cols=cols, **generate_params)
+    generate_s = time.perf_counter() - start
+    col_types = pp.column_type_ident(df)
+    data = df.lazy() if lazy else df
+
+    classes = set(col_types["col_class"])
+    no_columns = {name: [c for c in REQUIRED_CLASSES.get(name, []) if c not in classes] for name in functions}
+    no_columns = {name: missing for name, missing in no_columns.items() if missing}
+    if no_columns:
+        raise ValueError(f"The generated data has no columns of the classes these functions need: {no_columns}. "
+                         "Lower the cardinality or change the dtype mix.")
+
+    results = {}
+    for name in functions:
+        results[name] = _bench(FUNCTIONS[name], data, col_types, repeat)
+        print(f"{name:<20} {results[name]['time_s']:>9.3f} s"
+              + ("" if psutil is None else f" {results[name]['peak_mem_mb']:>9.1f} MB"))
+
+    meta = {
+        "commit": _git_commit(),
+        "polarspulse_version": pp.__version__,
+        "polars_version": pl.__version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "rows": rows,
+        "cols": df.width,
+        "repeat": repeat,
+        "lazy": lazy,
+        "generate_params": generate_params,
+        "generate_s": generate_s,
+    }
+    return {"meta": meta, "results": results}
+
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the PolarsPulse profiling functions on synthetic data.")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--functions", nargs="+", choices=list(FUNCTIONS), help="Functions to benchmark (default: all).")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--lazy", action="store_true", help="Pass a LazyFrame (streaming engine).")
+    parser.add_argument("--null-rate", type=float, default=0.05)
+    parser.add_argument("--nan-rate", type=float, default=0.01)
+    parser.add_argument("--inf-rate", type=float, default=0.001)
+    parser.add_argument("--outlier-rate", type=float, default=0.01)
+    parser.add_argument("--cardinality", type=int, default=8)
+    parser.add_argument("--dup-row-rate", type=float, default=0.01)
+    parser.add_argument("--dup-col-n", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", "-o", help="Write the results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    result = run(rows=args.rows, cols=args.cols, functions=args.functions, repeat=args.repeat, lazy=args.lazy,
+                 null_rate=args.null_rate, nan_rate=args.nan_rate, inf_rate=args.inf_rate,
+                 outlier_rate=args.outlier_rate, cardinality=args.cardinality,
+                 dup_row_rate=args.dup_row_rate, dup_col_n=args.dup_col_n, seed=args.seed)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+if __name__ == "__main__":
+    main()
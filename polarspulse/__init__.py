@@ -3,17 +3,58 @@
 PolarsPulse: Fast, insightful data profiling for Polars DataFrames.
 """
 
-from .profiling import (
-    profile,
-    column_type_ident,
-    column_missing_prop,
-    row_missing_prop,
-    column_dup_ind,
-    row_dup_ind,
-    num_stats,
-    num_outlier_stats,
-    cat_stats
-)
+import importlib
+
+# Module of each exported name. Submodules (and Polars) are imported on first access, so
+# importing the package, e.g. for the command-line `--help`, stays fast.
+_EXPORTS = {
+    "profile": ".profiling",
+    "column_type_ident": ".profiling",
+    "column_missing_prop": ".profiling",
+    "row_missing_prop": ".profiling",
+    "column_dup_ind": ".profiling",
+    "row_dup_ind": ".profiling",
+    "num_stats": ".profiling",
+    "num_outlier_stats": ".profiling",
+    "cat_stats": ".profiling",
+    "top_k_stats": ".profiling",
+    "window_stats": ".profiling",
+    "ROW_FLAG_BITS": ".profiling",
+    "profile_parquet": ".parquet",
+    "ProfileState": ".state",
+    "update": ".state",
+    "profile_many": ".many",
+    "ProfileCache": ".cache",
+    "ProfileResult": ".result",
+    "ProfileMetrics": ".metrics",
+    "save_profile": ".store",
+    "load_profile": ".store",
+    "profile_metadata": ".store",
+    "diff_profiles": ".store",
+    "profile_batch": ".batch",
+    "AsyncProfiler": ".aio",
+    "profile_async": ".aio",
+    "column_type_ident_async": ".aio",
+    "column_missing_prop_async": ".aio",
+    "row_missing_prop_async": ".aio",
+    "column_dup_ind_async": ".aio",
+    "row_dup_ind_async": ".aio",
+    "num_stats_async": ".aio",
+    "num_outlier_stats_async": ".aio",
+    "cat_stats_async": ".aio",
+    "top_k_stats_async": ".aio",
+    "window_stats_async": ".aio",
+}
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value # Cache, so later accesses skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__() -> list:
+    return sorted(list(globals()) + list(_EXPORTS))
 
 __version__ = "0.1.0" # Initial version
 
@@ -28,5 +69,32 @@ __all__ = [
     "num_stats",
     "num_outlier_stats",
     "cat_stats",
+    "top_k_stats",
+    "window_stats",
+    "ROW_FLAG_BITS",
+    "profile_parquet",
+    "ProfileState",
+    "update",
+    "profile_many",
+    "ProfileCache",
+    "ProfileResult",
+    "ProfileMetrics",
+    "save_profile",
+    "load_profile",
+    "profile_metadata",
+    "diff_profiles",
+    "profile_batch",
+    "AsyncProfiler",
+    "profile_async",
+    "column_type_ident_async",
+    "column_missing_prop_async",
+    "row_missing_prop_async",
+    "column_dup_ind_async",
+    "row_dup_ind_async",
+    "num_stats_async",
+    "num_outlier_stats_async",
+    "cat_stats_async",
+    "top_k_stats_async",
+    "window_stats_async",
     "__version__"
 ]
\ No newline at end of file
@@ -0,0 +1,132 @@
+# polarspulse/aio.py
+import asyncio
+import functools
+import threading
+from concurrent.futures import Executor
+from typing import Callable, Tuple # Added for type hints
+
+from . import profiling
+from .profiling import FrameLike
+
+# Raised in the worker thread to stop a cancelled profile at the next stage
+class _Cancelled(Exception):
+    pass
+
+# --- Helper Functions ---
+
+# Helper run in the worker thread: call fn unless cancelled meanwhile
+def _call(fn: Callable, cancel: threading.Event, args: tuple, kwargs: dict):
+    """
+    `profile()` also checks the cancel event after each stage, through its `on_stage` callback
+    (after forwarding the record to the caller's callback).
+    """
+    if cancel.is_set(): # Cancelled while queued in the executor
+        raise _Cancelled()
+    if fn is profiling.profile:
+        on_stage = kwargs.get("on_stage")
+
+        def check_cancel(record: dict) -> None:
+            if on_stage is not None:
+                on_stage(record)
+            if cancel.is_set():
+                raise _Cancelled()
+
+        kwargs = {**kwargs, "on_stage": check_cancel}
+    return fn(*args, **kwargs)
+
+# Helper to release the concurrency slot when the worker has stopped, and consume its exception
+def _worker_done(semaphore: asyncio.Semaphore, future: asyncio.Future) -> None:
+    if semaphore is not None:
+        semaphore.release()
+    if not future.cancelled():
+        future.exception() # Retrieved, so an abandoned run does not log "exception was never retrieved"
+
+# --- Main Class ---
+class AsyncProfiler:
+    """
+    Runs `profile()` and the section functions off the asyncio event loop, in an executor,
+    with at most `max_concurrency` runs at a time.
+
+    Polars releases the GIL while it computes, so a thread pool runs profiles in parallel
+    while the event loop keeps serving requests. Calls beyond the limit wait (without blocking
+    the loop) for a running profile to finish.
+
+    Cancelling the awaiting task (e.g. when a client disconnects) cancels a call that is still
+    waiting for a slot or for an executor thread. A running `profile()` stops at the end of its
+    current stage, and its slot is freed only then, so abandoned profiles stop consuming CPU and
+    never push the number of running profiles over the limit. Section functions run to completion
+    once started.
+
+    :param max_concurrency: Max number of concurrent runs (None: no limit beyond the executor).
+    :param executor: Executor of the runs (default: the event loop's default thread pool).
+    :raises ValueError: If max_concurrency is invalid.
+    """
+
+    def __init__(self, max_concurrency: int = None, executor: Executor = None):
+        if max_concurrency is not None and (not isinstance(max_concurrency, int) or max_concurrency <= 0):
+            raise ValueError("max_concurrency must be a positive integer, or None.")
+        self.max_concurrency = max_concurrency
+        self.executor = executor
+        self._semaphore = None # Created in the event loop on first use
+
+    def __repr__(self) -> str:
+        return f"AsyncProfiler(max_concurrency={self.max_concurrency}, executor={self.executor!r})"
+
+    async def run(self, fn: Callable, *args, **kwargs):
+        """
+        Runs `fn(*args, **kwargs)` in the executor within the concurrency limit and returns its result.
+        """
+        if self.max_concurrency is not None and self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        semaphore = self._semaphore
+        if semaphore is not None:
+            await semaphore.acquire()
+
+        cancel = threading.Event()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self.executor, _call, fn, cancel, args, kwargs)
+        except BaseException:
+            if semaphore is not None:
+                semaphore.release()
+            raise
+        future.add_done_callback(functools.partial(_worker_done, semaphore))
+
+        try:
+            return await asyncio.shield(future) # The worker keeps its slot until it has stopped
+        except asyncio.CancelledError:
+            cancel.set()
+            raise
+
+    async def profile(self, df: FrameLike, **profile_params) -> Tuple:
+        """
+        Async `profile()`: returns the same frames. See `profile()` for the parameters.
+        """
+        return await self.run(profiling.profile, df, **profile_params)
+
+# Default profiler of the module-level async functions: default executor, no concurrency limit
+_default_profiler = AsyncProfiler()
+
+# Helper to build the async variant of a profiling function
+def _async_variant(fn: Callable) -> Callable:
+    async def variant(*args, profiler: AsyncProfiler = None, **kwargs):
+        return await (profiler or _default_profiler).run(fn, *args, **kwargs)
+
+    variant.__name__ = variant.__qualname__ = fn.__name__ + "_async"
+    variant.__module__ = __name__
+    variant.__doc__ = (
+        f"Async `{fn.__name__}()`, run by `profiler` (an `AsyncProfiler`; default: the event loop's "
+        f"default executor, no concurrency limit). Takes the parameters of `{fn.__name__}()`.\n"
+    )
+    return variant
+
+profile_async = _async_variant(profiling.profile)
+column_type_ident_async = _async_variant(profiling.column_type_ident)
+column_missing_prop_async = _async_variant(profiling.column_missing_prop)
+row_missing_prop_async = _async_variant(profiling.row_missing_prop)
+column_dup_ind_async = _async_variant(profiling.column_dup_ind)
+row_dup_ind_async = _async_variant(profiling.row_dup_ind)
+num_stats_async = _async_variant(profiling.num_stats)
+num_outlier_stats_async = _async_variant(profiling.num_outlier_stats)
+cat_stats_async = _async_variant(profiling.cat_stats)
+top_k_stats_async = _async_variant(profiling.top_k_stats)
+window_stats_async = _async_variant(profiling.window_stats)
@@ -0,0 +1,137 @@
+# polarspulse/batch.py
+import polars as pl
+from typing import Dict, Sequence, Tuple, Union # Added for type hints
+
+from .profiling import FrameLike, _profile_by, column_type_ident
+
+# profile() parameters supported by profile_batch, with their profile() defaults
+_BATCH_DEFAULTS = {
+    "unique_n_threshold": 10, "unique_prop_threshold": None, "unique_count": "early_exit",
+    "get_miss_stats": True, "get_dup_stats": True, "get_num_stats": True,
+    "get_outlier_stats": True, "get_cat_stats": True,
+    "skew_threshold": 3.0, "kurtosis_threshold": 3.0, "sparsity_threshold": 0.5, "cv_threshold": 1.0,
+    "IQR_multi": 5.0,
+    "exclude_null_level": True, "rare_level_n_threshold": 5, "rare_level_prop_threshold": None,
+    "row_output": "full",
+}
+
+# --- Helper Functions ---
+
+# Helper to stack the frames with their dataset id as the first column
+def _stack_frames(frames: Union[Sequence[FrameLike], Dict[str, FrameLike]], id_column: str) -> pl.DataFrame:
+    """
+    :raises ValueError: If there are no frames, a frame is empty, or the schemas differ.
+    """
+    if isinstance(frames, dict):
+        ids = pl.Series(id_column, [str(k) for k in frames], dtype=pl.String)
+        frames = list(frames.values())
+    else:
+        frames = list(frames)
+        ids = pl.Series(id_column, range(len(frames)), dtype=pl.UInt32)
+    if len(frames) == 0:
+        raise ValueError("frames must contain at least one DataFrame.")
+
+    frames = [f.collect() if isinstance(f, pl.LazyFrame) else f for f in frames]
+    schema = frames[0].schema
+    if id_column in schema:
+        raise ValueError(f"id_column '{id_column}' is a column of the frames; choose another name.")
+    for i, f in enumerate(frames):
+        if not isinstance(f, pl.DataFrame):
+            raise ValueError("frames must be Polars DataFrames or LazyFrames.")
+        if f.schema != schema:
+            raise ValueError(f"Frame {ids[i]} has a different schema than the first frame; frames must share one schema.")
+        if f.height == 0:
+            raise ValueError(f"Frame {ids[i]} is empty.")
+
+    heights = pl.Series([f.height for f in frames], dtype=pl.UInt32)
+    dataset_ids = ids.to_frame().select(pl.col(id_column).repeat_by(heights)).explode(id_column)[id_column]
+    return pl.concat(frames, how="vertical").insert_column(0, dataset_ids)
+
+# Helper to report the row profile per dataset: dataset id and row_index within the dataset
+def _batch_rows(row_profile: pl.DataFrame, dataset_ids: pl.Series, row_output: str) -> pl.DataFrame:
+    if row_output == "bitmask": # Flags in input order: the dataset of each row is enough to locate it
+        return row_profile.insert_column(0, dataset_ids)
+    local_index = dataset_ids.to_frame().select(pl.int_range(1, pl.len() + 1, dtype=pl.UInt32).over(dataset_ids.name))[:, 0]
+    return row_profile.with_columns(
+        pl.col("row_index").map_batches(lambda s: dataset_ids.gather(s - 1), return_dtype=dataset_ids.dtype).alias(dataset_ids.name),
+        *(pl.col(c).map_batches(lambda s: local_index.gather(s - 1), return_dtype=pl.UInt32)
+          for c in ["row_index", "dup_first_row_index"] if c in row_profile.columns),
+    ).select(dataset_ids.name, pl.exclude(dataset_ids.name))
+
+# --- Main Function ---
+def profile_batch(frames: Union[Sequence[FrameLike], Dict[str, FrameLike]],
+                  id_column: str = "dataset",
+                  **profile_params) -> Tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """
+    Profiles many small frames sharing one schema in a single vectorized run, instead of one
+    `profile()` call per frame.
+
+    The frames are stacked with a dataset id column, classified once (so every dataset gets the
+    same column classes, from all rows), and the missing, duplicate, numeric, outlier and
+    categorical statistics of every dataset are computed in one grouped query, as
+    `profile(..., by=id_column)`. Given that shared classification, the statistics match `profile()`
+    on each frame: outlier bounds, rare levels and duplicate rows/columns are found within each
+    dataset. A column classified differently on a frame alone (e.g. "cat" in a frame with few
+    distinct values, but "num" over all frames) gets the statistics of its shared class.
+
+    The outputs differ from `profile()`'s in their columns:
+    - data_profile has one wide row per dataset (`profile()` returns a long column/value frame),
+      with `number_of_rows`, `number_of_cols`, the classified column counts and the summary
+      indicators as columns.
+    - col_profile has `group_n` (rows of the dataset) and no `col_dtype`, `approx_n_unique`,
+      `approx_prop_unique`, `cat_n_threshold_used` or `cat_prop_threshold_used`, since the
+      classification is shared by all datasets.
+    - Every output starts with the `id_column`.
+
+    :param frames: A list of DataFrames (ids 0, 1, ...) or a dict of DataFrames by id (LazyFrames
+        are collected first).
+    :param id_column: Name of the dataset id column of the outputs.
+    :param profile_params: Thresholds, section toggles and `row_output` of `profile()`.
+    :return: A tuple containing three DataFrames:
+        1. data_profile: Overall summary statistics, one row per dataset.
+        2. col_profile: Detailed statistics, one row per dataset and column.
+        3. row_profile: Statistics for each row, with its dataset id and row_index within the dataset.
+    :rtype: Tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]
+    :raises ValueError: If the frames are empty or differ in schema, or a parameter is invalid.
+    """
+    unknown = [p for p in profile_params if p not in _BATCH_DEFAULTS]
+    if unknown:
+        raise ValueError(f"Unsupported profile_batch parameters: {unknown}. Supported: {list(_BATCH_DEFAULTS)}.")
+    params = {**_BATCH_DEFAULTS, **profile_params}
+    if params["row_output"] not in ("full", "flagged", "bitmask"):
+        raise ValueError("row_output must be 'full', 'flagged' or 'bitmask'.")
+
+    stacked = _stack_frames(frames, id_column)
+
+    df_col_types = column_type_ident(
+        stacked.drop(id_column),
+        unique_n_threshold=params["unique_n_threshold"],
+        unique_prop_threshold=params["unique_prop_threshold"],
+        unique_count=params["unique_count"]
+    )
+    data_profile, col_profile, row_profile = _profile_by(
+        stacked, [id_column], df_col_types,
+        get_miss_stats=params["get_miss_stats"], get_dup_stats=params["get_dup_stats"],
+        get_num_stats=params["get_num_stats"], get_outlier_stats=params["get_outlier_stats"],
+        get_cat_stats=params["get_cat_stats"],
+        num_stats_params={p: params[p] for p in ("skew_threshold", "kurtosis_threshold", "sparsity_threshold", "cv_threshold")},
+        IQR_multi=params["IQR_multi"],
+        exclude_null_level=params["exclude_null_level"],
+        rare_level_n_threshold=params["rare_level_n_threshold"],
+        rare_level_prop_threshold=params["rare_level_prop_threshold"],
+        row_output=params["row_output"],
+        key_cols_in_rows=False
+    )
+
+    # Same data summary fields as profile()
+    col_classes = df_col_types["col_class"]
+    data_info = {
+        "number_of_cols": stacked.width - 1,
+        "number_of_classified_num_cols": (col_classes == "num").sum(),
+        "number_of_classified_cat_cols": (col_classes == "cat").sum(),
+    }
+    data_profile = data_profile.with_columns(pl.lit(v, dtype=pl.Int64).alias(k) for k, v in data_info.items()).select(
+        id_column, "number_of_rows", *data_info, pl.exclude(id_column, "number_of_rows", *data_info)
+    )
+
+    return data_profile, col_profile, _batch_rows(row_profile, stacked[id_column], params["row_output"])
@@ -0,0 +1,238 @@
+# polarspulse/cache.py
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+import polars as pl
+from typing import Tuple, Union # Added for type hints
+
+from .profiling import FrameLike, _engine, profile
+from .many import FileSource, _SCANNERS, _data_files
+
+# Files of a cache entry, in the order of the profile() output (window_profile only with time_column)
+_ENTRY_FILES = ("data_profile.arrow", "col_profile.arrow", "row_profile.arrow", "window_profile.arrow")
+
+# --- Helper Functions ---
+
+# Helper to fingerprint the content of a DataFrame or LazyFrame
+def _frame_fingerprint(df: FrameLike) -> dict:
+    """
+    Schema, height and two order-sensitive 64-bit hashes of the rows (each row is hashed
+    with its position, and the hashes are summed with wrap-around). LazyFrames are hashed
+    in one pass on the streaming engine.
+    """
+    row_col = "__polarspulse_row_index"
+    hashes = (
+        df.lazy()
+        .with_row_index(row_col)
+        .select(
+            n=pl.len(),
+            hash_0=pl.struct(pl.all()).hash(seed=0).sum(),
+            hash_1=pl.struct(pl.all()).hash(seed=1).sum(),
+        )
+        .collect(engine="streaming" if isinstance(df, pl.LazyFrame) else "in-memory")
+        .row(0, named=True)
+    )
+    schema = df.lazy().collect_schema()
+    return {"schema": [[c, str(dtype)] for c, dtype in schema.items()], **hashes}
+
+# Helper to fingerprint files from their metadata, without reading them
+def _file_fingerprint(files: list) -> dict:
+    """
+    Absolute path, modification time (ns) and size of each file.
+    """
+    entries = []
+    for f in files:
+        stat = os.stat(f)
+        entries.append([os.path.abspath(f), stat.st_mtime_ns, stat.st_size])
+    return {"files": entries}
+
+# Helper to lazily scan one or many data files
+def _scan_files(files: list) -> pl.LazyFrame:
+    """
+    :raises ValueError: If a file extension is not supported.
+    """
+    scans = []
+    for f in files:
+        ext = os.path.splitext(f)[1].lower()
+        if ext not in _SCANNERS:
+            raise ValueError(f"Unsupported file extension '{ext}'.")
+        scans.append(_SCANNERS[ext](f))
+    return scans[0] if len(scans) == 1 else pl.concat(scans)
+
+# Helper to get every profile() parameter, with defaults filled in
+def _profile_params(profile_params: dict) -> dict:
+    """
+    Omitted and explicitly passed default values give the same key.
+
+    :raises ValueError: If a parameter is not a profile() parameter.
+    """
+    signature = inspect.signature(profile)
+    unknown = [p for p in profile_params if p not in signature.parameters or p == "df"]
+    if unknown:
+        raise ValueError(f"Unknown profile() parameters: {unknown}.")
+    bound = signature.bind_partial(**profile_params)
+    bound.apply_defaults()
+    return {p: v for p, v in bound.arguments.items() if p not in ("df", "on_stage")} # Instrumentation does not change the result
+
+# --- Main Class ---
+class ProfileCache:
+    """
+    On-disk cache of `profile()` results.
+
+    Entries are keyed by a fingerprint of the data plus all `profile()` parameters (and the
+    Polars version, as row hashes are only stable within a version). In-memory DataFrames and
+    LazyFrames are fingerprinted by their schema, height and a hash of their rows, which costs
+    one pass over the data. File paths are fingerprinted by their path, modification time and
+    size only, so a hit does not read the data.
+
+    Each entry stores the three profile frames as Arrow IPC files, read back memory-mapped on
+    a hit. When the cache grows over `max_entries` or `max_size_mb`, the least recently used
+    entries are evicted. `hits`, `misses` and `evictions` count the cache activity of this
+    instance.
+
+    :param directory: Directory of the cache, created if needed. Several processes can share it.
+    :param max_entries: Max number of entries kept (None: no limit).
+    :param max_size_mb: Max total size of the entries in MB (None: no limit).
+    :raises ValueError: If max_entries or max_size_mb is invalid.
+    """
+
+    def __init__(self,
+                 directory: Union[str, os.PathLike],
+                 max_entries: int = 100,
+                 max_size_mb: float = 1024.0):
+        if max_entries is not None and (not isinstance(max_entries, int) or max_entries <= 0):
+            raise ValueError("max_entries must be a positive integer, or None.")
+        if max_size_mb is not None and (not isinstance(max_size_mb, (int, float)) or max_size_mb <= 0):
+            raise ValueError("max_size_mb must be a positive number, or None.")
+
+        self.directory = os.fspath(directory)
+        self.max_entries = max_entries
+        self.max_size_mb = max_size_mb
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"ProfileCache(directory={self.directory!r}, hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+
+    # Key of a source and parameters
+    def key(self, source: Union[FrameLike, FileSource], **profile_params) -> str:
+        """
+        Returns the cache key of profiling `source` with `profile_params`. The key includes the
+        engine of the source, so a DataFrame and a LazyFrame of the same data get different keys.
+
+        :raises TypeError: If source is not a DataFrame, LazyFrame or file path(s).
+        """
+        if isinstance(source, (pl.DataFrame, pl.LazyFrame)):
+            fingerprint = _frame_fingerprint(source)
+            engine = _engine(source)
+        elif isinstance(source, (str, os.PathLike, list, tuple)):
+            fingerprint = _file_fingerprint(_data_files(source))
+            engine = "streaming" # Files are scanned lazily
+        else:
+            raise TypeError("source must be a Polars DataFrame, LazyFrame, or file path(s).")
+
+        key_info = {
+            "fingerprint": fingerprint,
+            "engine": engine, # Results differ between engines (memory_size_kb, approx_n_unique)
+            "params": _profile_params(profile_params),
+            "polars_version": pl.__version__,
+        }
+        return hashlib.sha256(json.dumps(key_info, sort_keys=True, default=str).encode()).hexdigest()
+
+    # Cached profile()
+    def profile(self, source: Union[FrameLike, FileSource], **profile_params) -> Tuple[pl.DataFrame, ...]:
+        """
+        Returns the `profile()` result of `source` from the cache, computing and storing it on a miss.
+
+        :param source: A DataFrame, a LazyFrame, or a file / directory / glob pattern / list of
+            data files (Parquet, CSV, IPC, NDJSON), which are scanned lazily on a miss.
+        :param profile_params: Parameters passed to `profile()`.
+        :return: The (data_profile, col_profile, row_profile[, window_profile]) tuple of `profile()`.
+        :rtype: Tuple[pl.DataFrame, ...]
+        :raises ValueError: If a parameter is not a profile() parameter.
+        """
+        key = self.key(source, **profile_params)
+        entry_dir = os.path.join(self.directory, key)
+
+        if os.path.isdir(entry_dir):
+            try:
+                result = tuple(pl.read_ipc(os.path.join(entry_dir, f)) for f in _ENTRY_FILES
+                               if f in _ENTRY_FILES[:3] or os.path.exists(os.path.join(entry_dir, f)))
+                os.utime(entry_dir) # Mark as recently used
+                self.hits += 1
+                return result
+            except OSError: # Entry evicted by another process meanwhile
+                pass
+
+        self.misses += 1
+        df = source if isinstance(source, (pl.DataFrame, pl.LazyFrame)) else _scan_files(_data_files(source))
+        result = profile(df, **profile_params)
+        self._store(entry_dir, result)
+        self._evict(keep=entry_dir)
+        return result
+
+    # Write an entry atomically: in a temporary directory renamed into place
+    def _store(self, entry_dir: str, result: tuple) -> None:
+        tmp_dir = tempfile.mkdtemp(dir=self.directory, prefix=".tmp-")
+        try:
+            for frame, f in zip(result, _ENTRY_FILES):
+                frame.write_ipc(os.path.join(tmp_dir, f))
+            os.replace(tmp_dir, entry_dir)
+        except OSError: # Already stored by another process
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    # Entries as (directory, last used time, size in bytes), least recently used first
+    def _entries(self) -> list:
+        entries = []
+        for name in os.listdir(self.directory):
+            entry_dir = os.path.join(self.directory, name)
+            if name.startswith(".") or not os.path.isdir(entry_dir):
+                continue
+            try:
+                size = sum(os.path.getsize(os.path.join(entry_dir, f)) for f in os.listdir(entry_dir))
+                entries.append((entry_dir, os.path.getmtime(entry_dir), size))
+            except OSError: # Removed meanwhile
+                continue
+        return sorted(entries, key=lambda e: e[1])
+
+    # Evict least recently used entries over the limits
+    def _evict(self, keep: str = None) -> None:
+        entries = self._entries()
+        total_size = sum(e[2] for e in entries)
+        max_size = self.max_size_mb * 1024 ** 2 if self.max_size_mb is not None else None
+        for entry_dir, _, size in entries:
+            over_entries = self.max_entries is not None and len(entries) > self.max_entries
+            over_size = max_size is not None and total_size > max_size
+            if not (over_entries or over_size):
+                break
+            if entry_dir == keep: # Never evict the entry just stored
+                continue
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            entries = [e for e in entries if e[0] != entry_dir]
+            total_size -= size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """
+        Returns the hits, misses and evictions of this instance and the entries and size (MB) of the cache.
+        """
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "size_mb": sum(e[2] for e in entries) / 1024 ** 2,
+        }
+
+    def clear(self) -> None:
+        """
+        Removes all entries of the cache.
+        """
+        for entry_dir, _, _ in self._entries():
+            shutil.rmtree(entry_dir, ignore_errors=True)
@@ -0,0 +1,189 @@
+# polarspulse/cli.py
+import argparse
+import os
+import sys
+import time
+
+# Polars and the profiling modules are imported in the commands only, so `--help` and
+# argument errors return without loading them.
+
+# Section names of --sections and their profile() toggles
+_SECTIONS = {
+    "miss": "get_miss_stats",
+    "dup": "get_dup_stats",
+    "num": "get_num_stats",
+    "outlier": "get_outlier_stats",
+    "cat": "get_cat_stats",
+}
+
+# Output formats, from the extension of --out (formats keeping the nested level columns)
+_OUT_FORMATS = {".parquet": "parquet", ".json": "json", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+# Names of the written profile frames, in the order of the profile() output
+_FRAME_SUFFIXES = ("data", "col", "row", "window")
+
+# --- Helper Functions ---
+
+# Helper to parse the comma-separated --sections value
+def _sections(value: str) -> list:
+    sections = [s.strip() for s in value.split(",") if s.strip()]
+    unknown = [s for s in sections if s not in _SECTIONS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown sections {unknown}; choose from {','.join(_SECTIONS)}")
+    return sections
+
+# Helper to parse --sample: a fraction (float) or a number of rows (int)
+def _sample(value: str):
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+# Helper to get the files written for --out: one per profile frame, e.g. profile.col.parquet
+def _out_files(out: str, n_frames: int) -> list:
+    stem, ext = os.path.splitext(out)
+    return [f"{stem}.{suffix}{ext}" for suffix in _FRAME_SUFFIXES[:n_frames]]
+
+# Helper to write a profile frame in the format of its extension
+def _write_frame(frame, path: str) -> None:
+    out_format = _OUT_FORMATS[os.path.splitext(path)[1].lower()]
+    if out_format == "parquet":
+        frame.write_parquet(path)
+    elif out_format == "json":
+        frame.write_json(path)
+    else:
+        frame.write_ndjson(path)
+
+# Helper to get the peak resident memory of the process in MB, or None where not available
+def _peak_memory_mb() -> float:
+    from .metrics import _max_rss_bytes
+    max_rss = _max_rss_bytes()
+    return None if max_rss is None else max_rss / 1024 ** 2
+
+# --- Commands ---
+
+def _profile_command(args: argparse.Namespace) -> int:
+    start = time.perf_counter()
+    import polars as pl
+    from .cache import _scan_files
+    from .many import _data_files
+    from .profiling import profile
+
+    files = _data_files(args.inputs)
+    df = _scan_files(files) # Lazy: profiled on the streaming engine
+
+    toggles = {toggle: section in args.sections for section, toggle in _SECTIONS.items()}
+    result = profile(
+        df,
+        unique_n_threshold=args.unique_n_threshold,
+        unique_prop_threshold=args.unique_prop_threshold,
+        unique_count=args.unique_count,
+        **toggles,
+        skew_threshold=args.skew_threshold,
+        kurtosis_threshold=args.kurtosis_threshold,
+        sparsity_threshold=args.sparsity_threshold,
+        cv_threshold=args.cv_threshold,
+        IQR_multi=args.iqr_multi,
+        exclude_null_level=not args.include_null_level,
+        rare_level_n_threshold=args.rare_level_n_threshold,
+        rare_level_prop_threshold=args.rare_level_prop_threshold,
+        top_k=args.top_k,
+        time_column=args.time_column,
+        every=args.every,
+        by=args.by,
+        sample=args.sample,
+        sample_seed=args.sample_seed,
+        column_batch_size=args.column_batch_size,
+        column_batch_workers=args.column_batch_workers,
+        row_output=args.row_output,
+    )
+
+    if args.out is None:
+        with pl.Config(tbl_rows=-1, tbl_cols=-1):
+            for frame in result[:2]:
+                print(frame)
+    else:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        for i, (frame, path) in enumerate(zip(result, _out_files(args.out, len(result)))):
+            if i == 2 and args.no_rows:
+                continue
+            _write_frame(frame, path)
+            print(f"Wrote {path}", file=sys.stderr)
+
+    peak_mb = _peak_memory_mb()
+    print(f"Profiled {len(files)} file(s) in {time.perf_counter() - start:.2f} s"
+          + ("" if peak_mb is None else f", peak memory {peak_mb:.1f} MB"), file=sys.stderr)
+    return 0
+
+# --- Main Function ---
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="polarspulse", description="Fast data profiling for Polars.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    p = subparsers.add_parser(
+        "profile", help="Profile data files.",
+        description="Profile Parquet/CSV/IPC/NDJSON files, scanned lazily on the streaming engine. "
+                    "Several inputs are profiled as one dataset with a shared schema."
+    )
+    p.add_argument("inputs", nargs="+", help="Files, directories or glob patterns.")
+    p.add_argument("--out", "-o", help="Output path, e.g. profile.parquet: writes profile.data.parquet, profile.col.parquet "
+                                       "and profile.row.parquet (and profile.window.parquet with --time-column). "
+                                       f"Formats: {', '.join(_OUT_FORMATS)}. Without --out, the data and column "
+                                       "profiles are printed.")
+    p.add_argument("--no-rows", action="store_true", help="Do not write the row profile.")
+    p.add_argument("--sections", type=_sections, default=list(_SECTIONS),
+                   help=f"Comma-separated sections to compute (default: all): {','.join(_SECTIONS)}.")
+
+    g = p.add_argument_group("column classification")
+    g.add_argument("--unique-n-threshold", type=int, default=10, help="Max unique values for categorical columns.")
+    g.add_argument("--unique-prop-threshold", type=float, help="Max proportion of unique values for categorical columns.")
+    g.add_argument("--unique-count", choices=["early_exit", "approx", "exact"], default="early_exit")
+
+    g = p.add_argument_group("numeric and outlier stats")
+    g.add_argument("--skew-threshold", type=float, default=3.0)
+    g.add_argument("--kurtosis-threshold", type=float, default=3.0)
+    g.add_argument("--sparsity-threshold", type=float, default=0.5)
+    g.add_argument("--cv-threshold", type=float, default=1.0)
+    g.add_argument("--iqr-multi", type=float, default=5.0, help="IQR multiplier of the outlier bounds.")
+
+    g = p.add_argument_group("categorical stats")
+    g.add_argument("--include-null-level", action="store_true", help="Count Nulls as a level.")
+    g.add_argument("--rare-level-n-threshold", type=int, default=5)
+    g.add_argument("--rare-level-prop-threshold", type=float)
+    g.add_argument("--top-k", type=int, help="Most frequent values of the high-cardinality columns.")
+
+    g = p.add_argument_group("windows, groups and sampling")
+    g.add_argument("--time-column", help="Also profile per time window of this column (with --every).")
+    g.add_argument("--every", help="Interval of the time windows, e.g. 1d.")
+    g.add_argument("--by", nargs="+", help="Profile per group of these columns.")
+    g.add_argument("--sample", type=_sample, help="Fraction (float) or number (int) of sampled rows.")
+    g.add_argument("--sample-seed", type=int, default=0)
+
+    g = p.add_argument_group("wide frames and row output")
+    g.add_argument("--column-batch-size", type=int)
+    g.add_argument("--column-batch-workers", type=int)
+    g.add_argument("--row-output", choices=["full", "flagged", "bitmask"], default="full")
+    p.set_defaults(func=_profile_command)
+
+    return parser
+
+def main(argv: list = None) -> int:
+    """
+    Entry point of the `polarspulse` command. Reports the wall time and peak memory on stderr.
+    """
+    args = _parser().parse_args(argv)
+    if args.out is not None and os.path.splitext(args.out)[1].lower() not in _OUT_FORMATS:
+        print(f"polarspulse: error: --out must end with one of {', '.join(_OUT_FORMATS)}", file=sys.stderr)
+        return 2
+    try:
+        return args.func(args)
+    except Exception as e:
+        from polars.exceptions import PolarsError # Imported here, so `--help` does not load Polars
+        if not isinstance(e, (ValueError, OSError, PolarsError)): # Invalid files, data or parameters
+            raise
+        print(f"polarspulse: error: {e}", file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+# polarspulse/many.py
+import glob
+import multiprocessing
+import os
+import time
+import polars as pl
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Sequence, Tuple, Union # Added for type hints
+
+from .state import ProfileState
+
+# File inputs: a file, a directory, a glob pattern, or a list of them
+FileSource = Union[str, os.PathLike, Sequence[Union[str, os.PathLike]]]
+
+# Lazy scan function for each supported file extension
+_SCANNERS = {
+    ".parquet": pl.scan_parquet,
+    ".csv": pl.scan_csv,
+    ".ipc": pl.scan_ipc,
+    ".arrow": pl.scan_ipc,
+    ".feather": pl.scan_ipc,
+    ".ndjson": pl.scan_ndjson,
+    ".jsonl": pl.scan_ndjson,
+}
+
+# --- Helper Functions ---
+
+# Helper to expand the source into a list of data files
+def _data_files(source: FileSource) -> List[str]:
+    """
+    Expands a path, directory (searched recursively for supported extensions), glob pattern,
+    or a list of them into a list of files.
+    """
+    sources = [source] if isinstance(source, (str, os.PathLike)) else list(source)
+
+    files = []
+    for src in sources:
+        src = os.fspath(src)
+        if os.path.isdir(src):
+            files.extend(sorted(
+                f for f in glob.glob(os.path.join(src, "**", "*"), recursive=True)
+                if os.path.splitext(f)[1].lower() in _SCANNERS
+            ))
+        elif any(ch in src for ch in "*?["): # Glob pattern
+            files.extend(sorted(glob.glob(src, recursive=True)))
+        else:
+            files.append(src)
+
+    if len(files) == 0:
+        raise ValueError("No files found for the given paths.")
+
+    return files
+
+# Helper run in the worker processes: summarize one file into a ProfileState
+def _profile_file(path: str, sketch_size: int, max_levels: int, keep_rows: bool) -> tuple:
+    """
+    Returns (path, state, error, seconds). Errors are returned rather than raised so
+    a bad file is reported without aborting the other files.
+    """
+    start = time.perf_counter()
+    try:
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in _SCANNERS:
+            raise ValueError(f"Unsupported file extension '{ext}'.")
+        state = ProfileState.from_frame(_SCANNERS[ext](path), sketch_size=sketch_size, max_levels=max_levels, keep_rows=keep_rows)
+        return path, state, None, time.perf_counter() - start
+    except Exception as e: # Report any failure for this file only
+        return path, None, f"{type(e).__name__}: {e}", time.perf_counter() - start
+
+# --- Main Function ---
+def profile_many(paths: FileSource,
+                 workers: int = None,
+                 return_per_file: bool = False,
+                 verbose: bool = True,
+
+                 # Sketch parameters of the per-file states
+                 sketch_size: int = 2048,
+                 max_levels: int = 1000,
+                 keep_rows: bool = True,
+
+                 # profile() parameters (thresholds and section toggles)
+                 **profile_params
+                 ) -> Tuple[pl.DataFrame, ...]:
+    """
+    Profiles many Parquet/CSV/IPC/NDJSON files in parallel and combines them into one
+    dataset-wide profile.
+
+    Each file is summarized independently into a `ProfileState` in a process pool, and
+    the states are merged in file order (row_index follows the file order). The dataset
+    profile has the same accuracy as `ProfileState.finalize`: percentiles come from quantile
+    sketches and duplicates are matched on hashes.
+
+    Files that cannot be read or profiled, or whose schema differs from the most common
+    schema of the files, are reported in the file summary and skipped.
+
+    Each worker runs its own Polars thread pool; set the `POLARS_MAX_THREADS` environment
+    variable (before importing Polars) to about `cpu_count / workers` to avoid oversubscription.
+
+    :param paths: A file, directory (searched recursively), glob pattern, or a list of them.
+    :param workers: Number of worker processes (default: number of CPUs). With 1, files are
+        profiled one after another in the current process.
+    :param return_per_file: Whether to also return the profile of each file.
+    :param verbose: Whether to print progress and failures per file.
+    :param sketch_size: Number of points kept by the quantile sketch of each numeric column.
+    :param max_levels: Max number of levels counted per column for cat_stats.
+    :param keep_rows: Whether to keep the row-level sections (one row per input row).
+    :param profile_params: Thresholds and section toggles of `profile()`, passed to `ProfileState.finalize`.
+
+    :return: A tuple containing four DataFrames (and a dict with `return_per_file`):
+        1. data_profile: Overall summary statistics for the dataset.
+        2. col_profile: Detailed statistics for each column.
+        3. row_profile: Statistics for each row.
+        4. file_profile: One row per file with its status, error, number of rows and seconds.
+        5. per_file: Dict of file path to its (data_profile, col_profile, row_profile).
+    :rtype: Tuple[pl.DataFrame, ...]
+    :raises ValueError: If no files are found, workers is invalid, or no file could be profiled.
+    """
+    if workers is not None and (not isinstance(workers, int) or workers <= 0):
+        raise ValueError("workers must be a positive integer, or None.")
+
+    files = _data_files(paths)
+    workers = min(workers or os.cpu_count() or 1, len(files))
+
+    # Summarize files, reporting progress as they complete
+    results = {}
+    def _report(result):
+        path, state, error, seconds = result
+        results[path] = result
+        if verbose:
+            if error is None:
+                print(f"[{len(results)}/{len(files)}] {path}: {state.n_rows} rows in {seconds:.2f}s")
+            else:
+                print(f"Warning: [{len(results)}/{len(files)}] {path} failed: {error}")
+
+    if workers == 1:
+        for path in files:
+            _report(_profile_file(path, sketch_size, max_levels, keep_rows))
+    else:
+        # Spawned workers avoid forking a process with running Polars threads
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = [executor.submit(_profile_file, path, sketch_size, max_levels, keep_rows) for path in files]
+            for future in as_completed(futures):
+                _report(future.result())
+
+    # The dataset schema is the most common schema of the profiled files (first one on ties)
+    schema_counts = {}
+    for path in files:
+        if results[path][1] is not None:
+            key = tuple(results[path][1].schema.items())
+            schema_counts[key] = schema_counts.get(key, 0) + 1
+    schema = max(schema_counts, key=schema_counts.get) if schema_counts else None
+
+    # Merge states in file order
+    state = None
+    file_rows = []
+    for path in files:
+        _, file_state, error, seconds = results[path]
+        if file_state is not None and tuple(file_state.schema.items()) != schema:
+            error = "Schema differs from the schema of the other files."
+            if verbose:
+                print(f"Warning: {path} skipped: {error}")
+        elif file_state is not None:
+            state = file_state if state is None else state.merge(file_state)
+        file_rows.append({
+            "file": path,
+            "status": "ok" if error is None else "failed",
+            "error": error,
+            "number_of_rows": file_state.n_rows if file_state is not None else None,
+            "seconds": seconds,
+        })
+
+    if state is None:
+        raise ValueError("None of the files could be profiled.")
+
+    file_profile = pl.DataFrame(file_rows, schema={
+        "file": pl.String, "status": pl.String, "error": pl.String, "number_of_rows": pl.UInt64, "seconds": pl.Float64,
+    })
+    data_profile, col_profile, row_profile = state.finalize(**profile_params)
+
+    if not return_per_file:
+        return data_profile, col_profile, row_profile, file_profile
+
+    per_file = {
+        path: results[path][1].finalize(**profile_params)
+        for path in files if results[path][1] is not None
+    }
+    return data_profile, col_profile, row_profile, file_profile, per_file
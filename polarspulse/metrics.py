@@ -0,0 +1,128 @@
+# polarspulse/metrics.py
+import contextvars
+import sys
+import time
+import polars as pl
+from contextlib import contextmanager
+from typing import Callable, Union # Added for type hints
+
+try:
+    import resource # Unix only
+except ImportError:
+    resource = None
+
+# Schema of the stage records, in the order of the metrics frame
+_RECORD_SCHEMA = {
+    "stage": pl.String,
+    "wall_time_s": pl.Float64,
+    "rows": pl.Int64,
+    "cols": pl.Int64,
+    "input_bytes": pl.Int64,
+    "output_bytes": pl.Int64,
+    "max_rss_increase_bytes": pl.Int64,
+    "query_plan": pl.String,
+}
+
+# Plans of the queries collected by the running instrumented stage (None outside of one)
+_stage_plans = contextvars.ContextVar("polarspulse_stage_plans", default=None)
+
+# --- Helper Functions ---
+
+# Helper to record the optimized plan of a query collected by the running stage
+def _record_plan(lf: pl.LazyFrame, engine: str) -> None:
+    """
+    Does nothing outside of an instrumented stage, so uninstrumented runs do not pay for `explain`.
+    """
+    plans = _stage_plans.get()
+    if plans is not None:
+        start = time.perf_counter()
+        plans["plans"].append(lf.explain(engine=engine))
+        plans["explain_s"] += time.perf_counter() - start
+
+# Helper to get the peak resident memory of the process so far
+def _max_rss_bytes() -> int:
+    """
+    High-water mark of the process resident memory, or None where the `resource` module
+    is not available (Windows). Linux reports it in KB, macOS in bytes.
+    """
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+# Helper to time a profile stage and report it to the instrumentation callback
+@contextmanager
+def _stage(on_stage: Callable[[dict], None], name: str, df: Union[pl.DataFrame, pl.LazyFrame], rows: int, cols: list):
+    """
+    Yields a dict where the stage stores its output frames under "outputs", to size them.
+    Does nothing when `on_stage` is None.
+    """
+    if on_stage is None:
+        yield {}
+        return
+
+    stage = {"outputs": []}
+    plans = {"plans": [], "explain_s": 0.0}
+    token = _stage_plans.set(plans)
+    start_rss = _max_rss_bytes()
+    start = time.perf_counter()
+    try:
+        yield stage
+    finally:
+        _stage_plans.reset(token)
+    wall_time_s = time.perf_counter() - start - plans["explain_s"] # Without the time spent explaining plans
+    end_rss = _max_rss_bytes()
+
+    is_lazy = isinstance(df, pl.LazyFrame)
+    on_stage({
+        "stage": name,
+        "wall_time_s": wall_time_s,
+        "rows": rows,
+        "cols": len(cols),
+        "input_bytes": None if is_lazy else int(df.select(cols).estimated_size()),
+        "output_bytes": int(sum(frame.estimated_size() for frame in stage["outputs"] if frame is not None)),
+        "max_rss_increase_bytes": None if start_rss is None else end_rss - start_rss,
+        "query_plan": "\n\n".join(plans["plans"]) if len(plans["plans"]) > 0 else None,
+    })
+
+# --- Main Class ---
+class ProfileMetrics:
+    """
+    Collects the per-stage metrics of `profile()` runs, for `profile(..., on_stage=metrics)`.
+
+    Each stage of a run (column types, missing, duplicates, num, outlier, cat, top-k stats,
+    assembly, ...) adds a record with:
+    - `stage`: Name of the stage.
+    - `wall_time_s`: Wall time of the stage in seconds.
+    - `rows` / `cols`: Rows and columns processed by the stage.
+    - `input_bytes`: Estimated size of the processed columns (null for LazyFrames).
+    - `output_bytes`: Estimated size of the stage outputs.
+    - `max_rss_increase_bytes`: Increase of the process peak resident memory during the stage
+      (0 when the stage stays below an earlier peak; null where not available).
+    - `query_plan`: Optimized plans of the queries the stage collected, in order and separated
+      by blank lines (null when the stage ran no query, e.g. eager-only work).
+
+    Any callable taking the record dict can be passed as `on_stage` instead, e.g. to export the
+    metrics to a monitoring system as stages complete.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def __call__(self, record: dict) -> None:
+        self.records.append(record)
+
+    def __repr__(self) -> str:
+        return f"ProfileMetrics(records={len(self.records)})"
+
+    def to_frame(self) -> pl.DataFrame:
+        """
+        Returns the collected records as a DataFrame, one row per stage.
+        """
+        return pl.DataFrame(self.records, schema=_RECORD_SCHEMA)
+
+    def clear(self) -> None:
+        """
+        Removes the collected records.
+        """
+        self.records = []
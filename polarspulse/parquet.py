@@ -0,0 +1,310 @@
+# polarspulse/parquet.py
+import glob
+import os
+import polars as pl
+from typing import List, Sequence, Tuple, Union # Added for type hints
+
+from .profiling import (
+    column_type_ident,
+    column_missing_prop,
+    row_missing_prop,
+    column_dup_ind,
+    row_dup_ind,
+    num_stats,
+    num_outlier_stats,
+    cat_stats,
+    _assemble_profile
+)
+
+# Parquet inputs: a file, a directory, a glob pattern, or a list of them
+ParquetSource = Union[str, os.PathLike, Sequence[Union[str, os.PathLike]]]
+
+# --- Helper Functions ---
+
+# Helper to import pyarrow, which is only needed to read Parquet footers
+def _import_pyarrow_parquet():
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Reading Parquet footer statistics requires pyarrow: pip install polarspulse[parquet]") from e
+    return pq
+
+# Helper to expand the source into a list of Parquet files
+def _parquet_files(source: ParquetSource) -> List[str]:
+    """
+    Expands a path, directory (searched recursively for *.parquet), glob pattern,
+    or a list of them into a list of local Parquet files.
+    """
+    sources = [source] if isinstance(source, (str, os.PathLike)) else list(source)
+
+    files = []
+    for src in sources:
+        src = os.fspath(src)
+        if os.path.isdir(src):
+            files.extend(sorted(glob.glob(os.path.join(src, "**", "*.parquet"), recursive=True)))
+        elif any(ch in src for ch in "*?["): # Glob pattern
+            files.extend(sorted(glob.glob(src, recursive=True)))
+        else:
+            files.append(src)
+
+    if len(files) == 0:
+        raise ValueError("No Parquet files found for the given source.")
+
+    return files
+
+# Helper to read row counts, sizes and column statistics from Parquet footers
+def _parquet_footer_stats(files: List[str], schema: pl.Schema) -> Tuple[int, float, pl.DataFrame]:
+    """
+    Reads the footer metadata of every file without touching data pages.
+
+    Returns the total number of rows, the uncompressed data size in kb, and a DataFrame with
+    the null count and min/max of each column. A statistic is null when any row group does not
+    store it (e.g. nested columns, or float columns with NaN values), so callers can read only
+    those columns from the data. Min/max are only collected for numeric columns.
+    """
+    pq = _import_pyarrow_parquet()
+
+    num_cols = [c for c, dtype in schema.items() if dtype.is_numeric()]
+    n_rows = 0
+    size_bytes = 0
+    null_n = {c: 0 for c in schema.names()}
+    col_min = {c: None for c in num_cols}
+    col_max = {c: None for c in num_cols}
+
+    for f in files:
+        metadata = pq.ParquetFile(f).metadata
+        n_rows += metadata.num_rows
+
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            size_bytes += row_group.total_byte_size
+            seen = set()
+
+            for j in range(row_group.num_columns):
+                chunk = row_group.column(j)
+                c = chunk.path_in_schema # Equals the column name for non-nested columns
+                stats = chunk.statistics
+                if c not in null_n:
+                    continue
+                seen.add(c)
+
+                # Null counts
+                if null_n[c] is not None:
+                    null_n[c] = null_n[c] + stats.null_count if stats is not None and stats.has_null_count else None
+
+                # Min/max for numeric columns (all-null row groups store none and don't need any)
+                if c in col_min and col_min[c] is not False:
+                    if stats is not None and stats.has_min_max:
+                        col_min[c] = stats.min if col_min[c] is None else min(col_min[c], stats.min)
+                        col_max[c] = stats.max if col_max[c] is None else max(col_max[c], stats.max)
+                    elif not (stats is not None and stats.has_null_count and stats.null_count == row_group.num_rows):
+                        col_min[c] = col_max[c] = False # Mark as unavailable
+
+            # Columns without a chunk of their own in this row group (e.g. nested columns)
+            for c in null_n:
+                if c not in seen:
+                    null_n[c] = None
+                    if c in col_min:
+                        col_min[c] = col_max[c] = False
+
+    footer_stats = pl.DataFrame({
+        "column": schema.names(),
+        "missing_n": [null_n[c] for c in schema.names()],
+        "min": [col_min.get(c) if col_min.get(c) is not False else None for c in schema.names()],
+        "max": [col_max.get(c) if col_max.get(c) is not False else None for c in schema.names()],
+        # Track which min/max are missing from the footers, as null also means an all-null column
+        "min_max_ind": [c in col_min and col_min[c] is not False for c in schema.names()],
+    }, schema={"column": pl.String, "missing_n": pl.UInt32, "min": pl.Float64, "max": pl.Float64, "min_max_ind": pl.Boolean})
+
+    return n_rows, size_bytes / 1024, footer_stats
+
+# Function to compute missing data proportions from Parquet footers
+def _parquet_missing_prop(lf: pl.LazyFrame, footer_stats: pl.DataFrame, n_rows: int) -> pl.DataFrame:
+    """
+    Column missing counts from footer null counts; only columns without them are read.
+    """
+    col_miss = footer_stats.filter(pl.col("missing_n").is_not_null()).select(["column", "missing_n"])
+    read_cols = footer_stats.filter(pl.col("missing_n").is_null()).get_column("column").to_list()
+
+    if len(read_cols) > 0:
+        col_miss = pl.concat([col_miss, column_missing_prop(lf.select(read_cols)).select(["column", "missing_n"])])
+
+    return (
+        footer_stats.select("column") # Keep the original column order
+        .join(col_miss, on="column", how="left", maintain_order="left")
+        .with_columns(missing_prop=(pl.col("missing_n") / pl.lit(n_rows)).round(4)) # Increased precision
+    )
+
+# Function to compute numeric ranges from Parquet footers
+def _parquet_range_stats(lf: pl.LazyFrame, footer_stats: pl.DataFrame) -> pl.DataFrame:
+    """
+    Min/max/range of numeric columns from footer statistics; only columns without them are read.
+    Like Parquet statistics, Nulls and NaNs are ignored but infinite values are not.
+    """
+    schema = lf.collect_schema()
+    num_cols = [c for c, dtype in schema.items() if dtype.is_numeric()]
+    col_range = footer_stats.filter(pl.col("min_max_ind")).select(["column", "min", "max"])
+    read_cols = [c for c in num_cols if c not in col_range.get_column("column").to_list()]
+
+    if len(read_cols) > 0:
+        # Drop NaNs so the values match Parquet statistics
+        values = {c: pl.col(c).fill_nan(None) if schema[c].is_float() else pl.col(c) for c in read_cols}
+        read_range = (
+            lf.select(
+                pl.struct(value.min().cast(pl.Float64).alias("min"), value.max().cast(pl.Float64).alias("max")).alias(c)
+                for c, value in values.items()
+            )
+            .collect(engine="streaming")
+            .unpivot(variable_name="column")
+            .unnest("value")
+        )
+        col_range = pl.concat([col_range, read_range])
+
+    return (
+        pl.DataFrame({"column": num_cols}, schema={"column": pl.String})
+        .join(col_range, on="column", how="left", maintain_order="left")
+        .with_columns(range=pl.col("max") - pl.col("min"))
+    )
+
+# --- Main Parquet Profile Function ---
+def profile_parquet(source: ParquetSource,
+
+                    # Col Classification thresholds
+                    unique_n_threshold:int = 10,
+                    unique_prop_threshold:float = None,
+
+                    # Toggles for sections
+                    get_miss_stats:bool = True,
+                    get_range_stats:bool = True,
+                    get_row_stats:bool = True,
+                    get_dup_stats:bool = True,
+                    get_num_stats:bool = True,
+                    get_outlier_stats:bool = True,
+                    get_cat_stats:bool = True,
+
+                    # Num stats thresholds
+                    skew_threshold: float = 3.0,
+                    kurtosis_threshold: float = 3.0,
+                    sparsity_threshold: float = 0.5,
+                    cv_threshold: float = 1.0,
+
+                    # Outlier stats threshold multiplier
+                    IQR_multi:float = 5.0,
+
+                    # Cat stats thresholds/options
+                    exclude_null_level: bool = True,
+                    rare_level_n_threshold: int = 5,
+                    rare_level_prop_threshold: float = None
+
+                    ) -> Tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """
+    Generates a data profile for Parquet files, using footer metadata wherever possible.
+
+    Row counts, column missing counts and numeric min/max/range are read from the row-group
+    statistics in the file footers, without decoding data pages. The remaining sections run
+    on `pl.scan_parquet`, so only the column chunks they need are read (projection pushdown).
+    Columns whose footers lack a statistic are read from the data instead.
+
+    A "missing + range" audit only reads footers:
+    `profile_parquet(path, get_row_stats=False, get_dup_stats=False, get_num_stats=False,
+    get_outlier_stats=False, get_cat_stats=False)`
+
+    :param source: A Parquet file, a directory, a glob pattern, or a list of them. All files must share a schema.
+    :param unique_n_threshold: Max unique values for 'categorical' classification.
+    :param unique_prop_threshold: Proportion unique values threshold for 'categorical'.
+    :param get_miss_stats: Whether to compute missing value statistics.
+    :param get_range_stats: Whether to add min/max/range of numeric columns from footer statistics.
+        Skipped when `get_num_stats` is True, as num_stats computes them from the data.
+    :param get_row_stats: Whether to compute row-level statistics (requires reading all columns).
+    :param get_dup_stats: Whether to compute duplicate statistics.
+    :param get_num_stats: Whether to compute numeric descriptive statistics.
+    :param get_outlier_stats: Whether to compute numeric outlier statistics.
+    :param get_cat_stats: Whether to compute categorical statistics.
+    :param skew_threshold: Absolute threshold to flag high skewness.
+    :param kurtosis_threshold: Absolute threshold to flag high kurtosis.
+    :param sparsity_threshold: Threshold (proportion of zeros) to flag high sparsity.
+    :param cv_threshold: Absolute threshold to flag high coefficient of variation.
+    :param IQR_multi: Multiplier for IQR range in outlier detection.
+    :param exclude_null_level: If True, Nulls are ignored in categorical analysis.
+    :param rare_level_n_threshold: Absolute count threshold for rare category levels.
+    :param rare_level_prop_threshold: Proportion threshold for rare category levels.
+
+    :return: A tuple containing three DataFrames, as returned by `profile`.
+        `memory_size_kb` is the uncompressed data size recorded in the footers.
+    :rtype: Tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]
+    :raises ValueError: If no files are found, the data is empty or thresholds are invalid.
+    :raises ImportError: If pyarrow is not installed.
+    """
+    files = _parquet_files(source)
+    lf = pl.scan_parquet(files)
+    schema = lf.collect_schema()
+
+    # --- 1. Footer Metadata ---
+    n_rows, size_kb, footer_stats = _parquet_footer_stats(files, schema)
+    if n_rows == 0 or len(schema) == 0:
+        raise ValueError("The DataFrame is empty.")
+
+    # --- 2. Column Classification (reads data, only if a section needs it) ---
+    if get_num_stats or get_outlier_stats or get_cat_stats:
+        df_col_types = column_type_ident(lf, unique_n_threshold=unique_n_threshold, unique_prop_threshold=unique_prop_threshold)
+        num_cols = df_col_types.filter(pl.col("col_class") == "num").get_column("column").to_list()
+        cat_cols = df_col_types.filter(pl.col("col_class") == "cat").get_column("column").to_list()
+    else:
+        df_col_types = pl.DataFrame({"column": schema.names(), "col_dtype": [str(x) for x in schema.dtypes()]})
+        num_cols, cat_cols = [], []
+
+    col_profile_list = [df_col_types]
+    row_profile_list = []
+
+    # --- 3. Footer-Based Statistics ---
+    if get_miss_stats:
+        col_profile_list.append(_parquet_missing_prop(lf, footer_stats, n_rows))
+        if get_row_stats:
+            row_profile_list.append(row_missing_prop(lf))
+
+    if get_range_stats and not get_num_stats:
+        col_profile_list.append(_parquet_range_stats(lf, footer_stats))
+
+    # --- 4. Data-Based Statistics (projected scans) ---
+    if get_dup_stats:
+        col_profile_list.append(column_dup_ind(lf))
+        if get_row_stats:
+            row_profile_list.append(row_dup_ind(lf))
+
+    if get_num_stats and len(num_cols)>0:
+        col_profile_list.append(num_stats(
+            df=lf, df_col_types=df_col_types,
+            skew_threshold=skew_threshold, kurtosis_threshold=kurtosis_threshold,
+            sparsity_threshold=sparsity_threshold, cv_threshold=cv_threshold
+        ))
+
+    if get_outlier_stats and len(num_cols)>0:
+        col_outlier, row_outlier = num_outlier_stats(df=lf, df_col_types=df_col_types, IQR_multi=IQR_multi)
+        col_profile_list.append(col_outlier)
+        if get_row_stats:
+            row_profile_list.append(row_outlier)
+
+    if get_cat_stats and len(cat_cols)>0:
+        col_cat, row_rare = cat_stats(
+            df=lf, df_col_types=df_col_types,
+            exclude_null_level=exclude_null_level,
+            rare_level_n_threshold=rare_level_n_threshold,
+            rare_level_prop_threshold=rare_level_prop_threshold
+        )
+        col_profile_list.append(col_cat)
+        if get_row_stats:
+            row_profile_list.append(row_rare)
+
+    # --- 5. Assemble Column, Row and Data Overall Profiles ---
+    return _assemble_profile(
+        col_profile_list=col_profile_list,
+        row_profile_list=row_profile_list,
+        data_info={
+            "number_of_rows": n_rows,
+            "number_of_cols": len(schema),
+            "memory_size_kb": size_kb, # Uncompressed size from the footers
+        },
+        num_cols=num_cols, cat_cols=cat_cols,
+        get_miss_stats=get_miss_stats, get_dup_stats=get_dup_stats, get_num_stats=get_num_stats,
+        get_outlier_stats=get_outlier_stats, get_cat_stats=get_cat_stats
+    )
@@ -1,11 +1,70 @@
 # polarspulse/profiling.py
+import contextvars
 import polars as pl
-from typing import Tuple # Added for type hints
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Tuple, Union # Added for type hints
+
+from .metrics import _record_plan, _stage
+
+# Input frames accepted by the profiling functions
+FrameLike = Union[pl.DataFrame, pl.LazyFrame]
+
+# --- Input Helpers ---
+
+# Helper to validate the input frame and get its dimensions
+def _frame_dims(df: FrameLike) -> Tuple[int, int]:
+    """
+    Returns the (height, width) of a DataFrame or LazyFrame.
+    For a LazyFrame the height is computed with a `pl.len()` query, which is
+    answered from metadata for Parquet scans.
+
+    :raises TypeError: If df is not a Polars DataFrame or LazyFrame.
+    :raises ValueError: If the frame is empty.
+    """
+    if isinstance(df, pl.LazyFrame):
+        width = len(df.collect_schema())
+        height = df.select(pl.len()).collect().item() if width > 0 else 0
+    elif isinstance(df, pl.DataFrame):
+        height, width = df.height, df.width
+    else:
+        raise TypeError("df must be a Polars DataFrame or LazyFrame.")
+
+    if height == 0 or width == 0:
+        raise ValueError("The DataFrame is empty.")
+
+    return height, width
+
+# Helper to pick the engine used to collect lazy plans
+def _engine(df: FrameLike) -> str:
+    """
+    LazyFrame inputs run on the streaming engine, so scans are not loaded as a whole
+    DataFrame first; in-memory DataFrames use the in-memory engine. Peak memory is still
+    O(rows): exact quantiles need all values of a column, and the row profile has one row per row.
+    """
+    return "streaming" if isinstance(df, pl.LazyFrame) else "in-memory"
+
+# Helper to collect a section query, recording its plan for the instrumented profile() stage
+def _collect(lf: pl.LazyFrame, engine: str) -> pl.DataFrame:
+    _record_plan(lf, engine)
+    return lf.collect(engine=engine)
+
+# Helper to collect section queries together (one scan of the data), recording their plans
+def _collect_all(lfs: list, engine: str) -> list:
+    for lf in lfs:
+        _record_plan(lf, engine)
+    return pl.collect_all(lfs, engine=engine)
 
 # --- Helper Functions (Keep all functions from the original code here) ---
 
+# Modes of unique value counting of column_type_ident
+_UNIQUE_COUNT_MODES = ("early_exit", "approx", "exact")
+
+# Min number of first rows counted exactly before the full pass of the "early_exit" mode
+_UNIQUE_PREFIX_ROWS = 10_000
+
 # Function to compute column types and unique value counts
-def column_type_ident(df: pl.DataFrame, unique_n_threshold:int = 10, unique_prop_threshold:float = None) -> pl.DataFrame:
+def column_type_ident(df: FrameLike, unique_n_threshold:int = 10, unique_prop_threshold:float = None,
+                      unique_count: str = "early_exit") -> pl.DataFrame:
     """
     Classify columns in a DataFrame as categorical, numerical, time, zero_variance, or other
     based on unique value counts and data types.
@@ -13,14 +72,97 @@ def column_type_ident(df: pl.DataFrame, unique_n_threshold:int = 10, unique_prop
     The effective unique value threshold used for classification is the minimum of
     `unique_n_threshold` and (`df.height` * `unique_prop_threshold`).
 
-    :param df: A Polars DataFrame to classify columns.
+    Columns are classified from the schema first: Boolean columns count their values exactly from
+    their true / non-null / null counts, and with "early_exit" time (Date, Datetime, Duration, Time)
+    columns only check for a single value (`approx_n_unique` is null when they have two or more).
+    The "approx" and "exact" modes count time columns like the other columns.
+
+    :param df: A Polars DataFrame or LazyFrame to classify columns.
     :param unique_n_threshold: The maximum number of unique values for a column to be classified as categorical.
     :param unique_prop_threshold: The proportion of unique values threshold for categorical classification (0 < threshold < 1).
+    :param unique_count: How unique values of the other columns are counted:
+        "early_exit" counts the first rows exactly and stops for columns already over the categorical
+        threshold (their `approx_n_unique` is null); the other columns get an approximate count over
+        all rows. Frames with at most 10,000 rows are counted exactly in one pass.
+        "approx" gives every column an approximate count over all rows (HyperLogLog).
+        "exact" gives every column an exact count over all rows (for small frames).
     :return: A DataFrame with column names and their classifications, dtypes, and unique counts.
     :rtype: pl.DataFrame
-    :raises ValueError: If thresholds are invalid or DataFrame is empty.
+    :raises ValueError: If thresholds or unique_count are invalid or DataFrame is empty.
     """
 
+    _check_unique_thresholds(unique_n_threshold, unique_prop_threshold)
+    if unique_count not in _UNIQUE_COUNT_MODES:
+        raise ValueError(f"unique_count must be one of {_UNIQUE_COUNT_MODES}.")
+
+    # Check if the DataFrame is not empty with at least one column and one row
+    df_n, _ = _frame_dims(df)
+
+    schema = df.lazy().collect_schema()
+    cat_n_threshold_use = _cat_n_threshold(df_n, unique_n_threshold, unique_prop_threshold)
+
+    # Boolean (and with early_exit, time) columns: cheap aggregates from the schema, no hashing
+    cheap_exprs = []
+    count_cols = []
+    for c, dtype in schema.items():
+        if dtype.is_temporal() and unique_count == "early_exit":
+            # 1 for a single value (or all Nulls), 2 for a single value and Nulls, else not counted
+            cheap_exprs.append(
+                pl.when(pl.col(c).count() == 0).then(1)
+                .when(pl.col(c).min() == pl.col(c).max()).then(1 + (pl.col(c).null_count() > 0).cast(pl.UInt32))
+                .cast(pl.UInt32).alias(c)
+            )
+        elif dtype == pl.Boolean:
+            cheap_exprs.append(
+                ((pl.col(c).sum() > 0).cast(pl.UInt32) # Any True
+                 + (pl.col(c).sum() < pl.col(c).count()).cast(pl.UInt32) # Any False
+                 + (pl.col(c).null_count() > 0).cast(pl.UInt32)).alias(c)
+            )
+        else:
+            count_cols.append(c)
+
+    # Treat NaN and Null as the same for uniqueness
+    values = {c: pl.col(c).fill_nan(None) if schema[c].is_float() else pl.col(c) for c in count_cols}
+
+    # Count the first rows exactly: columns over the threshold there are over it in the full frame
+    counts = {}
+    prefix_rows = max(_UNIQUE_PREFIX_ROWS, 10 * cat_n_threshold_use)
+    if unique_count == "early_exit" and len(count_cols) > 0:
+        prefix_counts = (
+            df.lazy().head(prefix_rows)
+            .select(value.n_unique().cast(pl.UInt32).alias(c) for c, value in values.items())
+            .pipe(_collect, _engine(df))
+            .row(0, named=True)
+        )
+        if df_n <= prefix_rows: # The first rows are all the rows: counts are exact
+            counts = prefix_counts
+        else:
+            counts = {c: None for c, n in prefix_counts.items() if n > cat_n_threshold_use}
+        values = {c: value for c, value in values.items() if c not in counts}
+
+    # Count the remaining columns over all rows in one wide-form pass
+    # (Nulls are counted apart, as the streaming engine leaves them out of approximate counts)
+    count_exprs = [
+        (value.n_unique().cast(pl.UInt32) if unique_count == "exact" else
+         pl.when(value.count() > 0).then(value.drop_nulls().approx_n_unique()).otherwise(0).cast(pl.UInt32) # Empty: 1 in expressions
+         + (value.null_count() > 0).cast(pl.UInt32)).alias(c)
+        for c, value in values.items()
+    ]
+    if len(cheap_exprs) + len(count_exprs) > 0:
+        counts.update(df.lazy().select(cheap_exprs + count_exprs).pipe(_collect, _engine(df)).row(0, named=True))
+
+    n_unique = pl.DataFrame(
+        {"column": schema.names(), "approx_n_unique": [counts[c] for c in schema.names()]},
+        schema={"column": pl.String, "approx_n_unique": pl.UInt32}
+    )
+
+    return _col_type_classify(n_unique, schema, df_n, unique_n_threshold, unique_prop_threshold)
+
+# Helper to validate the column classification thresholds
+def _check_unique_thresholds(unique_n_threshold: int, unique_prop_threshold: float) -> None:
+    """
+    :raises ValueError: If thresholds are invalid.
+    """
     # Check if n_threshold is a positive integer
     if not isinstance(unique_n_threshold, int) or unique_n_threshold <= 0:
         raise ValueError("unique_n_threshold must be a positive integer.")
@@ -30,14 +172,8 @@ def column_type_ident(df: pl.DataFrame, unique_n_threshold:int = 10, unique_prop
     if unique_prop_threshold is not None and (not isinstance(unique_prop_threshold, float) or not (0 < unique_prop_threshold < 1)):
         raise ValueError("unique_prop_threshold must be a float between 0 and 1, or None.")
 
-    # Check if the DataFrame is not empty with at least one column and one row
-    if df.is_empty() or df.height == 0 or df.width == 0:
-        raise ValueError("The DataFrame is empty.")
-
-    # Get col stats
-    col_types = [str(x) for x in df.dtypes]
-    df_n = df.height
-
+# Helper to get the effective unique value threshold of categorical columns
+def _cat_n_threshold(df_n: int, unique_n_threshold: int = 10, unique_prop_threshold: float = None) -> int:
     # Get min unique values based on threshold (stricter of the two)
     prop_threshold_count = df_n # Default if unique_prop_threshold is None
     if unique_prop_threshold is not None:
@@ -46,20 +182,35 @@ def column_type_ident(df: pl.DataFrame, unique_n_threshold:int = 10, unique_prop
     # Ensure the threshold count is at least 1 if calculated from proportion
     prop_threshold_count = max(1, prop_threshold_count)
 
-    cat_n_threshold_use = min(unique_n_threshold, prop_threshold_count)
+    return min(unique_n_threshold, prop_threshold_count)
+
+# Helper to classify columns from their unique value counts
+def _col_type_classify(n_unique: pl.DataFrame,
+                       schema: pl.Schema,
+                       df_n: int,
+                       unique_n_threshold: int = 10,
+                       unique_prop_threshold: float = None,
+                       ) -> pl.DataFrame:
+    """
+    Applies the column_type_ident classification to a frame of (column, approx_n_unique)
+    rows in schema order, however the unique counts were obtained. A null count means
+    not counted: over the categorical threshold (or a time column with several values).
+    """
+    col_types = [str(schema[c]) for c in n_unique["column"]]
+
+    cat_n_threshold_use = _cat_n_threshold(df_n, unique_n_threshold, unique_prop_threshold)
     # Calculate the proportional threshold actually used (for reporting)
     cat_prop_threshold_use = cat_n_threshold_use / df_n
 
+    # Columns not counted are over the threshold
+    n_unique_known = pl.col("approx_n_unique").fill_null(pl.lit(cat_n_threshold_use + 1))
+
     # Compute column classifications
     col_unique_type = (
-        df.select(pl.all())
-        .fill_nan(None) # Treat NaN and Null as the same for uniqueness
-        .unpivot(variable_name="column") # Transform data into long format
-        .group_by("column", maintain_order=True) # Order needed
-        .agg(pl.col("value").approx_n_unique().alias("approx_n_unique")) # Use approximate count for speed
+        n_unique
         .with_columns(
             (pl.col("approx_n_unique") / pl.lit(df_n)).round(4).alias("approx_prop_unique"), # Increased precision
-            pl.Series(name="col_dtype", values=col_types)
+            pl.Series(name="col_dtype", values=col_types, dtype=pl.String)
         )
         # Add thresholds used for classification reporting
         .with_columns(
@@ -70,17 +221,17 @@ def column_type_ident(df: pl.DataFrame, unique_n_threshold:int = 10, unique_prop
         .with_columns(
             col_class =
                 # zero-variance vars: approx_n_unique <= 1
-                pl.when(pl.col("approx_n_unique") <= 1).then(pl.lit("zero_var"))
+                pl.when(n_unique_known <= 1).then(pl.lit("zero_var"))
                 # time vars: check dtype first
                 .when(pl.col("col_dtype").str.contains("Date|Duration|Time|Datetime")).then(pl.lit("time"))
                 # cat vars: approx_n_unique <= cat_n_threshold_use and suitable dtype
-                .when((pl.col("approx_n_unique") > 1) &
-                      (pl.col("approx_n_unique") <= pl.lit(cat_n_threshold_use)) &
+                .when((n_unique_known > 1) &
+                      (n_unique_known <= pl.lit(cat_n_threshold_use)) &
                       (pl.col("col_dtype").str.contains("Utf8|String|Binary|Boolean|Categorical|Enum|Int|UInt|Float")) # Broaden types slightly, Categorical/Enum
                      ).then(pl.lit("cat"))
                 # num vars: approx_n_unique > cat_n_threshold_use and numeric dtype
-                .when((pl.col("approx_n_unique") > 1) &
-                      (pl.col("approx_n_unique") > pl.lit(cat_n_threshold_use)) &
+                .when((n_unique_known > 1) &
+                      (n_unique_known > pl.lit(cat_n_threshold_use)) &
                       (pl.col("col_dtype").str.contains("Float|Int|UInt"))
                      ).then(pl.lit("num"))
                 .otherwise(pl.lit("other")) # Catch-all for remaining types/conditions
@@ -90,76 +241,351 @@ def column_type_ident(df: pl.DataFrame, unique_n_threshold:int = 10, unique_prop
     return col_unique_type
 
 # Function to compute missing data proportions
-def column_missing_prop(df: pl.DataFrame) -> pl.DataFrame:
+def column_missing_prop(df: FrameLike, by: Union[str, list] = None) -> pl.DataFrame:
     """
     Computes the count and proportion of missing values (Nulls) for each column.
+    With `by`, counts are per group of the `by` columns in one group_by pass: one row per group
+    and column (except the group columns), with the group rows in `group_n`.
     """
-    if df.is_empty() or df.height == 0 or df.width == 0:
-        raise ValueError("The DataFrame is empty.")
+    df_n, _ = _frame_dims(df)
+
+    if by is not None:
+        keys = _group_keys(df.lazy().collect_schema(), by)
+        return _group_profile(df, keys, dict.fromkeys(df.lazy().collect_schema().names()),
+                              get_num_stats=False, get_outlier_stats=False, get_cat_stats=False).drop("col_class")
 
     # Compute missing data counts and proportions
-    na_counts = df.null_count().transpose(include_header=False, column_names=["missing_n"])["missing_n"]
-    na_prop = (na_counts / df.height).round(4) # Increased precision
+    na_counts = (
+        df.lazy()
+        .select(pl.all().null_count())
+        .pipe(_collect, _engine(df))
+        .transpose(include_header=False, column_names=["missing_n"])["missing_n"]
+    )
+    na_prop = (na_counts / df_n).round(4) # Increased precision
 
     return pl.DataFrame({
-        "column": df.columns,
+        "column": df.lazy().collect_schema().names(),
         "missing_n": na_counts.cast(pl.UInt32),
         "missing_prop": na_prop
     })
 
 # Function to compute row-wise missing data proportions
-def row_missing_prop(df: pl.DataFrame) -> pl.DataFrame:
+def row_missing_prop(df: FrameLike) -> pl.DataFrame:
     """
     Computes the count and proportion of missing values (Nulls) for each row.
     """
-    if df.is_empty() or df.height == 0 or df.width == 0:
-        raise ValueError("The DataFrame is empty.")
+    _, df_width = _frame_dims(df)
 
     return (
-        df.select( # Avoid modifying original df implicitly
+        df.lazy()
+        .select( # Avoid modifying original df implicitly
             pl.sum_horizontal(pl.all().is_null()).alias("missing_n")
         )
         .with_columns(
-            (pl.col("missing_n") / pl.lit(df.width)).round(4).alias("missing_prop") # Increased precision
+            (pl.col("missing_n") / pl.lit(df_width)).round(4).alias("missing_prop") # Increased precision
         )
         .with_row_index("row_index", offset=1) # Add row_index (UInt32 default)
         .select(["row_index", "missing_n", "missing_prop"]) # Select and order columns
+        .pipe(_collect, _engine(df))
        )
 
+# Integer dtype too wide for the Int128 comparison of numbers (not in older Polars versions)
+_UINT128 = getattr(pl, "UInt128", None)
+
+# Helper to tell if a dtype is compared as an exact integer or float number (Decimal and UInt128 keep their own dtype)
+def _dup_is_number(dtype: pl.DataType) -> bool:
+    return (dtype.is_integer() and dtype != _UINT128) or dtype.is_float()
+
+# Helper to flag the float values equal to an Int128 integer
+def _dup_integral_expr(value: pl.Expr) -> pl.Expr:
+    return value.is_finite() & (value == value.floor()) & (value >= -2.0 ** 127) & (value < 2.0 ** 127)
+
+# Helper to normalize column values before comparing columns by value
+def _dup_compare_expr(col: str, dtype: pl.DataType) -> pl.Expr:
+    """
+    Integer columns are compared as Int128 and float columns as Float64 (both lossless),
+    Categorical/Enum columns as String, other columns on their own dtype.
+    """
+    if _dup_is_number(dtype):
+        return pl.col(col).cast(pl.Int128 if dtype.is_integer() else pl.Float64)
+    if isinstance(dtype, (pl.Categorical, pl.Enum)):
+        return pl.col(col).cast(pl.String)
+    return pl.col(col)
+
+# Helper to name the dtype columns are compared on (columns of different compared dtypes never match)
+def _dup_compare_dtype(dtype: pl.DataType) -> str:
+    return "number" if _dup_is_number(dtype) else str(pl.String if isinstance(dtype, (pl.Categorical, pl.Enum)) else dtype)
+
+# Helper to hash the compared values of a column
+def _dup_hash_expr(col: str, dtype: pl.DataType) -> pl.Expr:
+    """
+    Integral float values are hashed as Int128, so an integer column and a float column
+    holding the same numbers get the same hashes.
+    """
+    value = _dup_compare_expr(col, dtype)
+    if dtype.is_float():
+        return pl.when(_dup_integral_expr(value)).then(value.cast(pl.Int128, strict=False).hash(seed=0)).otherwise(value.hash(seed=0))
+    return value.hash(seed=0)
+
+# Helper to check that two columns of the same compared dtype are equal in every row
+def _dup_equal_expr(col: str, other: str, schema: pl.Schema) -> pl.Expr:
+    """
+    Nulls (and NaNs) compare equal. A float column equals an integer column only where
+    its values are integral and equal as Int128.
+    """
+    value, other_value = _dup_compare_expr(col, schema[col]), _dup_compare_expr(other, schema[other])
+    if _dup_is_number(schema[col]) and schema[col].is_float() != schema[other].is_float():
+        if schema[other].is_float():
+            value, other_value = other_value, value
+        integral = _dup_integral_expr(value)
+        return (pl.when(integral).then(value.cast(pl.Int128, strict=False)).eq_missing(other_value) & (integral | value.is_null())).all()
+    return value.eq_missing(other_value).all()
+
+# Helper to build the order-sensitive hash fingerprint of a column
+def _dup_fingerprint_expr(col: str, dtype: pl.DataType) -> pl.Expr:
+    """
+    Wrapping sum of the value hashes mixed with the row position hashes.
+    """
+    row_hash = pl.int_range(pl.len(), dtype=pl.UInt64).hash(seed=1)
+    return (_dup_hash_expr(col, dtype) ^ row_hash).sum()
+
+# Helper to build the column duplicate output from the verified duplicate groups
+def _dup_col_frame(cols: list, dup_groups: list) -> pl.DataFrame:
+    # Number groups in column order
+    dup_groups = sorted(dup_groups, key=lambda group: cols.index(group[0]))
+    dup_group_id = {c: i + 1 for i, group in enumerate(dup_groups) for c in group}
+    dup_first_column = {c: group[0] for group in dup_groups for c in group}
+
+    return pl.DataFrame({
+        "column": cols,
+        "dup_ind": [int(c in dup_group_id) for c in cols],
+        "dup_group": [dup_group_id.get(c) for c in cols],
+        "dup_first_column": [dup_first_column.get(c) for c in cols],
+    }, schema={"column": pl.String, "dup_ind": pl.UInt8, "dup_group": pl.UInt32, "dup_first_column": pl.String}) # Use UInt8 for indicator
+
 # Function to compute indicator for duplicate columns
-def column_dup_ind(df: pl.DataFrame)-> pl.DataFrame:
+def column_dup_ind(df: FrameLike)-> pl.DataFrame:
     """
     Identifies duplicate columns based on their values (not names).
-    Returns an indicator (0/1) for each column.
+    Returns an indicator (0/1) for each column, the id of its duplicate group and the
+    first column of that group (both null for columns without duplicates).
+
+    Each column is reduced to an order-sensitive hash fingerprint in a single pass, and
+    only columns sharing a fingerprint are compared value by value. Cost is linear in
+    the data with O(width) extra memory. Integer and float columns are compared exactly as
+    numbers (an integer column equals a float column holding the same integral values),
+    Categorical/Enum columns as String; Nulls (and NaNs) compare equal.
     """
-    if df.is_empty() or df.height == 0 or df.width == 0:
-        raise ValueError("The DataFrame is empty.")
+    _frame_dims(df)
 
-    # Transposing can be memory intensive for wide dataframes
-    if df.width > 1000: # Add a heuristic warning or alternative approach?
-         print("Warning: Detecting duplicate columns on wide DataFrames (>{df.width} cols) can be slow/memory intensive.")
+    schema = df.lazy().collect_schema()
 
-    return pl.DataFrame({
-        "column": df.columns,
-        "dup_ind": df.transpose().is_duplicated().cast(pl.UInt8) # Use UInt8 for indicator
-    })
+    # Fingerprint each column: wrapping sum of value hashes mixed with row position hashes
+    fingerprints = (
+        df.lazy()
+        .select(_dup_fingerprint_expr(c, dtype).alias(c) for c, dtype in schema.items())
+        .pipe(_collect, _engine(df))
+        .row(0)
+    )
+
+    return _dup_col_frame(schema.names(), _dup_col_verify(df, schema, fingerprints))
+
+# Helper to find the duplicate column groups from the column fingerprints
+def _dup_col_verify(df: FrameLike, schema: pl.Schema, fingerprints: list) -> list:
+    """
+    Groups columns of the same compared dtype and fingerprint, then verifies the candidates
+    value by value (only the candidate columns are read). Returns the lists of duplicate columns.
+    """
+
+    # Candidate groups: same compared dtype and same fingerprint
+    candidates = {}
+    for c, fingerprint in zip(schema.names(), fingerprints):
+        candidates.setdefault((_dup_compare_dtype(schema[c]), fingerprint), []).append(c)
+    candidates = [group for group in candidates.values() if len(group) > 1]
+
+    # Verify candidates exactly against the first column of their group (one pass per round);
+    # columns that differ from it (hash collisions) are checked again among themselves
+    dup_groups = []
+    while len(candidates) > 0:
+        checks = (
+            df.lazy()
+            .select(
+                _dup_equal_expr(c, group[0], schema).alias(c)
+                for group in candidates for c in group[1:]
+            )
+            .pipe(_collect, _engine(df))
+            .row(0, named=True)
+        )
+        next_candidates = []
+        for group in candidates:
+            matched = [group[0]] + [c for c in group[1:] if checks[c]]
+            rest = [c for c in group[1:] if not checks[c]]
+            if len(matched) > 1:
+                dup_groups.append(matched)
+            if len(rest) > 1:
+                next_candidates.append(rest)
+        candidates = next_candidates
+
+    return dup_groups
+
+# Helper to hash every row: wrapping sum of per-column hashes, seeded by position
+# (`seed_offset` is the position of the first column, so hashes of column batches add up)
+def _row_hash_expr(values: list, seed_offset: int = 0) -> pl.Expr:
+    return pl.sum_horizontal(value.hash(seed=seed_offset + i) for i, value in enumerate(values)).alias("row_hash")
+
+# Helper to group rows by hash, giving the first row_index and a duplicate flag per row
+def _row_hash_groups(row_hashes: pl.DataFrame) -> pl.DataFrame:
+    return (
+        row_hashes
+        .with_columns(
+            dup_first_row_index=pl.col("row_index").min().over("row_hash"),
+            dup_ind=(pl.len().over("row_hash") > 1)
+        )
+        .drop("row_hash")
+    )
+
+# Helper to build the row duplicate output from the (row_index, dup_first_row_index, dup_ind) groups
+def _dup_row_frame(row_groups: pl.DataFrame) -> pl.DataFrame:
+    return (
+        row_groups
+        .with_columns(
+            dup_ind=pl.col("dup_ind").cast(pl.UInt8), # Use UInt8 for indicator
+            # Number duplicate groups by first occurrence
+            dup_group=pl.when(pl.col("dup_ind")).then(pl.col("dup_first_row_index")).rank("dense").cast(pl.UInt32)
+        )
+        .select(["row_index", "dup_ind", "dup_group", "dup_first_row_index"])
+    )
 
 # Function to compute indicator for duplicate rows
-def row_dup_ind(df: pl.DataFrame)-> pl.DataFrame:
+def row_dup_ind(df: FrameLike)-> pl.DataFrame:
     """
     Identifies duplicate rows based on their values.
-    Returns an indicator (0/1) for each row.
+    Returns an indicator (0/1) for each row, the id of its duplicate group (null for unique rows)
+    and the row_index of its first occurrence (its own index for unique and first rows).
+
+    Rows are first reduced to a 64-bit hash, computed column by column (and chunk by chunk on
+    the streaming engine for LazyFrames), so only (row_index, hash) pairs are kept in memory. Rows sharing a hash are then
+    compared on their full values, which resolves hash collisions exactly.
     """
-    if df.is_empty() or df.height == 0 or df.width == 0:
-        raise ValueError("The DataFrame is empty.")
+    _frame_dims(df)
 
-    return pl.DataFrame({
-        "row_index": df.with_row_index(name="row_index", offset=1).select(pl.col("row_index")),
-        "dup_ind": df.is_duplicated().cast(pl.UInt8) # Use UInt8 for indicator
-    })
+    cols = df.lazy().collect_schema().names()
+
+    # Hash every row (wrapping sum of per-column hashes, seeded by position) and group rows by hash
+    row_hashes = _row_hash_groups(
+        df.lazy()
+        .select(_row_hash_expr([pl.col(c) for c in cols]))
+        .with_row_index("row_index", offset=1)
+        .pipe(_collect, _engine(df))
+    )
+
+    return _dup_row_frame(_row_dup_verify(df, row_hashes))
+
+# Helper to verify the rows sharing a hash on their full values (only these rows are read again)
+def _row_dup_verify(df: FrameLike, row_hashes: pl.DataFrame) -> pl.DataFrame:
+    """
+    Updates the (row_index, dup_first_row_index, dup_ind) groups of `_row_hash_groups`
+    with the exact groups of the candidate rows, resolving hash collisions.
+    """
+    cols = df.lazy().collect_schema().names()
+    index_name = "row_index" if "row_index" not in cols else "__row_index" # Avoid clashing with data columns
+
+    candidate_index = row_hashes.filter(pl.col("dup_ind")).get_column("row_index")
+    if len(candidate_index) > 0:
+        candidate_rows = (
+            df.lazy()
+            .with_row_index(index_name, offset=1)
+            .filter(pl.col(index_name).is_in(candidate_index.implode()))
+            .select(
+                pl.col(index_name).alias("row_index"),
+                pl.col(index_name).min().over(pl.struct(cols)).alias("dup_first_row_index"),
+                (pl.len().over(pl.struct(cols)) > 1).alias("dup_ind")
+            )
+            .pipe(_collect, _engine(df))
+        )
+        row_hashes = row_hashes.update(candidate_rows, on="row_index")
+
+    return row_hashes
+
+# Quantiles reported by num_stats (probability, output column name)
+_NUM_QUANTILES = [
+    (0.01, "1th"), (0.05, "5th"), (0.10, "10th"), (0.25, "25th"), (0.50, "50th"),
+    (0.75, "75th"), (0.90, "90th"), (0.95, "95th"), (0.99, "99th"),
+]
+
+# Column order of the statistics returned by num_stats (after "column")
+_NUM_STAT_COLS = (
+    ["n", "sum", "mean", "std", "min"] + [name for _, name in _NUM_QUANTILES] +
+    ["max", "skew", "kurtosis", "sparsity", "iqr", "range", "cv",
+     "high_skew_ind", "high_kurtosis_ind", "high_sparsity_ind", "high_cv_ind",
+     "nan_ind", "inf_ind"]
+)
+
+# Helper to build the per-column aggregation used by num_stats
+def _num_col_aggs(col: str, dtype: pl.DataType = pl.Float64) -> pl.Expr:
+    """
+    Builds a struct expression with the base numeric stats of a single column.
+    Stats ignore Null, NaN and Infinite values, except for the NaN/Inf indicators.
+    Works both in `select` (whole frame) and in `group_by().agg()` (per group).
+    """
+    value = pl.col(col).cast(dtype)
+    finite = value.filter(value.is_finite()) # filter out NaN and Infinite values
+    finite_sorted = finite.sort() # Sort once so each quantile is a lookup, also on chunked data
+
+    return pl.struct(
+        finite.len().cast(pl.UInt32).alias("n"),
+        finite.sum().alias("sum"),
+        finite.mean().alias("mean"),
+        finite.std().alias("std"),
+        finite.min().alias("min"),
+        *(finite_sorted.quantile(q).alias(name) for q, name in _NUM_QUANTILES),
+        finite.max().alias("max"),
+        finite.skew().alias("skew"), # Can be null if std is 0
+        finite.kurtosis().alias("kurtosis"), # Can be null if std is 0
+        (finite == 0).mean().alias("sparsity"), # Prop zeros among finite
+        value.is_nan().any().cast(pl.UInt8).alias("nan_ind"),
+        value.is_infinite().any().cast(pl.UInt8).alias("inf_ind"),
+    ).alias(col)
+
+# Helper to add derived stats and threshold indicators to base numeric stats
+def _num_stats_derive(main_stats: pl.DataFrame,
+                      skew_threshold: float = 3.0,
+                      kurtosis_threshold: float = 3.0,
+                      sparsity_threshold: float = 0.5,
+                      cv_threshold: float = 1.0,
+                      ) -> pl.DataFrame:
+    """
+    Adds iqr, range, cv and the high_*_ind indicators to the base stats built
+    with `_num_col_aggs`, and orders the columns as returned by num_stats.
+    """
+    # Keep any key columns (e.g. "column" or group keys) in front
+    key_cols = [c for c in main_stats.columns if c not in _NUM_STAT_COLS]
+
+    return (
+        main_stats
+        .with_columns(
+            # Derived stats - handle potential division by zero or nulls
+            iqr = (pl.col("75th") - pl.col("25th")),
+            range = (pl.col("max") - pl.col("min")),
+            cv = pl.when(pl.col("mean") != 0).then(pl.col("std") / pl.col("mean")).otherwise(None) # Coef of variation
+        )
+         # Compute threshold indicators
+        .with_columns(
+             # Use fill_null(0) for skew/kurtosis if they are null (e.g., constant value)
+            high_skew_ind = (pl.col("skew").fill_null(0).abs() > skew_threshold).cast(pl.UInt8),
+            high_kurtosis_ind = (pl.col("kurtosis").fill_null(0).abs() > kurtosis_threshold).cast(pl.UInt8),
+            high_sparsity_ind = (pl.col("sparsity") > sparsity_threshold).cast(pl.UInt8),
+            # CV can be tricky (large for mean near zero), abs value helps
+            high_cv_ind = pl.when(pl.col("cv").is_not_null())
+                          .then(pl.col("cv").abs() > cv_threshold)
+                          .otherwise(False) # Treat null CV as not high
+                          .cast(pl.UInt8)
+        )
+        .select(key_cols + _NUM_STAT_COLS)
+    )
 
 # Function to compute numeric column stats
-def num_stats(df:pl.DataFrame,
+def num_stats(df:FrameLike,
               df_col_types:pl.DataFrame = None,
               unique_n_threshold: int = 10,
               unique_prop_threshold: float = None,
@@ -167,19 +593,30 @@ def num_stats(df:pl.DataFrame,
               kurtosis_threshold: float = 3.0,
               sparsity_threshold: float = 0.5,
               cv_threshold: float = 1.0,
+              by: Union[str, list] = None,
               ) -> pl.DataFrame:
     """
     Computes descriptive statistics for numeric columns.
     Includes mean, std, quantiles, skewness, kurtosis, sparsity, etc.
     All stats ignore Null, NaN, and Infinite values unless specified (e.g., nan/inf indicators).
+    With `by`, stats are per group of the `by` columns in one group_by pass (columns are classified
+    once over the whole frame): one row per group and numeric column, with the group rows in `group_n`.
     """
-    if df.is_empty() or df.height == 0 or df.width == 0:
-        raise ValueError("The DataFrame is empty.")
+    _frame_dims(df)
 
     # Check if df_col_types is provided, if not, compute it
     if df_col_types is None:
         df_col_types = column_type_ident(df, unique_n_threshold=unique_n_threshold, unique_prop_threshold=unique_prop_threshold)
 
+    if by is not None:
+        keys = _group_keys(df.lazy().collect_schema(), by)
+        return _group_profile(
+            df, keys, dict(df_col_types.select("column", "col_class").iter_rows()),
+            skew_threshold=skew_threshold, kurtosis_threshold=kurtosis_threshold,
+            sparsity_threshold=sparsity_threshold, cv_threshold=cv_threshold,
+            get_miss_stats=False, get_outlier_stats=False, get_cat_stats=False
+        ).drop("col_class")
+
     # Identify numeric columns
     num_cols = df_col_types.filter(pl.col("col_class") == "num").get_column("column").to_list()
 
@@ -190,76 +627,50 @@ def num_stats(df:pl.DataFrame,
     if len(num_cols)==0: # No numeric columns found
         return non_num_col_stats # Return empty stats for non-numeric cols
 
-    # Compute stats for numeric columns
-    # Separate computation for NaN/Inf indicators as they need original data
-    nan_inf_stats = (
-         df.select(pl.col(num_cols))
-         .unpivot(variable_name="column")
-         .group_by("column", maintain_order=True)
-         .agg(
-             (pl.col("value").is_nan()).any().cast(pl.UInt8).alias("nan_ind"),
-             (pl.col("value").is_infinite()).any().cast(pl.UInt8).alias("inf_ind")
-         )
-    )
-
-    # Compute main descriptive stats excluding non-finite values
+    # Compute all stats for numeric columns in a single wide-form pass (no unpivot)
+    # Cast to the common supertype so output dtypes match a long-format computation
+    schema = df.lazy().collect_schema()
+    value_dtype = pl.DataFrame(schema={c: schema[c] for c in num_cols}).unpivot()["value"].dtype
     main_stats = (
-        df.select(pl.col(num_cols))
-        .unpivot(variable_name="column")
-        .filter(pl.col("value").is_finite()) # filter out NaN and Infinite values
-        .group_by("column", maintain_order=True)
-        .agg(
-            pl.col("value").len().cast(pl.UInt32).alias("n"),
-            pl.col("value").sum().alias("sum"),
-            pl.col("value").mean().alias("mean"),
-            pl.col("value").std().alias("std"),
-            pl.col("value").min().alias("min"),
-            pl.col("value").quantile(0.01).alias("1th"),
-            pl.col("value").quantile(0.05).alias("5th"),
-            pl.col("value").quantile(0.10).alias("10th"),
-            pl.col("value").quantile(0.25).alias("25th"),
-            pl.col("value").quantile(0.50).alias("50th"),
-            pl.col("value").quantile(0.75).alias("75th"),
-            pl.col("value").quantile(0.90).alias("90th"),
-            pl.col("value").quantile(0.95).alias("95th"),
-            pl.col("value").quantile(0.99).alias("99th"),
-            pl.col("value").max().alias("max"),
-            pl.col("value").skew().alias("skew"), # Can be null if std is 0
-            pl.col("value").kurtosis().alias("kurtosis"), # Can be null if std is 0
-            (pl.col("value") == 0).mean().alias("sparsity"), # Prop zeros among finite
-        )
-        .with_columns(
-            # Derived stats - handle potential division by zero or nulls
-            iqr = (pl.col("75th") - pl.col("25th")),
-            range = (pl.col("max") - pl.col("min")),
-            cv = pl.when(pl.col("mean") != 0).then(pl.col("std") / pl.col("mean")).otherwise(None) # Coef of variation
-        )
-         # Compute threshold indicators
-        .with_columns(
-             # Use fill_null(0) for skew/kurtosis if they are null (e.g., constant value)
-            high_skew_ind = (pl.col("skew").fill_null(0).abs() > skew_threshold).cast(pl.UInt8),
-            high_kurtosis_ind = (pl.col("kurtosis").fill_null(0).abs() > kurtosis_threshold).cast(pl.UInt8),
-            high_sparsity_ind = (pl.col("sparsity") > sparsity_threshold).cast(pl.UInt8),
-            # CV can be tricky (large for mean near zero), abs value helps
-            high_cv_ind = pl.when(pl.col("cv").is_not_null())
-                          .then(pl.col("cv").abs() > cv_threshold)
-                          .otherwise(False) # Treat null CV as not high
-                          .cast(pl.UInt8)
-        )
+        df.lazy()
+        .select(_num_col_aggs(c, value_dtype) for c in num_cols) # One struct of stats per column
+        .pipe(_collect, _engine(df)) # In-memory engine shares the finite-value filter across stats of each column
+        .unpivot(variable_name="column") # Reshape the small 1 x num_cols result only
+        .unnest("value")
     )
 
-    # Combine stats and fill appropriately
+    # Add derived stats and threshold indicators, then add back non-numeric columns
     col_stats = (
-        main_stats
-        .join(nan_inf_stats, on="column", how="left") # Join NaN/Inf indicators
+        _num_stats_derive(main_stats,
+                          skew_threshold=skew_threshold, kurtosis_threshold=kurtosis_threshold,
+                          sparsity_threshold=sparsity_threshold, cv_threshold=cv_threshold)
         .join(non_num_col_stats, on="column", how="full", coalesce=True) # Add back non-numeric columns
         .sort("column") # Maintain consistent column order
     )
 
     return col_stats
 
+# Helper to compute the outlier bounds from the quartiles and median ("25th", "50th", "75th")
+def _outlier_bound_exprs(IQR_multi: float = 5.0,
+                         q25: pl.Expr = None, q50: pl.Expr = None, q75: pl.Expr = None) -> list:
+    """
+    Same bounds as the scaled-data rule of num_outlier_stats: scaling by `(value - median) / IQR`
+    is monotonic, so the scaled quartiles are the scaled original quartiles, and back in original
+    units the rule reduces to `[25th - IQR_multi * IQR, 75th + IQR_multi * IQR]` (also for a zero
+    IQR, where both bounds are the quartiles). Each quartile is referenced once per bound, which
+    keeps per-group aggregations from re-evaluating them.
+    The quartiles default to the "25th", "50th" and "75th" columns; aggregation expressions
+    can be given instead (e.g. per group). The median does not change the bounds.
+    """
+    q25 = pl.col("25th") if q25 is None else q25
+    q75 = pl.col("75th") if q75 is None else q75
+    return [
+        (q25 - pl.lit(IQR_multi) * (q75 - q25)).alias("outlier_LB"),
+        (q75 + pl.lit(IQR_multi) * (q75 - q25)).alias("outlier_UB"),
+    ]
+
 # Function to compute numeric outlier stats
-def num_outlier_stats(df:pl.DataFrame,
+def num_outlier_stats(df:FrameLike,
                       df_col_types:pl.DataFrame = None,
                       unique_n_threshold: int = 10,
                       unique_prop_threshold: float = None,
@@ -271,9 +682,12 @@ def num_outlier_stats(df:pl.DataFrame,
     Outlier if scaled value is outside `Q1_scaled - IQR_multi * IQR_scaled` or `Q3_scaled + IQR_multi * IQR_scaled`.
     Returns column-level and row-level outlier statistics.
     NaNs and Infinite values are ignored in outlier detection.
+
+    The scaling is monotonic, so the scaled quartiles are the scaled original quartiles: bounds
+    come from a single quantile pass, and outliers are counted with horizontal expressions on
+    the wide frame (no long-format copy of the data, no joins).
     """
-    if df.is_empty() or df.height == 0 or df.width == 0:
-        raise ValueError("The DataFrame is empty.")
+    df_n, _ = _frame_dims(df)
 
     if not isinstance(IQR_multi, (int, float)) or IQR_multi <= 0:
          raise ValueError("IQR_multi must be a positive number.")
@@ -294,222 +708,103 @@ def num_outlier_stats(df:pl.DataFrame,
         print("Warning: No numeric columns found in the DataFrame.")
         return non_num_col_set, empty_row_stats
 
-    # Compute df_long for finite numeric values with row index
-    df_long = (
-        df.select(pl.col(num_cols))
-        .with_row_index("row_index", offset=1)
-        .unpivot(index="row_index", variable_name="column")
-        .filter(pl.col("value").is_finite()) # Drop NaNs and infinite values
-    )
+    # Compare values on the common supertype, as a long-format computation would
+    schema = df.lazy().collect_schema()
+    value_dtype = pl.DataFrame(schema={c: schema[c] for c in num_cols}).unpivot()["value"].dtype
+    values = {c: pl.col(c).cast(value_dtype) for c in num_cols}
 
-    # Compute basic IQR stats on original data
-    col_iqr_stats = (
-        df_long
-        .group_by("column", maintain_order=True)
-        .agg(
-            pl.col("value").quantile(0.25).alias("25th"),
-            pl.col("value").quantile(0.5).alias("50th"), # Median
-            pl.col("value").quantile(0.75).alias("75th")
-        )
-        .with_columns(
-            iqr = (pl.col("75th") - pl.col("25th"))
-        )
-        # Handle cases where IQR is zero (constant values within Q1-Q3)
-        .with_columns(
-            iqr = pl.when(pl.col("iqr") == 0).then(1e-9).otherwise(pl.col("iqr")) # Replace 0 IQR with small epsilon to avoid division by zero
-        )
+    # Quartiles of the finite values in one wide-form pass
+    quartiles = []
+    for c, value in values.items():
+        finite_sorted = value.filter(value.is_finite()).sort() # Sort once so each quantile is a lookup
+        quartiles.append(pl.struct(finite_sorted.quantile(q).alias(name) for q, name in _NUM_QUANTILES if name in ("25th", "50th", "75th")).alias(c))
+    outlier_thresholds = (
+        df.lazy()
+        .select(quartiles)
+        .pipe(_collect, _engine(df))
+        .unpivot(variable_name="column") # Reshape the small 1 x num_cols result only
+        .unnest("value")
+        .select("column", *_outlier_bound_exprs(IQR_multi))
     )
 
-    # Compute scaled values and their IQR stats to find thresholds
-    # Need to join back iqr_stats first
-    df_long_scaled = df_long.join(col_iqr_stats, on="column", how="left")
+    # Outlier indicator of each finite value (Null for Nulls, False for NaN/Inf)
+    outliers = {
+        c: value.is_finite() & value.is_between(lb, ub, closed='both').not_()
+        for (c, value), (_, lb, ub) in zip(values.items(), outlier_thresholds.iter_rows())
+    }
 
-    scaled_iqr_stats = (
-         df_long_scaled
-         # Compute scaled value: (value - median) / iqr
-         .with_columns(scaled_value = (pl.col("value") - pl.col("50th")) / pl.col("iqr"))
-         .group_by("column", maintain_order=True)
-         .agg(
-             pl.col("scaled_value").quantile(0.25).alias("scaled_value_25th"),
-             # pl.col("scaled_value").quantile(0.5).alias("scaled_value_50th"), # Not needed for bounds
-             pl.col("scaled_value").quantile(0.75).alias("scaled_value_75th")
-         )
-         .with_columns(
-             scaled_value_iqr = pl.col("scaled_value_75th") - pl.col("scaled_value_25th")
-         )
-         # Calculate scaled bounds
-         .with_columns(
-             scaled_value_LB = pl.col("scaled_value_25th") - pl.lit(IQR_multi) * pl.col("scaled_value_iqr"),
-             scaled_value_UB = pl.col("scaled_value_75th") + pl.lit(IQR_multi) * pl.col("scaled_value_iqr")
-         )
-    )
+    # Outlier stats by col
+    col_outlier_n = df.lazy().select(outlier.sum().cast(pl.UInt32).alias(c) for c, outlier in outliers.items())
 
-    # Compute final thresholds by transforming scaled bounds back to original scale
-    outlier_thresholds = (
-        scaled_iqr_stats
-        .join(col_iqr_stats.select(["column", "50th", "iqr"]), on="column", how="left") # Join back median and IQR
-        # Inverse scale transformation: scaled_bound * iqr + median
-        .with_columns(
-            outlier_LB = pl.col("scaled_value_LB") * pl.col("iqr") + pl.col("50th"),
-            outlier_UB = pl.col("scaled_value_UB") * pl.col("iqr") + pl.col("50th")
+    # Outlier stats by row, for rows with at least one finite numeric value
+    row_outlier_ind = (
+        df.lazy()
+        .with_row_index("row_index", offset=1)
+        .filter(pl.any_horizontal(value.is_finite() for value in values.values()))
+        .select(
+            "row_index",
+            outliers_n=pl.sum_horizontal(outliers.values()).cast(pl.UInt32)
         )
-        .select(["column", "outlier_LB", "outlier_UB"])
-    )
-
-    # Compute indicators if values are outside the calculated bounds
-    df_outlier_ind = (
-        df_long # Use original long df with finite values
-        .join(outlier_thresholds, on="column", how="left")
         .with_columns(
-            # .not_() handles cases where value is exactly on the boundary correctly
-            outliers_ind = pl.col("value").is_between(pl.col("outlier_LB"), pl.col("outlier_UB"), closed='both').not_().cast(pl.UInt8)
+            outliers_prop=pl.col("outliers_n")/pl.lit(len(num_cols)), # Prop in reference to number or num columns per sample
+            outliers_ind=(pl.col("outliers_n")>0).cast(pl.UInt8)
         )
-        .select(["row_index", "column", "outliers_ind"]) # Keep only needed columns
+        .select(["row_index", "outliers_ind", "outliers_n", "outliers_prop"])
     )
 
-    # Outlier stats by col 
+    # Run both plans together so the data is scanned once
+    col_outlier_n, row_outlier_ind = _collect_all([col_outlier_n, row_outlier_ind], _engine(df))
+
     col_outlier_ind = (
-        # compute agg by column
-        df_outlier_ind
-        .group_by("column")
-        .agg(outliers_n=(pl.col("outliers_ind")==pl.lit(1)).sum()) 
+        col_outlier_n
+        .unpivot(variable_name="column", value_name="outliers_n")
         .with_columns(
-            outliers_prop=pl.col("outliers_n")/pl.lit(df.height),
+            outliers_prop=pl.col("outliers_n")/pl.lit(df_n),
             outliers_ind=(pl.col("outliers_n")>1).cast(pl.UInt8)
         )
         # add threshold info and order columns
-        .join(outlier_thresholds, on="column")
+        .join(outlier_thresholds, on="column", how="left")
         .select(["column", "outlier_LB", "outlier_UB", "outliers_ind", "outliers_n", "outliers_prop"])
 
         # add empty set for non-num columns
         .join(non_num_col_set, on="column", how="full", coalesce=True)
     )
 
-
-    # Outlier stats by row
-    row_outlier_ind = (
-            # compute agg by column
-            df_outlier_ind
-            .group_by("row_index")
-            .agg(outliers_n=(pl.col("outliers_ind")==pl.lit(1)).sum())
-            .with_columns(
-                outliers_prop=pl.col("outliers_n")/pl.lit(len(num_cols)), # Prop in reference to number or num columns per sample
-                outliers_ind=(pl.col("outliers_n")>0).cast(pl.UInt8)
-            )
-            # order columns
-            # .join(outlier_thresholds, on="column")
-            .select(["row_index", "outliers_ind", "outliers_n", "outliers_prop"])
-    )
-
-    # # Combine with non-numeric columns
-    # col_outlier_final = (
-    #     col_outlier_agg
-    #     .join(non_num_col_set, on="column", how="full", coalesce=True)
-    #     .sort("column")
-    # )
-
-
-    # # Aggregate outlier stats by row
-    # row_outlier_agg = (
-    #     df_outlier_ind
-    #     .group_by("row_index", maintain_order=True)
-    #     .agg(
-    #         outliers_n = pl.col("outliers_ind").sum().cast(pl.UInt32) # Count outliers per row
-    #     )
-    #     .with_columns(
-    #          # Prop relative to number of numeric columns checked for that row
-    #         outliers_prop = (pl.col("outliers_n") / pl.lit(len(num_cols))).round(4),
-    #         outliers_ind = (pl.col("outliers_n") > 0).cast(pl.UInt8)
-    #     )
-    #     .select(["row_index", "outliers_ind", "outliers_n", "outliers_prop"])
-    # )
-
-    # # Ensure row output covers all original rows, filling with 0 if no outliers
-    # all_rows_index = pl.DataFrame({"row_index": pl.int_range(1, df.height + 1, dtype=pl.UInt32)})
-    # row_outlier_final = (
-    #     all_rows_index
-    #     .join(row_outlier_agg, on="row_index", how="left")
-    #     .fill_null(0) # Rows with no outliers will have nulls after left join
-    #     # Ensure correct dtypes after fill_null
-    #     .with_columns(
-    #          pl.col("outliers_ind").cast(pl.UInt8),
-    #          pl.col("outliers_n").cast(pl.UInt32),
-    #          pl.col("outliers_prop").cast(pl.Float64)
-    #     )
-    #     .sort("row_index")
-    # )
-
     return col_outlier_ind, row_outlier_ind
 
-# Function to identify and analyze categorical levels
-def cat_stats(df: pl.DataFrame,
-              df_col_types:pl.DataFrame = None,
-              unique_n_threshold: int = 10,
-              unique_prop_threshold: float = None,
-              exclude_null_level: bool = True,
-              rare_level_n_threshold: int = 5,
-              rare_level_prop_threshold: float = None
-             ) -> Tuple[pl.DataFrame, pl.DataFrame]:
+# Helper to validate the rare level thresholds
+def _check_rare_thresholds(rare_level_n_threshold: int, rare_level_prop_threshold: float) -> None:
     """
-    Analyzes levels in categorical columns: frequency, Gini index, rare levels.
-    If `exclude_null_level` is True, Nulls are ignored; otherwise, they are treated as a level "NULL".
-    Rare levels are identified based on the minimum threshold derived from
-    `rare_level_n_threshold` and `rare_level_prop_threshold`.
-    Returns column-level frequency stats and row-level rare level indicators.
+    :raises ValueError: If thresholds are invalid.
     """
-    if df.is_empty() or df.height == 0 or df.width == 0:
-        raise ValueError("The DataFrame is empty.")
-
-    # Input validation for rare level thresholds
     if not isinstance(rare_level_n_threshold, int) or rare_level_n_threshold < 0:
         raise ValueError("rare_level_n_threshold must be a non-negative integer.")
     if rare_level_prop_threshold is not None and (not isinstance(rare_level_prop_threshold, float) or not (0 <= rare_level_prop_threshold < 1)):
          raise ValueError("rare_level_prop_threshold must be a float between 0 and 1 (exclusive of 1), or None.")
 
-    # Check if df_col_types is provided, if not, compute it
-    if df_col_types is None:
-        df_col_types = column_type_ident(df, unique_n_threshold=unique_n_threshold, unique_prop_threshold=unique_prop_threshold)
-
-    # Identify categorical columns
-    cat_cols = df_col_types.filter(pl.col("col_class") == "cat").get_column("column").to_list()
-
-    # Prepare empty results for non-categorical columns / empty input
-    non_cat_cols = df_col_types.filter(pl.col("col_class") != "cat").get_column("column").to_list()
-    non_cat_col_set = pl.DataFrame({"column": non_cat_cols}).with_columns(pl.col("column").cast(pl.String))
-    empty_row_stats = pl.DataFrame(schema={"row_index": pl.UInt32})
-
-    if len(cat_cols)==0: # No categorical columns found, return empty stats and print warning
-        print("Warning: No categorical columns found in the DataFrame.")
-        return non_cat_col_set, empty_row_stats
-
-    # Transform data to long-format, casting to String for consistent level handling
-    df_cat_long = (
-        df.select(cat_cols)
-        .with_columns(pl.all().cast(pl.String)) # cast all string to ensure numeric columns are treated as catagorical variables
-        .with_row_index("row_index", offset=1)
-        .unpivot(index="row_index", variable_name="column", value_name="level")
-    )
-
-    # Apply condition for whether to drop null levels
-    if exclude_null_level:
-        df_cat_long = df_cat_long.drop_nulls(subset=["level"])
-    else:
-        # Add a null as a level to the long format data
-        df_cat_long = df_cat_long.fill_null(value="NULL")
-
-    # Calculate frequency counts for each column levels
-    df_freq_counts = (
-        df_cat_long
-        .group_by(pl.all().exclude("row_index"))
-        .agg(pl.len().alias("level_freq")) 
-        .with_columns(level_prop=pl.col("level_freq")/pl.lit(df.height))
-    )
+# Helper to compute column-level categorical stats and rare levels from level frequency counts
+def _cat_freq_stats(df_freq_counts: pl.LazyFrame,
+                    non_cat_col_set: pl.DataFrame,
+                    cat_long_n: int,
+                    exclude_null_level: bool = True,
+                    rare_level_n_threshold: int = 5,
+                    rare_level_prop_threshold: float = None,
+                    keys: list = None,
+                    ) -> Tuple[pl.LazyFrame, pl.LazyFrame]:
+    """
+    `df_freq_counts` holds one (column, level, level_freq, level_prop) row per level and
+    `cat_long_n` the number of counted values across all categorical columns.
+    With group `keys`, rows are per group and column, and the proportion threshold of rare
+    levels applies to the values counted in each group (`cat_long_n` is not used).
+    Returns the lazy column-level stats and the lazy (column, rare_level list) frame.
+    """
+    group_cols = (keys or []) + ["column"]
 
     # Compute entropy statistics for each categorical column
     df_freq_disparity = (
         df_freq_counts
-        .sort(["column",  "level_freq"], descending=True) # Sorting is applied to get min and max by level_freq
-        .group_by("column", maintain_order=True)
+        .sort(group_cols + ["level_freq"], descending=True) # Sorting is applied to get min and max by level_freq
+        .group_by(group_cols, maintain_order=True)
         .agg(
             # entropy_bits = -1 * (pl.col("level_prop") * pl.col("level_prop").log(base=2)).sum(),
             gini_index = pl.lit(1) - (pl.col("level_prop")**2).sum(),
@@ -527,225 +822,721 @@ def cat_stats(df: pl.DataFrame,
     # Set threshold to total number of data rows (i.e. no no rare levels detected all levels)
     if(rare_level_n_threshold is None and rare_level_prop_threshold is None):
         rare_level_n_threshold_use = None
-        df_cat_rare_levels = pl.DataFrame(schema={"column":pl.String}) #, "rare_levels":pl.String, "rare_level_ind":int})
+        df_cat_rare_levels = df_freq_counts.select(group_cols).clear() #, "rare_levels":pl.String, "rare_level_ind":int})
     else:
-        n_threshold = rare_level_n_threshold if rare_level_n_threshold is not None else df_cat_long.height
-        prop_threshold= int(df_cat_long.height * rare_level_prop_threshold) if rare_level_prop_threshold is not None else df_cat_long.height
-        rare_level_n_threshold_use = min(n_threshold, prop_threshold) # Use the stricter (lower) threshold between count and proportion
+        long_n = pl.col("level_freq").sum().over(keys) if keys else pl.lit(cat_long_n) # Values counted (per group)
+        n_threshold = pl.lit(rare_level_n_threshold) if rare_level_n_threshold is not None else long_n
+        prop_threshold= (long_n * rare_level_prop_threshold).floor() if rare_level_prop_threshold is not None else long_n
+        rare_level_n_threshold_use = pl.min_horizontal(n_threshold, prop_threshold) # Use the stricter (lower) threshold between count and proportion
 
         # Identify rare levels applying a filter
         df_cat_rare_levels = (
             df_freq_counts
             .with_columns(
-                rare_level_ind=pl.when(pl.col("level_freq")<= rare_level_n_threshold_use)
+                rare_level_n_threshold_used=rare_level_n_threshold_use.cast(pl.UInt32), # cast to Int32 for consistency
+            )
+            .with_columns(
+                rare_level_ind=pl.when(pl.col("level_freq")<= pl.col("rare_level_n_threshold_used"))
                     .then(1).otherwise(0) 
             )
             .filter(rare_level_ind=1)
-            .group_by("column")
+            .group_by(group_cols)
             .agg(
                 rare_level_n = pl.col("level").len(),
                 rare_level=pl.col("level"),
+                rare_level_n_threshold_used=pl.col("rare_level_n_threshold_used").first(),
                 )
             .with_columns(
-                rare_level_ind=(pl.col("rare_level_n")>0).cast(pl.UInt8),
-                rare_level_n_threshold_used=pl.lit(rare_level_n_threshold_use).cast(pl.UInt32)) # cast to Int32 for consistency
+                rare_level_ind=(pl.col("rare_level_n")>0).cast(pl.UInt8))
+            .select(group_cols + ["rare_level_n", "rare_level", "rare_level_ind", "rare_level_n_threshold_used"])
         )
 
     # column-level categorical stats
     col_cat_freq = (
             df_freq_counts
             .sort("level_freq", descending=True)
-            .group_by("column", maintain_order=True)
+            .group_by(group_cols, maintain_order=True)
             .agg(
                 pl.col("level"),
                 pl.col("level_freq"),
                 pl.col("level_prop").round(4).alias("level_prop"),
                 )
-            .join(df_freq_disparity, on="column", how="full", coalesce=True)
-            .join(df_cat_rare_levels, on="column", how="full", coalesce=True)
-            .join(non_cat_col_set, on="column", how="full", coalesce=True)
-        )
-    
-    # row-level rare level
-    row_rare_level_ind = (
-        df_cat_long
-        .join((
-            df_cat_rare_levels
-            .explode("rare_level")
-            .rename({"rare_level":"level"})
-        ),  on=["column", "level"], how="full", coalesce=True)
-        .group_by("row_index")
-        .agg(rare_level_ind=(pl.col("rare_level_n").is_not_null().sum()>0).cast(pl.UInt8).fill_null(0))
+            .join(df_freq_disparity, on=group_cols, how="full", coalesce=True, nulls_equal=True) # Null group keys are a group
+            .join(df_cat_rare_levels, on=group_cols, how="full", coalesce=True, nulls_equal=True)
+            .join(non_cat_col_set.lazy(), on="column", how="full", coalesce=True)
         )
 
-    return col_cat_freq, row_rare_level_ind
+    return col_cat_freq, df_cat_rare_levels
 
-# --- Main Profile Function ---
-def profile(df:pl.DataFrame,
+# Function to identify and analyze categorical levels
+def cat_stats(df: FrameLike,
+              df_col_types:pl.DataFrame = None,
+              unique_n_threshold: int = 10,
+              unique_prop_threshold: float = None,
+              exclude_null_level: bool = True,
+              rare_level_n_threshold: int = 5,
+              rare_level_prop_threshold: float = None,
+              by: Union[str, list] = None,
+             ) -> Tuple[pl.DataFrame, pl.DataFrame]:
+    """
+    Analyzes levels in categorical columns: frequency, Gini index, rare levels.
+    If `exclude_null_level` is True, Nulls are ignored; otherwise, they are treated as a level "NULL".
+    Rare levels are identified based on the minimum threshold derived from
+    `rare_level_n_threshold` and `rare_level_prop_threshold`.
+    Returns column-level frequency stats and row-level rare level indicators.
 
-            # Col Classification thresholds
-            unique_n_threshold:int = 10,
-            unique_prop_threshold:float = None,
+    With `by`, levels are counted per group of the `by` columns in one group_by pass (columns are
+    classified once over the whole frame): one row per group and categorical column, with the group
+    rows in `group_n`. Rare levels are found within each group (the proportion threshold applies to
+    the values of the group), and rows are flagged against the rare levels of their group.
+    """
+    df_n, _ = _frame_dims(df)
 
-            # Toggles for sections
-            get_miss_stats:bool = True,
-            get_dup_stats:bool = True,
-            get_num_stats:bool = True,
-            get_outlier_stats:bool = True,
-            get_cat_stats:bool = True,
+    # Input validation for rare level thresholds
+    _check_rare_thresholds(rare_level_n_threshold, rare_level_prop_threshold)
 
-            # Num stats thresholds
-            skew_threshold: float = 3.0,
-            kurtosis_threshold: float = 3.0,
-            sparsity_threshold: float = 0.5,
-            cv_threshold: float = 1.0,
+    # Check if df_col_types is provided, if not, compute it
+    if df_col_types is None:
+        df_col_types = column_type_ident(df, unique_n_threshold=unique_n_threshold, unique_prop_threshold=unique_prop_threshold)
 
-            # Outlier stats threshold multiplier
-            IQR_multi:float = 5.0,
+    # Identify categorical columns
+    cat_cols = df_col_types.filter(pl.col("col_class") == "cat").get_column("column").to_list()
 
-            # Cat stats thresholds/options
-            exclude_null_level: bool = True,
-            rare_level_n_threshold: int = 5,
-            rare_level_prop_threshold: float = None
+    # Prepare empty results for non-categorical columns / empty input
+    non_cat_cols = df_col_types.filter(pl.col("col_class") != "cat").get_column("column").to_list()
+    non_cat_col_set = pl.DataFrame({"column": non_cat_cols}).with_columns(pl.col("column").cast(pl.String))
+    empty_row_stats = pl.DataFrame(schema={"row_index": pl.UInt32})
 
-            ) -> Tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
-    """
-    Generates a comprehensive data profile for a Polars DataFrame.
+    if len(cat_cols)==0: # No categorical columns found, return empty stats and print warning
+        print("Warning: No categorical columns found in the DataFrame.")
+        return non_cat_col_set, empty_row_stats
 
-    Computes statistics for columns and rows including:
-    - Column type classification (numeric, categorical, time, etc.)
-    - Missing data proportions (column-wise and row-wise)
-    - Duplicate indicators (column-wise and row-wise, based on values)
-    - Numeric column statistics (mean, std, quantiles, skew, kurtosis, etc.)
-    - Outlier detection for numeric columns (IQR method on scaled data)
-    - Categorical column analysis (level frequencies, Gini, rare levels)
+    if by is not None:
+        return _cat_stats_by(df, _group_keys(df.lazy().collect_schema(), by), df_col_types,
+                             exclude_null_level=exclude_null_level,
+                             rare_level_n_threshold=rare_level_n_threshold,
+                             rare_level_prop_threshold=rare_level_prop_threshold)
+
+    # Count levels per column on the native dtype in one wide-form pass
+    # (Categorical/Enum columns are grouped on their physical codes, no String is built per cell)
+    level_counts = (
+        df.lazy()
+        .select(pl.col(c).value_counts(sort=False, name="level_freq").implode().alias(c) for c in cat_cols)
+        .pipe(_collect, _engine(df))
+    )
 
-    :param df: Input Polars DataFrame.
-    :param unique_n_threshold: Max unique values for 'categorical' classification.
-    :param unique_prop_threshold: Proportion unique values threshold for 'categorical'.
-    :param get_miss_stats: Whether to compute missing value statistics.
-    :param get_dup_stats: Whether to compute duplicate statistics.
-    :param get_num_stats: Whether to compute numeric descriptive statistics.
-    :param get_outlier_stats: Whether to compute numeric outlier statistics.
-    :param get_cat_stats: Whether to compute categorical statistics.
-    :param skew_threshold: Absolute threshold to flag high skewness.
-    :param kurtosis_threshold: Absolute threshold to flag high kurtosis.
-    :param sparsity_threshold: Threshold (proportion of zeros) to flag high sparsity.
-    :param cv_threshold: Absolute threshold to flag high coefficient of variation.
-    :param IQR_multi: Multiplier for IQR range in outlier detection.
-    :param exclude_null_level: If True, Nulls are ignored in categorical analysis.
-    :param rare_level_n_threshold: Absolute count threshold for rare category levels.
-    :param rare_level_prop_threshold: Proportion threshold for rare category levels.
+    # Cast only the distinct levels to String for a consistent level output
+    native_levels = {}
+    freq_counts = []
+    for c in cat_cols:
+        col_levels = level_counts[c].explode().struct.unnest()
+        if exclude_null_level:
+            col_levels = col_levels.drop_nulls(c)
+        col_levels = col_levels.with_columns(
+            level=pl.col(c).cast(pl.String).fill_null("NULL") # Add a null as a level if not excluded
+        )
+        native_levels[c] = col_levels
+        freq_counts.append(
+            col_levels
+            .group_by("level", maintain_order=True)
+            .agg(pl.col("level_freq").sum().cast(pl.UInt32))
+            .select(pl.lit(c, dtype=pl.String).alias("column"), "level", "level_freq")
+        )
 
-    :return: A tuple containing three DataFrames:
-        1. data_profile: Overall summary statistics for the dataset.
-        2. col_profile: Detailed statistics for each column.
-        3. row_profile: Statistics for each row.
-    :rtype: Tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]
-    :raises ValueError: If the DataFrame is empty or thresholds are invalid.
-    """
-    if df.is_empty() or df.height == 0 or df.width == 0:
-        raise ValueError("The DataFrame is empty.")
+    # Calculate frequency counts for each column levels
+    df_freq_counts = (
+        pl.concat(freq_counts)
+        .lazy()
+        .with_columns(level_prop=pl.col("level_freq")/pl.lit(df_n))
+    )
+
+    # Number of values counted (Nulls included only as the "NULL" level)
+    cat_long_n = sum(col_levels["level_freq"].sum() for col_levels in native_levels.values())
 
-    # --- 1. Initial Column Classification ---
-    df_col_types = column_type_ident(
-        df=df,
-        unique_n_threshold=unique_n_threshold,
-        unique_prop_threshold=unique_prop_threshold
+    # Column-level categorical stats and rare levels from the frequency counts
+    col_cat_freq, df_cat_rare_levels = _cat_freq_stats(
+        df_freq_counts, non_cat_col_set, cat_long_n,
+        exclude_null_level=exclude_null_level,
+        rare_level_n_threshold=rare_level_n_threshold,
+        rare_level_prop_threshold=rare_level_prop_threshold
+    )
+    col_cat_freq, df_cat_rare_levels = _collect_all([col_cat_freq, df_cat_rare_levels], "auto")
+
+    # row-level rare level: check each column against its rare native values with is_in
+    rare_levels = dict(df_cat_rare_levels.select("column", "rare_level").iter_rows()) if "rare_level" in df_cat_rare_levels.columns else {}
+    rare_flags = [pl.lit(False)]
+    for c, levels in rare_levels.items():
+        rare_values = native_levels[c].filter(pl.col("level").is_in(levels))[c]
+        rare_flag = pl.col(c).is_in(rare_values.drop_nulls().implode()).fill_null(False)
+        if rare_values.null_count() > 0: # Null level is rare (exclude_null_level=False)
+            rare_flag = rare_flag | pl.col(c).is_null()
+        rare_flags.append(rare_flag)
+
+    row_rare_level_ind = df.lazy().with_row_index("row_index", offset=1)
+    if exclude_null_level: # Rows without any non-null categorical value have no levels
+        row_rare_level_ind = row_rare_level_ind.filter(pl.any_horizontal(pl.col(cat_cols).is_not_null()))
+    row_rare_level_ind = (
+        row_rare_level_ind
+        .select("row_index", rare_level_ind=pl.any_horizontal(rare_flags).cast(pl.UInt8))
+        .pipe(_collect, _engine(df))
     )
-    num_cols = df_col_types.filter(pl.col("col_class") == "num").get_column("column").to_list()
-    cat_cols = df_col_types.filter(pl.col("col_class") == "cat").get_column("column").to_list()
 
-    # --- Initialize Profile Components ---
-    # Base column profile starts with type identification
-    col_profile_list = [df_col_types]
-    row_profile_list = [] # Start empty, add row index later if needed
-
-    # Schemas for empty results if sections are skipped
-    col_empty_df = pl.DataFrame(schema={"column":pl.String})
-    row_empty_df = pl.DataFrame(schema={"row_index":pl.UInt32}) # Ensure correct schema for empty case
-    # col_empty_df = pl.DataFrame({"column": df.columns}) # Use actual columns for joins
-    # row_empty_df = pl.DataFrame({"row_index":pl.UInt32})
-
-    # --- 2. Compute Optional Statistics ---
-    # Missing Stats
-    col_miss = col_empty_df
-    row_miss = row_empty_df
-    if get_miss_stats:
-        col_miss = column_missing_prop(df)
-        row_miss = row_missing_prop(df)
-        col_profile_list.append(col_miss)
-        row_profile_list.append(row_miss)
+    return col_cat_freq, row_rare_level_ind
 
-    # Duplicate Stats
-    col_dup = col_empty_df
-    row_dup = row_empty_df
-    if get_dup_stats:
-        col_dup = column_dup_ind(df)
-        row_dup = row_dup_ind(df) # Assumes row_index is generated internally or joined
-        col_profile_list.append(col_dup)
-        row_profile_list.append(row_dup)
+# Helper to compute cat_stats per group
+def _cat_stats_by(df: FrameLike,
+                  keys: list,
+                  df_col_types: pl.DataFrame,
+                  exclude_null_level: bool = True,
+                  rare_level_n_threshold: int = 5,
+                  rare_level_prop_threshold: float = None,
+                  ) -> Tuple[pl.DataFrame, pl.DataFrame]:
+    col_classes = dict(df_col_types.select("column", "col_class").iter_rows())
+    cat_cols = [c for c, col_class in col_classes.items() if col_class == "cat" and c not in keys]
+    group_levels = _group_profile(df, keys, col_classes, get_miss_stats=False, get_num_stats=False,
+                                  get_outlier_stats=False, exclude_null_level=exclude_null_level)
+    col_cat_freq = _group_cat_stats(group_levels, keys, exclude_null_level=exclude_null_level,
+                                    rare_level_n_threshold=rare_level_n_threshold,
+                                    rare_level_prop_threshold=rare_level_prop_threshold)
+
+    return col_cat_freq, _group_row_rare_ind(df, keys, cat_cols, col_cat_freq, exclude_null_level=exclude_null_level)
+
+# Helper to flag the rows holding a rare level of their group
+def _group_row_rare_ind(df: FrameLike,
+                        keys: list,
+                        cat_cols: list,
+                        col_cat_freq: pl.DataFrame,
+                        exclude_null_level: bool = True,
+                        ) -> pl.DataFrame:
+    # row-level rare level: check each (group, level) pair against the rare levels of the groups
+    rare_flags = [pl.lit(False)]
+    if "rare_level" in col_cat_freq.columns:
+        rare_levels = col_cat_freq.select(*keys, "column", "rare_level").explode("rare_level").drop_nulls("rare_level")
+        for c in cat_cols:
+            rare_pairs = rare_levels.filter(pl.col("column") == c).select(pl.struct(*keys, pl.col("rare_level").alias(c)).alias(c))[c]
+            if rare_pairs.len() == 0:
+                continue
+            level = pl.col(c).cast(pl.String) if exclude_null_level else pl.col(c).cast(pl.String).fill_null("NULL")
+            rare_flags.append(pl.struct(*keys, level.alias(c)).is_in(rare_pairs.implode()))
+
+    row_rare_level_ind = df.lazy().with_row_index("row_index", offset=1)
+    if exclude_null_level: # Rows without any non-null categorical value have no levels
+        row_rare_level_ind = row_rare_level_ind.filter(pl.any_horizontal(pl.col(cat_cols).is_not_null()))
+    row_rare_level_ind = (
+        row_rare_level_ind
+        .select("row_index", rare_level_ind=pl.any_horizontal(rare_flags).cast(pl.UInt8))
+        .pipe(_collect, _engine(df))
+    )
 
+    return row_rare_level_ind
 
-    # Numeric Stats
-    col_num = col_empty_df
-    if get_num_stats and len(num_cols)>0:
-        col_num = num_stats(
-            df=df, df_col_types=df_col_types,
-            skew_threshold=skew_threshold, kurtosis_threshold=kurtosis_threshold,
-            sparsity_threshold=sparsity_threshold, cv_threshold=cv_threshold
+# Helper to pick the columns profiled by top_k_stats when none are given
+def _top_k_default_cols(df_col_types: pl.DataFrame, schema: pl.Schema) -> list:
+    """
+    High-cardinality ("other") String, Categorical, Enum and Binary columns:
+    the columns that get no level frequencies from cat_stats.
+    """
+    other_cols = df_col_types.filter(pl.col("col_class") == "other").get_column("column").to_list()
+    return [
+        c for c in other_cols
+        if schema[c] in (pl.String, pl.Binary) or isinstance(schema[c], (pl.Categorical, pl.Enum))
+    ]
+
+# Helper to shrink a Misra-Gries counter frame back to sketch_size entries
+def _top_k_compress(counters: pl.DataFrame, sketch_size: int) -> Tuple[pl.DataFrame, int]:
+    """
+    Subtracts the (sketch_size + 1)-th largest count from every counter and drops the
+    counters that reach zero. Returns the counters and the subtracted count, which is
+    added to the error bound of every value.
+    """
+    if counters.height <= sketch_size:
+        return counters, 0
+    decrement = counters["count"].top_k(sketch_size + 1).min()
+    return counters.filter(pl.col("count") > decrement).with_columns(pl.col("count") - decrement), decrement
+
+# Function to find the most frequent values of high-cardinality columns with bounded memory
+def top_k_stats(df: FrameLike,
+                df_col_types: pl.DataFrame = None,
+                k: int = 10,
+                sketch_size: int = None,
+                columns: list = None,
+                batch_size: int = 1_000_000,
+                unique_n_threshold: int = 10,
+                unique_prop_threshold: float = None,
+                exclude_null_level: bool = True
+                ) -> pl.DataFrame:
+    """
+    Reports the `k` most frequent values (heavy hitters) of high-cardinality columns using a
+    Misra-Gries frequency sketch of `sketch_size` counters per column, so memory does not grow
+    with the number of distinct values. The data is read in batches of `batch_size` rows and
+    each batch's value counts are merged into the sketch.
+
+    Each reported `top_level_freq` is a lower bound of the true frequency, which is at most
+    `top_level_freq_error` higher. The error is at most (number of values) / (sketch_size + 1),
+    and 0 (`top_k_exact_ind` = 1) when the column has no more than `sketch_size` distinct values.
+    Any value more frequent than `top_level_freq_error` is guaranteed to be in the sketch.
+    `top_other_n` counts the values outside the reported levels (an upper bound, by at most
+    k * `top_level_freq_error`).
+
+    :param df: A Polars DataFrame or LazyFrame.
+    :param df_col_types: Output of `column_type_ident`, computed if not provided.
+    :param k: Number of most frequent values reported per column.
+    :param sketch_size: Number of counters kept per column (default: 10 * k). Must be at least k.
+    :param columns: Columns to profile (default: the "other" String, Categorical, Enum and Binary columns).
+    :param batch_size: Number of rows counted per batch.
+    :param unique_n_threshold: Passed to `column_type_ident` if df_col_types is None.
+    :param unique_prop_threshold: Passed to `column_type_ident` if df_col_types is None.
+    :param exclude_null_level: If True, Nulls are ignored; otherwise, they are counted as a level "NULL".
+    :return: A DataFrame with one row per column of the frame; columns not profiled have null top-k stats.
+    :rtype: pl.DataFrame
+    :raises ValueError: If k, sketch_size, batch_size or columns are invalid.
+    """
+    df_n, _ = _frame_dims(df)
+
+    if not isinstance(k, int) or k <= 0:
+        raise ValueError("k must be a positive integer.")
+    sketch_size = 10 * k if sketch_size is None else sketch_size
+    if not isinstance(sketch_size, int) or sketch_size < k:
+        raise ValueError("sketch_size must be an integer of at least k, or None.")
+    if not isinstance(batch_size, int) or batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer.")
+
+    schema = df.lazy().collect_schema()
+    if columns is None:
+        if df_col_types is None:
+            df_col_types = column_type_ident(df, unique_n_threshold=unique_n_threshold, unique_prop_threshold=unique_prop_threshold)
+        top_cols = _top_k_default_cols(df_col_types, schema)
+    else:
+        missing = [c for c in columns if c not in schema]
+        if missing:
+            raise ValueError(f"Columns not found in the DataFrame: {missing}.")
+        top_cols = list(columns)
+
+    non_top_col_set = pl.DataFrame({"column": [c for c in schema if c not in top_cols]}, schema={"column": pl.String})
+
+    if len(top_cols) == 0: # No columns to profile, return empty stats and print warning
+        print("Warning: No high-cardinality columns found for top-k stats.")
+        return non_top_col_set
+
+    # Read the columns in batches: slices of a DataFrame, streamed batches of a LazyFrame
+    if isinstance(df, pl.DataFrame):
+        batches = df.select(top_cols).iter_slices(batch_size)
+    else:
+        batches = df.select(top_cols).collect_batches(chunk_size=batch_size, engine="streaming")
+
+    # Misra-Gries counters (native value, count), total decrement and number of counted values per column
+    counters = {c: None for c in top_cols}
+    errors = {c: 0 for c in top_cols}
+    counted_n = {c: 0 for c in top_cols}
+    for batch in batches:
+        batch_counts = batch.select(
+            pl.col(c).value_counts(sort=False, name="count").implode().alias(c) for c in top_cols
+        )
+        for c in top_cols:
+            col_counts = batch_counts[c].explode().struct.unnest().with_columns(pl.col("count").cast(pl.UInt64))
+            if exclude_null_level:
+                col_counts = col_counts.drop_nulls(c)
+            counted_n[c] += col_counts["count"].sum()
+            if counters[c] is not None: # Merge the batch counts into the sketch
+                col_counts = pl.concat([counters[c], col_counts]).group_by(c).agg(pl.col("count").sum())
+            counters[c], decrement = _top_k_compress(col_counts, sketch_size)
+            errors[c] += decrement
+
+    # Report the k largest counters of each column, with levels cast to String
+    top_k_rows = []
+    for c in top_cols:
+        top = (
+            counters[c]
+            .with_columns(level=pl.col(c).cast(pl.String).fill_null("NULL")) # Add a null as a level if not excluded
+            .sort(["count", "level"], descending=[True, False])
+            .head(k)
         )
-        # Select only stat columns to avoid joining 'column' twice
-        col_profile_list.append(col_num)
+        top_k_rows.append({
+            "column": c,
+            "top_level": top["level"].to_list(),
+            "top_level_freq": top["count"].to_list(),
+            "top_level_prop": [round(n / df_n, 4) for n in top["count"]],
+            "top_level_freq_error": errors[c],
+            "top_other_n": counted_n[c] - top["count"].sum(),
+            "top_k_exact_ind": int(errors[c] == 0),
+        })
 
-    # Outlier Stats
-    col_outlier = col_empty_df
-    row_outlier = row_empty_df
-    if get_outlier_stats and len(num_cols)>0:
-        col_outlier, row_outlier = num_outlier_stats(
-            df=df, df_col_types=df_col_types, IQR_multi=IQR_multi
-        )
-        col_profile_list.append(col_outlier)
-        row_profile_list.append(row_outlier)
-
-    # Categorical Stats
-    col_cat = col_empty_df
-    row_rare = row_empty_df
-    if get_cat_stats and len(cat_cols):
-        col_cat, row_rare = cat_stats(
-            df=df, df_col_types=df_col_types,
-            exclude_null_level=exclude_null_level,
-            rare_level_n_threshold=rare_level_n_threshold,
-            rare_level_prop_threshold=rare_level_prop_threshold
+    col_top_k = pl.DataFrame(top_k_rows, schema={
+        "column": pl.String,
+        "top_level": pl.List(pl.String),
+        "top_level_freq": pl.List(pl.UInt64),
+        "top_level_prop": pl.List(pl.Float64),
+        "top_level_freq_error": pl.UInt64,
+        "top_other_n": pl.UInt64,
+        "top_k_exact_ind": pl.UInt8,
+    })
+
+    # add empty set for the other columns
+    return col_top_k.join(non_top_col_set, on="column", how="full", coalesce=True)
+
+# Helper to build one struct of column statistics per column, for group_by / group_by_dynamic aggregations
+def _group_col_aggs(schema: pl.Schema,
+                    cols: list,
+                    col_classes: dict,
+                    get_miss_stats: bool = True,
+                    get_num_stats: bool = True,
+                    get_outlier_stats: bool = True,
+                    get_cat_stats: bool = True,
+                    IQR_multi: float = 5.0,
+                    exclude_null_level: bool = True,
+                    ) -> list:
+    """
+    Per group: the missing count; for numeric columns the base stats of `_num_col_aggs` ("num")
+    and the outliers, with bounds from the quartiles of the group; for categorical columns the
+    level counts ("levels", most frequent first). Columns without any statistic are left out.
+    """
+    num_cols = [c for c in cols if col_classes[c] == "num"]
+
+    # Compare numeric values on the common supertype, as num_stats does
+    value_dtype = pl.DataFrame(schema={c: schema[c] for c in num_cols}).unpivot()["value"].dtype if num_cols else pl.Float64
+
+    aggs = []
+    for c in cols:
+        fields = []
+        if get_miss_stats:
+            fields.append(pl.col(c).null_count().cast(pl.UInt32).alias("missing_n"))
+        if col_classes[c] == "num":
+            if get_num_stats:
+                fields.append(_num_col_aggs(c, value_dtype).alias("num"))
+            if get_outlier_stats:
+                value = pl.col(c).cast(value_dtype)
+                finite = value.filter(value.is_finite())
+                # No shared sort here: each reference of an aggregation expression is evaluated again per group
+                lb, ub = _outlier_bound_exprs(IQR_multi, *(finite.quantile(q) for q, name in _NUM_QUANTILES if name in ("25th", "50th", "75th")))
+                fields += [lb, ub, finite.is_between(lb, ub, closed="both").not_().sum().cast(pl.UInt32).alias("outliers_n")]
+        elif col_classes[c] == "cat" and get_cat_stats:
+            levels = pl.col(c).drop_nulls() if exclude_null_level else pl.col(c)
+            fields.append(levels.value_counts(sort=True, name="level_freq").implode().alias("levels"))
+        if len(fields) > 0:
+            aggs.append(pl.struct(fields).alias(c))
+    return aggs
+
+# Helper to reshape the (groups x columns) result of `_group_col_aggs` to one row per group and column
+def _group_stats_long(grouped: pl.DataFrame,
+                      keys: list,
+                      n_col: str,
+                      cols: list,
+                      col_classes: dict,
+                      skew_threshold: float = 3.0,
+                      kurtosis_threshold: float = 3.0,
+                      sparsity_threshold: float = 0.5,
+                      cv_threshold: float = 1.0,
+                      ) -> pl.DataFrame:
+    """
+    `n_col` holds the number of rows of each group. Proportions are relative to it, and
+    levels are cast to String (Null as "NULL") as in cat_stats.
+    """
+    group_cols = []
+    for c in cols:
+        if c not in grouped.columns:
+            continue
+        col_groups = grouped.select(*keys, n_col, pl.lit(c, dtype=pl.String).alias("column"), pl.col(c).struct.unnest())
+        if "num" in col_groups.columns:
+            col_groups = _num_stats_derive(
+                col_groups.unnest("num"),
+                skew_threshold=skew_threshold, kurtosis_threshold=kurtosis_threshold,
+                sparsity_threshold=sparsity_threshold, cv_threshold=cv_threshold
+            )
+        if "levels" in col_groups.columns:
+            col_groups = col_groups.with_columns(
+                level=pl.col("levels").list.eval(pl.element().struct.field(c).cast(pl.String).fill_null("NULL")),
+                level_freq=pl.col("levels").list.eval(pl.element().struct.field("level_freq").cast(pl.UInt32)),
+            ).drop("levels")
+        group_cols.append(col_groups)
+
+    if len(group_cols) == 0:
+        return grouped.select(*keys, n_col).clear().with_columns(column=pl.lit(None, dtype=pl.String), col_class=pl.lit(None, dtype=pl.String))
+
+    group_profile = pl.concat(group_cols, how="diagonal_relaxed").with_columns(
+        col_class=pl.col("column").replace_strict(col_classes, return_dtype=pl.String)
+    )
+    if "missing_n" in group_profile.columns:
+        group_profile = group_profile.with_columns(missing_prop=(pl.col("missing_n") / pl.col(n_col)).round(4))
+    if "outliers_n" in group_profile.columns:
+        group_profile = group_profile.with_columns(
+            outliers_ind=(pl.col("outliers_n") > 1).cast(pl.UInt8), # As num_outlier_stats
+            outliers_prop=pl.col("outliers_n") / pl.col(n_col),
         )
-        col_profile_list.append(col_cat)
-        row_profile_list.append(row_rare)
 
-    # --- 3. Assemble Column and Row Profiles ---
+    col_order = keys + ["column", "col_class", n_col, "missing_n", "missing_prop"] + _NUM_STAT_COLS + ["outlier_LB", "outlier_UB", "outliers_ind", "outliers_n", "outliers_prop", "level", "level_freq"]
+    return group_profile.select(c for c in col_order if c in group_profile.columns).sort(keys, maintain_order=True)
+
+# Helper to validate the group columns of `by`
+def _group_keys(schema: pl.Schema, by) -> list:
+    """
+    :raises ValueError: If `by` is empty or not columns of the frame.
+    """
+    keys = [by] if isinstance(by, str) else list(by)
+    missing = [k for k in keys if k not in schema]
+    if len(keys) == 0 or missing:
+        raise ValueError(f"by must be one or more columns of the DataFrame; not found: {missing}.")
+    return keys
+
+# Helper to compute column statistics per group in one group_by pass
+def _group_profile(df: FrameLike,
+                   keys: list,
+                   col_classes: dict,
+                   skew_threshold: float = 3.0,
+                   kurtosis_threshold: float = 3.0,
+                   sparsity_threshold: float = 0.5,
+                   cv_threshold: float = 1.0,
+                   **section_params) -> pl.DataFrame:
+    """
+    Long frame of `_group_stats_long` for all columns but the group keys, with the number of
+    rows of each group in "group_n". `section_params` are the toggles and options of `_group_col_aggs`.
+    """
+    schema = df.lazy().collect_schema()
+    cols = [c for c in schema.names() if c not in keys]
+    grouped = (
+        df.lazy()
+        .group_by(keys)
+        .agg(pl.len().cast(pl.UInt32).alias("group_n"), *_group_col_aggs(schema, cols, col_classes, **section_params))
+        .pipe(_collect, _engine(df))
+    )
+    return _group_stats_long(
+        grouped, keys, "group_n", cols, col_classes,
+        skew_threshold=skew_threshold, kurtosis_threshold=kurtosis_threshold,
+        sparsity_threshold=sparsity_threshold, cv_threshold=cv_threshold
+    )
+
+# Helper to compute the categorical column stats per group from the level counts of `_group_profile`
+def _group_cat_stats(group_levels: pl.DataFrame,
+                     keys: list,
+                     exclude_null_level: bool = True,
+                     rare_level_n_threshold: int = 5,
+                     rare_level_prop_threshold: float = None,
+                     ) -> pl.DataFrame:
+    """
+    `group_levels` has the keys, column, group_n, level and level_freq columns of the
+    categorical columns. Level proportions are relative to the rows of each group.
+    """
+    df_freq_counts = (
+        group_levels
+        .select(*keys, "column", "group_n", "level", "level_freq")
+        .explode("level", "level_freq")
+        .drop_nulls("level_freq") # Groups without any counted value
+        .with_columns(level_prop=pl.col("level_freq") / pl.col("group_n"))
+        .drop("group_n")
+    )
+    col_cat_freq, _ = _cat_freq_stats(
+        df_freq_counts.lazy(), pl.DataFrame(schema={"column": pl.String}), None,
+        exclude_null_level=exclude_null_level,
+        rare_level_n_threshold=rare_level_n_threshold,
+        rare_level_prop_threshold=rare_level_prop_threshold,
+        keys=keys
+    )
+    return (
+        group_levels.select(*keys, "column", "group_n")
+        .join(col_cat_freq.collect(), on=keys + ["column"], how="left", nulls_equal=True)
+    )
+
+# Helper to flag the rows holding an outlier of their group, from the group bounds of `_group_profile`
+def _group_row_outlier_ind(df: FrameLike,
+                           keys: list,
+                           num_cols: list,
+                           group_profile: pl.DataFrame,
+                           ) -> pl.DataFrame:
+    schema = df.lazy().collect_schema()
+    value_dtype = pl.DataFrame(schema={c: schema[c] for c in num_cols}).unpivot()["value"].dtype
+
+    # Bounds of each group, wide: one (LB, UB) pair of columns per numeric column
+    bounds = (
+        group_profile
+        .filter(pl.col("column").is_in(num_cols))
+        .select(*keys, "column", "outlier_LB", "outlier_UB")
+        .pivot(on="column", index=keys, values=["outlier_LB", "outlier_UB"], separator="|")
+    )
+    outliers = []
+    for c in num_cols:
+        value = pl.col(c).cast(value_dtype)
+        lb, ub = pl.col(f"outlier_LB|{c}"), pl.col(f"outlier_UB|{c}")
+        outliers.append(value.is_finite() & value.is_between(lb, ub, closed="both").not_())
+
+    # As num_outlier_stats, for rows with at least one finite numeric value
+    return (
+        df.lazy()
+        .with_row_index("row_index", offset=1)
+        .filter(pl.any_horizontal(pl.col(c).cast(value_dtype).is_finite() for c in num_cols))
+        .join(bounds.lazy(), on=keys, how="left", nulls_equal=True, maintain_order="left")
+        .select("row_index", outliers_n=pl.sum_horizontal(outliers).cast(pl.UInt32))
+        .with_columns(
+            outliers_prop=pl.col("outliers_n")/pl.lit(len(num_cols)),
+            outliers_ind=(pl.col("outliers_n")>0).cast(pl.UInt8)
+        )
+        .select(["row_index", "outliers_ind", "outliers_n", "outliers_prop"])
+        .pipe(_collect, _engine(df))
+    )
+
+# Function to profile columns per time window
+def window_stats(df: FrameLike,
+                 time_column: str,
+                 every: str,
+                 period: str = None,
+                 offset: str = None,
+                 df_col_types: pl.DataFrame = None,
+                 unique_n_threshold: int = 10,
+                 unique_prop_threshold: float = None,
+                 skew_threshold: float = 3.0,
+                 kurtosis_threshold: float = 3.0,
+                 sparsity_threshold: float = 0.5,
+                 cv_threshold: float = 1.0,
+                 IQR_multi: float = 5.0,
+                 exclude_null_level: bool = True,
+                 ) -> pl.DataFrame:
+    """
+    Computes column statistics per time window of `time_column` in one `group_by_dynamic` pass,
+    to follow data quality over time. Columns are classified once over the whole frame.
+
+    For each window and column (except `time_column`): the missing count and proportion; for
+    numeric columns the num_stats statistics and the outliers, with bounds from the quartiles of
+    the window (as `num_outlier_stats` on the window rows); for categorical columns the levels
+    and their frequencies (most frequent first). Rows with a Null `time_column` are left out.
+
+    :param df: Input Polars DataFrame or LazyFrame.
+    :param time_column: Date/Datetime (or integer) column defining the windows.
+    :param every: Interval between windows, e.g. "1h", "1d", "1w", "1mo" (see `group_by_dynamic`).
+    :param period: Length of the windows (default: `every`).
+    :param offset: Offset of the window starts.
+    :param df_col_types: Column classification, computed if not given.
+    :param IQR_multi: Multiplier for IQR range in outlier detection.
+    :param exclude_null_level: If True, Nulls are not counted as a categorical level.
+    :return: A long DataFrame with one row per window and column: window_start, window_end,
+        column, col_class, window_n (rows in the window), missing_n, missing_prop, the num_stats
+        columns, outlier_LB, outlier_UB, outliers_ind, outliers_n, outliers_prop, level and level_freq.
+    :rtype: pl.DataFrame
+    :raises ValueError: If time_column is not a column or a parameter is invalid.
+    """
+    _frame_dims(df)
+    schema = df.lazy().collect_schema()
+    if time_column not in schema:
+        raise ValueError(f"time_column '{time_column}' is not a column of the DataFrame.")
+    if not isinstance(IQR_multi, (int, float)) or IQR_multi <= 0:
+         raise ValueError("IQR_multi must be a positive number.")
+
+    # Check if df_col_types is provided, if not, compute it
+    if df_col_types is None:
+        df_col_types = column_type_ident(df, unique_n_threshold=unique_n_threshold, unique_prop_threshold=unique_prop_threshold)
+    col_classes = dict(df_col_types.select("column", "col_class").iter_rows())
+    cols = [c for c in schema.names() if c != time_column]
+
+    windows = (
+        df.lazy()
+        .filter(pl.col(time_column).is_not_null())
+        .sort(time_column)
+        .group_by_dynamic(time_column, every=every, period=period, offset=offset,
+                          include_boundaries=True, closed="left", label="left", start_by="window")
+        .agg(pl.len().cast(pl.UInt32).alias("window_n"),
+             *_group_col_aggs(schema, cols, col_classes, IQR_multi=IQR_multi, exclude_null_level=exclude_null_level))
+        .rename({"_lower_boundary": "window_start", "_upper_boundary": "window_end"})
+        .drop(time_column)
+        .pipe(_collect, _engine(df))
+    )
+
+    return _group_stats_long(
+        windows, ["window_start", "window_end"], "window_n", cols, col_classes,
+        skew_threshold=skew_threshold, kurtosis_threshold=kurtosis_threshold,
+        sparsity_threshold=sparsity_threshold, cv_threshold=cv_threshold
+    )
+
+# Helper to aggregate a row-level column of the section outputs, or None when the section was not computed
+def _row_col_agg(row_profile_list: list, col: str, agg: str = "max"):
+    return next((getattr(row_df[col], agg)() for row_df in row_profile_list if col in row_df.columns), None)
+
+# Bits of the packed row flags of `row_output="bitmask"`
+ROW_FLAG_BITS = {"missing": 1, "dup": 2, "outlier": 4, "rare_level": 8}
+
+# Row-level indicator of each row flag, in the section outputs
+_ROW_FLAG_INDICATORS = {"missing": pl.col("missing_n") > 0, "dup": pl.col("dup_ind") == 1,
+                        "outlier": pl.col("outliers_ind") == 1, "rare_level": pl.col("rare_level_ind") == 1}
+_ROW_FLAG_COLS = {"missing": "missing_n", "dup": "dup_ind", "outlier": "outliers_ind", "rare_level": "rare_level_ind"}
+
+# Helper to pack the row-level indicators of the section outputs into one flags column
+def _row_flags(row_profile_list: list, n_rows: int) -> pl.Series:
+    """
+    Each section output sets its bit at the position of its flagged rows, so outputs covering
+    only some rows (outliers, rare levels) need no alignment.
+    """
+    flags = pl.zeros(n_rows, dtype=pl.UInt8, eager=True)
+    for row_df in row_profile_list:
+        for flag, col in _ROW_FLAG_COLS.items():
+            if col not in row_df.columns:
+                continue
+            idx = row_df.filter(_ROW_FLAG_INDICATORS[flag])["row_index"] - 1
+            flags = flags.scatter(idx, flags.gather(idx) | ROW_FLAG_BITS[flag])
+    return flags.alias("row_flags")
+
+# Helper to build the row profile in the requested layout
+def _row_output(row_profile_list: list, row_output: str, n_rows: int) -> pl.DataFrame:
+    """
+    "full": one row per input row, "flagged": only the rows with at least one flag,
+    "bitmask": the packed flags column, one value per input row in input order.
+    """
+    if row_output == "bitmask":
+        return _row_flags(row_profile_list, n_rows).to_frame()
+    if not row_profile_list:
+        return pl.DataFrame(schema={"row_index":pl.UInt32})
+    if row_output == "flagged":
+        flagged = (_row_flags(row_profile_list, n_rows) > 0).arg_true().cast(pl.UInt32) + 1
+        row_profile_list = [row_df.filter(pl.col("row_index").is_in(flagged.implode())) for row_df in row_profile_list]
+    return _align_rows(row_profile_list)
+
+# Helper to align row-level outputs on 'row_index'
+def _align_rows(row_profile_list: list) -> pl.DataFrame:
+    """
+    Row outputs usually cover the same sorted rows, which are stacked side by side
+    instead of joined; otherwise they are aligned with full joins.
+    """
+    row_index = row_profile_list[0]["row_index"]
+    if row_index.is_sorted() and all(row_df["row_index"].equals(row_index) for row_df in row_profile_list[1:]):
+        return pl.concat([row_profile_list[0]] + [row_df.drop("row_index") for row_df in row_profile_list[1:]], how="horizontal")
+    return pl.concat(row_profile_list, how="align")
+
+# Helper to combine section outputs into the data, column and row profiles
+def _assemble_profile(col_profile_list: list,
+                      row_profile_list: list,
+                      data_info: dict,
+                      num_cols: list,
+                      cat_cols: list,
+                      get_miss_stats: bool = True,
+                      get_dup_stats: bool = True,
+                      get_num_stats: bool = True,
+                      get_outlier_stats: bool = True,
+                      get_cat_stats: bool = True,
+                      row_output: str = "full",
+                      ) -> Tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """
+    Aligns the column-level outputs on 'column' and the row-level outputs on 'row_index'
+    (in the `row_output` layout), then builds the transposed data overall summary from them.
+    `data_info` holds number_of_rows, number_of_cols and memory_size_kb (and
+    number_of_sampled_rows when the rows were sampled).
+    """
     # Combine column stats - join progressively on 'column'
     col_profile = pl.concat(col_profile_list, how="align")
 
     # Combine row stats - join progressively on 'row_index'
-    row_profile = pl.concat(row_profile_list, how="align")
+    row_profile = _row_output(row_profile_list, row_output, data_info.get("number_of_sampled_rows", data_info["number_of_rows"]))
 
-    # --- 4. Generate Data Overall Summary ---
+    # --- Generate Data Overall Summary ---
     data_profile = pl.DataFrame({
-        "number_of_rows":df.height, #f"{df.height} x {df.width}",
-        "number_of_cols": df.width,
-        "memory_size_kb": df.estimated_size("kb"),
+        **data_info,
         "number_of_classified_num_cols": len(num_cols),
         "number_of_classified_cat_cols": len(cat_cols),
-        })
+        }, schema_overrides={"memory_size_kb": pl.Float64})
     if get_miss_stats:
         data_profile = data_profile.with_columns(
             col_max_miss_prop=col_profile["missing_prop"].max(),
-            row_max_miss_prop=row_profile["missing_prop"].max(), 
+            row_max_miss_prop=_row_col_agg(row_profile_list, "missing_prop"),
         )
     if get_dup_stats:
         data_profile = data_profile.with_columns(
             # Summing indicators (0/1) gives count; > 0 means at least one duplicate
             col_dups_ind=pl.lit(col_profile["dup_ind"].sum()>0).cast(pl.UInt32), # Number of columns with one other matching column duplicate (always even) 
-            row_dups_ind=pl.lit(row_profile["dup_ind"].sum()>0).cast(pl.UInt32), # Number of rows with one other matching row duplicate (always even)
+            row_dups_ind=pl.lit(_row_col_agg(row_profile_list, "dup_ind")).cast(pl.UInt32), # Number of rows with one other matching row duplicate (always even)
          )
     if get_num_stats and len(num_cols)>0:
         data_profile = data_profile.with_columns(
@@ -759,7 +1550,7 @@ def profile(df:pl.DataFrame,
     if get_outlier_stats and len(num_cols)>0:
              data_profile = data_profile.with_columns(
                 num_col_outliers_n=pl.lit(col_profile["outliers_ind"].max()),
-                row_outliers_n=pl.lit(row_profile["outliers_ind"].sum()),
+                row_outliers_n=pl.lit(_row_col_agg(row_profile_list, "outliers_ind", "sum")),
             )
     if get_cat_stats and len(cat_cols)>0:
         data_profile = data_profile.with_columns(
@@ -768,4 +1559,797 @@ def profile(df:pl.DataFrame,
 
     data_profile = data_profile.transpose(include_header=True) # Transpose for better readability
 
+    return data_profile, col_profile, row_profile
+
+# z value of the 95% confidence intervals reported in sampling mode
+_SAMPLE_Z = 1.96
+
+# Helper to draw a reproducible sample of rows
+def _sample_frame(df: FrameLike, sample: Union[int, float], seed: int = 0) -> Tuple[pl.DataFrame, pl.Series]:
+    """
+    A float `sample` keeps each row with that probability (Bernoulli sampling); an int keeps
+    that many rows uniformly at random (reservoir sampling, as the rows with the smallest
+    seeded hash of their position, so LazyFrames are sampled in bounded memory).
+    Rows keep their original order. Returns the sample and the original row_index of its rows.
+
+    :raises ValueError: If sample is invalid or the sample is empty.
+    """
+    if isinstance(sample, bool) or not isinstance(sample, (int, float)):
+        raise ValueError("sample must be a float between 0 and 1 (fraction) or a positive integer (number of rows).")
+    if isinstance(sample, float) and not (0 < sample < 1):
+        raise ValueError("sample must be a float between 0 and 1 (fraction) or a positive integer (number of rows).")
+    if isinstance(sample, int) and sample <= 0:
+        raise ValueError("sample must be a float between 0 and 1 (fraction) or a positive integer (number of rows).")
+
+    index_name = "__sample_row_index" # Original row_index of the sampled rows
+    df_sample = df.lazy().with_row_index(index_name, offset=1)
+    row_hash = pl.col(index_name).hash(seed=seed) # Uniform pseudo-random value per row
+    if isinstance(sample, float):
+        df_sample = df_sample.filter(row_hash < pl.lit(int(sample * 2**64), dtype=pl.UInt64))
+    else:
+        df_sample = df_sample.bottom_k(sample, by=row_hash).sort(index_name)
+    df_sample = df_sample.pipe(_collect, _engine(df))
+
+    if df_sample.height == 0:
+        raise ValueError("The sample is empty, increase sample.")
+
+    return df_sample.drop(index_name), df_sample[index_name]
+
+# Helper to compute the 95% confidence interval of the median from the sample order statistics
+def _sample_median_ci(df: pl.DataFrame, num_cols: list) -> pl.DataFrame:
+    """
+    Distribution-free interval: the order statistics at ranks n/2 -/+ z*sqrt(n)/2.
+    """
+    bounds = []
+    for c in num_cols:
+        finite = pl.col(c).filter(pl.col(c).is_finite()).sort() # Sort once for both bounds
+        half_width = _SAMPLE_Z * 0.5 / finite.len().cast(pl.Float64).sqrt()
+        bounds.append(pl.struct(
+            finite.quantile((0.5 - half_width).clip(0, 1)).alias("50th_ci_lower"),
+            finite.quantile((0.5 + half_width).clip(0, 1)).alias("50th_ci_upper"),
+        ).alias(c))
+    return df.select(bounds).unpivot(variable_name="column").unnest("value")
+
+# Helper to scale a column-level section computed on a sample and add its sampling errors
+def _sample_adjust(col_df: pl.DataFrame, df_sample: pl.DataFrame, num_cols: list, scale: float) -> pl.DataFrame:
+    """
+    `scale` is the inverse sampling fraction. Standard errors (`*_se`) use the sample size and
+    intervals are 95% normal intervals, except for the median (order statistics).
+    """
+    sample_n = df_sample.height
+    cols = col_df.columns
+    if "missing_n" in cols:
+        col_df = col_df.with_columns(
+            missing_n=(pl.col("missing_n") * scale).round().cast(pl.UInt32),
+            missing_prop_se=(pl.col("missing_prop") * (1 - pl.col("missing_prop")) / sample_n).sqrt(),
+        )
+    if "mean" in cols:
+        mean_se = pl.col("std") / pl.col("n").cast(pl.Float64).sqrt()
+        col_df = (
+            col_df
+            .with_columns(
+                mean_se=mean_se,
+                mean_ci_lower=pl.col("mean") - _SAMPLE_Z * mean_se,
+                mean_ci_upper=pl.col("mean") + _SAMPLE_Z * mean_se,
+                std_se=pl.col("std") / (2 * (pl.col("n").cast(pl.Float64) - 1)).sqrt(),
+            )
+            .join(_sample_median_ci(df_sample, num_cols), on="column", how="left")
+            .with_columns(
+                n=(pl.col("n") * scale).round().cast(pl.UInt32),
+                sum=pl.col("sum") * scale,
+            )
+        )
+    if "outliers_n" in cols:
+        col_df = col_df.with_columns(outliers_n=(pl.col("outliers_n") * scale).round().cast(pl.UInt32))
+    if "level_freq" in cols:
+        col_df = col_df.with_columns(
+            level_freq=pl.col("level_freq").list.eval((pl.element() * scale).round().cast(pl.UInt32)),
+            level_prop_se=pl.col("level_prop").list.eval((pl.element() * (1 - pl.element()) / sample_n).sqrt()),
+            # Delta-method standard error of the Gini index: sqrt(4/n * (sum p^3 - (sum p^2)^2))
+            gini_index_se=(
+                4 / sample_n * (pl.col("level_prop").list.eval(pl.element() ** 3).list.sum()
+                                - pl.col("level_prop").list.eval(pl.element() ** 2).list.sum() ** 2)
+            ).clip(lower_bound=0).sqrt(),
+        )
+    if "top_level_freq" in cols:
+        col_df = col_df.with_columns(
+            top_level_freq=pl.col("top_level_freq").list.eval((pl.element() * scale).round().cast(pl.UInt64)),
+            top_level_freq_error=(pl.col("top_level_freq_error") * scale).round().cast(pl.UInt64),
+            top_other_n=(pl.col("top_other_n") * scale).round().cast(pl.UInt64),
+        )
+    if "rare_level_n_threshold_used" in cols:
+        col_df = col_df.with_columns(
+            rare_level_n_threshold_used=(pl.col("rare_level_n_threshold_used") * scale).round().cast(pl.UInt32),
+            rare_level_estimate_ind=pl.when(pl.col("rare_level_ind").is_not_null()).then(pl.lit(1, dtype=pl.UInt8)), # Found in the sample only
+        )
+    return col_df
+
+# --- Column Batches ---
+
+# Helper to run a function on each column batch in a thread pool
+def _run_column_batches(fn, batches: list, workers: int = None):
+    """
+    Polars releases the GIL while computing, so batches run concurrently on threads.
+    Yields (batch position, result) as batches complete, so results can be folded in
+    one at a time.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Each batch runs in a copy of the caller's context, so on_stage still records its query plans
+        futures = {executor.submit(contextvars.copy_context().run, fn, cols): i for i, cols in enumerate(batches)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+# Helper to compute the profile sections on batches of columns
+def _profile_column_batches(df: FrameLike,
+                            column_batch_size: int,
+                            workers: int = None,
+                            unique_n_threshold: int = 10,
+                            unique_prop_threshold: float = None,
+                            unique_count: str = "early_exit",
+                            get_miss_stats: bool = True,
+                            get_dup_stats: bool = True,
+                            get_num_stats: bool = True,
+                            get_outlier_stats: bool = True,
+                            get_cat_stats: bool = True,
+                            num_stats_params: dict = None,
+                            IQR_multi: float = 5.0,
+                            exclude_null_level: bool = True,
+                            rare_level_n_threshold: int = 5,
+                            rare_level_prop_threshold: float = None,
+                            ) -> Tuple[pl.DataFrame, list, list]:
+    """
+    Same outputs as the sections of `profile()`, computed on batches of at most
+    `column_batch_size` columns so no intermediate spans rows x all columns.
+
+    A first pass per batch classifies the columns, counts Nulls, fingerprints the columns
+    and hashes the rows; a second pass computes the num, outlier and cat stats. Row-level
+    results (missing counts, row hashes, outlier counts, rare level flags) are folded into
+    one accumulator per row as batches complete. Duplicate candidates are then verified on
+    the candidate columns and rows only.
+
+    Returns the column types and the column-level and row-level output lists.
+    """
+    df_n, df_width = _frame_dims(df)
+    schema = df.lazy().collect_schema()
+    cols = schema.names()
+    batches = [cols[i:i + column_batch_size] for i in range(0, len(cols), column_batch_size)]
+    offsets = {tuple(batch): i * column_batch_size for i, batch in enumerate(batches)}
+
+    # --- 1. Classification, Nulls, column fingerprints and row partials per batch ---
+    def _batch_base(batch_cols: list) -> dict:
+        df_batch = df.select(batch_cols)
+        row_partials = [pl.sum_horizontal(pl.all().is_null()).alias("missing_n")]
+        if get_dup_stats:
+            row_partials.append(_row_hash_expr([pl.col(c) for c in batch_cols], seed_offset=offsets[tuple(batch_cols)]))
+        col_fingerprints, row_partials = _collect_all([
+            df_batch.lazy().select(_dup_fingerprint_expr(c, schema[c]).alias(c) for c in batch_cols),
+            df_batch.lazy().select(row_partials),
+        ], _engine(df))
+        return {
+            "types": column_type_ident(df_batch, unique_n_threshold=unique_n_threshold, unique_prop_threshold=unique_prop_threshold,
+                                       unique_count=unique_count),
+            "col_miss": column_missing_prop(df_batch),
+            "fingerprints": col_fingerprints.row(0),
+            "rows": row_partials,
+        }
+
+    base = [None] * len(batches)
+    missing_n = pl.zeros(df_n, dtype=pl.UInt32, eager=True)
+    row_hash = pl.zeros(df_n, dtype=pl.UInt64, eager=True)
+    for i, result in _run_column_batches(_batch_base, batches, workers):
+        missing_n += result["rows"]["missing_n"]
+        if get_dup_stats:
+            row_hash += result["rows"]["row_hash"] # Wrapping sum over batches, as over columns
+        del result["rows"]
+        base[i] = result
+
+    df_col_types = pl.concat([result["types"] for result in base])
+    col_miss = pl.concat([result["col_miss"] for result in base])
+    num_cols = df_col_types.filter(pl.col("col_class") == "num").get_column("column").to_list()
+    cat_cols = df_col_types.filter(pl.col("col_class") == "cat").get_column("column").to_list()
+
+    col_profile_list = [df_col_types]
+    row_profile_list = []
+    if get_miss_stats:
+        col_profile_list.append(col_miss)
+        row_profile_list.append(
+            pl.DataFrame({"missing_n": missing_n})
+            .with_columns((pl.col("missing_n") / pl.lit(df_width)).round(4).alias("missing_prop"))
+            .with_row_index("row_index", offset=1)
+        )
+    if get_dup_stats:
+        fingerprints = [f for result in base for f in result["fingerprints"]]
+        col_profile_list.append(_dup_col_frame(cols, _dup_col_verify(df, schema, fingerprints)))
+        row_hashes = _row_hash_groups(pl.DataFrame({"row_hash": row_hash}).with_row_index("row_index", offset=1))
+        row_profile_list.append(_dup_row_frame(_row_dup_verify(df, row_hashes)))
+    del missing_n, row_hash
+
+    # The proportion threshold of rare levels applies to the values of all categorical columns
+    if rare_level_prop_threshold is not None and len(cat_cols) > 0:
+        null_n = dict(col_miss.select("column", "missing_n").iter_rows())
+        cat_long_n = sum(df_n - null_n[c] if exclude_null_level else df_n for c in cat_cols)
+        rare_level_n_threshold = min(rare_level_n_threshold, int(cat_long_n * rare_level_prop_threshold))
+        rare_level_prop_threshold = None
+
+    # --- 2. Num, outlier and cat stats per batch ---
+    num_set, cat_set = set(num_cols), set(cat_cols)
+    def _batch_stats(batch_cols: list) -> dict:
+        df_batch = df.select(batch_cols)
+        batch_types = df_col_types.filter(pl.col("column").is_in(batch_cols))
+        result = {}
+        if any(c in num_set for c in batch_cols):
+            if get_num_stats:
+                result["col_num"] = num_stats(df_batch, df_col_types=batch_types, **(num_stats_params or {}))
+            if get_outlier_stats:
+                result["col_outlier"], result["row_outlier"] = num_outlier_stats(df_batch, df_col_types=batch_types, IQR_multi=IQR_multi)
+        if get_cat_stats and any(c in cat_set for c in batch_cols):
+            result["col_cat"], result["row_rare"] = cat_stats(
+                df_batch, df_col_types=batch_types,
+                exclude_null_level=exclude_null_level,
+                rare_level_n_threshold=rare_level_n_threshold,
+                rare_level_prop_threshold=rare_level_prop_threshold
+            )
+        return result
+
+    stat_batches = [batch for batch in batches if any(c in num_set or c in cat_set for c in batch)]
+    col_sections = {"col_num": [], "col_outlier": [], "col_cat": []}
+    outliers_n = pl.repeat(None, df_n, dtype=pl.UInt32, eager=True) # Null for rows without finite numeric values
+    rare_level_ind = pl.repeat(None, df_n, dtype=pl.UInt8, eager=True) # Null for rows without categorical levels
+    for _, result in _run_column_batches(_batch_stats, stat_batches, workers):
+        for section, frames in col_sections.items():
+            if section in result:
+                frames.append(result[section])
+        if "row_outlier" in result:
+            idx = result["row_outlier"]["row_index"] - 1
+            outliers_n = outliers_n.scatter(idx, outliers_n.gather(idx).fill_null(0) + result["row_outlier"]["outliers_n"])
+        if "row_rare" in result:
+            idx = result["row_rare"]["row_index"] - 1
+            rare_level_ind = rare_level_ind.scatter(idx, rare_level_ind.gather(idx).fill_null(0) | result["row_rare"]["rare_level_ind"])
+
+    if len(col_sections["col_num"]) > 0:
+        col_profile_list.append(pl.concat(col_sections["col_num"], how="diagonal_relaxed").sort("column"))
+    if len(col_sections["col_outlier"]) > 0:
+        col_profile_list.append(pl.concat(col_sections["col_outlier"], how="diagonal_relaxed"))
+        row_profile_list.append(
+            pl.DataFrame({"outliers_n": outliers_n})
+            .with_row_index("row_index", offset=1)
+            .filter(pl.col("outliers_n").is_not_null())
+            .with_columns(
+                outliers_prop=pl.col("outliers_n")/pl.lit(len(num_cols)), # Prop in reference to number or num columns per sample
+                outliers_ind=(pl.col("outliers_n")>0).cast(pl.UInt8)
+            )
+            .select(["row_index", "outliers_ind", "outliers_n", "outliers_prop"])
+        )
+    if len(col_sections["col_cat"]) > 0:
+        col_profile_list.append(pl.concat(col_sections["col_cat"], how="diagonal_relaxed"))
+        row_profile_list.append(
+            pl.DataFrame({"rare_level_ind": rare_level_ind})
+            .with_row_index("row_index", offset=1)
+            .filter(pl.col("rare_level_ind").is_not_null())
+        )
+
+    return df_col_types, col_profile_list, row_profile_list
+
+# --- Grouped Profile ---
+
+# Helper to find the duplicate columns within each group
+def _group_col_dup_ind(df: FrameLike, keys: list, cols: list) -> pl.DataFrame:
+    """
+    As column_dup_ind on the rows of each group: columns are fingerprinted per group in one
+    group_by pass, and the candidates sharing a fingerprint are verified value by value in
+    another. Returns one (keys, column, dup_ind, dup_group, dup_first_column) row per group and column.
+    """
+    schema = df.lazy().collect_schema()
+    position = {c: i for i, c in enumerate(cols)}
+
+    fingerprints = (
+        df.lazy()
+        .group_by(keys)
+        .agg(_dup_fingerprint_expr(c, schema[c]).alias(c) for c in cols)
+        .pipe(_collect, _engine(df))
+        .unpivot(index=keys, variable_name="column", value_name="fingerprint")
+        .with_columns(
+            compare_dtype=pl.col("column").replace_strict({c: _dup_compare_dtype(schema[c]) for c in cols}, return_dtype=pl.String),
+            position=pl.col("column").replace_strict(position, return_dtype=pl.UInt32),
+        )
+    )
+
+    # Verify candidates against the first column of their group, checking the columns that
+    # differ from it (hash collisions) again among themselves, as _dup_col_verify
+    candidate_cols = keys + ["compare_dtype", "fingerprint"]
+    candidates = fingerprints.filter(pl.len().over(candidate_cols) > 1)
+    dup_cols = [fingerprints.select(*keys, "column").clear().with_columns(first=pl.lit(None, dtype=pl.String))]
+    while candidates.height > 0:
+        candidates = candidates.with_columns(first=pl.col("column").sort_by("position").first().over(candidate_cols))
+        pairs = candidates.filter(pl.col("column") != pl.col("first")).select("column", "first").unique(maintain_order=True)
+        checks = (
+            df.lazy()
+            .group_by(keys)
+            .agg(_dup_equal_expr(c, first, schema).alias(str(i)) for i, (c, first) in enumerate(pairs.iter_rows()))
+            .pipe(_collect, _engine(df))
+            .unpivot(index=keys, variable_name="pair", value_name="matched")
+            .join(pairs.with_row_index("pair").with_columns(pl.col("pair").cast(pl.String)), on="pair")
+            .drop("pair")
+        )
+        candidates = (
+            candidates
+            .join(checks, on=keys + ["column", "first"], how="left", nulls_equal=True, maintain_order="left")
+            .with_columns(pl.col("matched").fill_null(True)) # The first column of each group
+        )
+        matched = candidates.filter(pl.col("matched"))
+        dup_cols.append(matched.filter(pl.len().over(candidate_cols) > 1).select(*keys, "column", "first"))
+        candidates = (
+            candidates
+            .filter(pl.col("matched").not_())
+            .filter(pl.len().over(candidate_cols) > 1)
+            .drop("first", "matched")
+        )
+
+    # Number the groups in column order within each group of keys
+    dup_cols = pl.concat(dup_cols).with_columns(
+        dup_group=pl.col("first").replace_strict(position, return_dtype=pl.UInt32).rank("dense").over(keys).cast(pl.UInt32)
+    )
+    return (
+        fingerprints.select(*keys, "column")
+        .join(dup_cols, on=keys + ["column"], how="left", nulls_equal=True, maintain_order="left")
+        .select(
+            *keys, "column",
+            dup_ind=pl.col("dup_group").is_not_null().cast(pl.UInt8),
+            dup_group="dup_group",
+            dup_first_column="first",
+        )
+    )
+
+# Helper to aggregate the row-level sections per group, for the grouped data profile
+def _group_row_summaries(df: FrameLike, keys: list, row_profile_list: list) -> pl.DataFrame:
+    """
+    Same row summaries as the data profile of `profile()`: max row missing proportion,
+    duplicate rows indicator and number of rows with outliers.
+    """
+    row_keys = df.lazy().select(keys).pipe(_collect, _engine(df))
+    summaries = None
+    for col, agg, name in (("missing_prop", "max", "row_max_miss_prop"),
+                           ("dup_ind", "max", "row_dups_ind"),
+                           ("outliers_ind", "sum", "row_outliers_n")):
+        row_df = next((row_df for row_df in row_profile_list if col in row_df.columns), None)
+        if row_df is None:
+            continue
+        summary = (
+            row_keys[row_df["row_index"] - 1]
+            .with_columns(row_df[col])
+            .group_by(keys)
+            .agg(getattr(pl.col(col), agg)().cast(pl.Float64 if name == "row_max_miss_prop" else pl.UInt32).alias(name))
+        )
+        summaries = summary if summaries is None else summaries.join(summary, on=keys, how="full", coalesce=True, nulls_equal=True)
+    return summaries
+
+# Helper to compute the profile per group of the `by` columns
+def _profile_by(df: FrameLike,
+                keys: list,
+                df_col_types: pl.DataFrame,
+                get_miss_stats: bool = True,
+                get_dup_stats: bool = True,
+                get_num_stats: bool = True,
+                get_outlier_stats: bool = True,
+                get_cat_stats: bool = True,
+                num_stats_params: dict = None,
+                IQR_multi: float = 5.0,
+                exclude_null_level: bool = True,
+                rare_level_n_threshold: int = 5,
+                rare_level_prop_threshold: float = None,
+                row_output: str = "full",
+                key_cols_in_rows: bool = True,
+                ) -> Tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """
+    Missing, num, outlier and categorical level stats come from one group_by pass, and column
+    duplicates are searched within each group. Row duplicates include the group keys, so rows
+    only match rows of their group. With `key_cols_in_rows=False` (added id columns), the row
+    missing counts leave the keys out.
+    """
+    df_n, _ = _frame_dims(df)
+    if not isinstance(IQR_multi, (int, float)) or IQR_multi <= 0:
+         raise ValueError("IQR_multi must be a positive number.")
+    _check_rare_thresholds(rare_level_n_threshold, rare_level_prop_threshold)
+
+    col_classes = dict(df_col_types.select("column", "col_class").iter_rows())
+    cols = [c for c in df_col_types["column"] if c not in keys]
+    num_cols = [c for c in cols if col_classes[c] == "num"]
+    cat_cols = [c for c in cols if col_classes[c] == "cat"]
+
+    col_profile = _group_profile(
+        df, keys, col_classes, **(num_stats_params or {}),
+        get_miss_stats=get_miss_stats, get_num_stats=get_num_stats, get_outlier_stats=get_outlier_stats,
+        get_cat_stats=get_cat_stats, IQR_multi=IQR_multi, exclude_null_level=exclude_null_level
+    )
+    row_profile_list = []
+    if get_miss_stats:
+        row_profile_list.append(row_missing_prop(df if key_cols_in_rows else df.drop(keys)))
+    if get_dup_stats:
+        col_profile = col_profile.join(_group_col_dup_ind(df, keys, cols), on=keys + ["column"], how="left", nulls_equal=True, maintain_order="left")
+        row_profile_list.append(row_dup_ind(df))
+    if get_outlier_stats and len(num_cols) > 0:
+        row_profile_list.append(_group_row_outlier_ind(df, keys, num_cols, col_profile))
+    if get_cat_stats and len(cat_cols) > 0:
+        col_cat = _group_cat_stats(
+            col_profile.filter(pl.col("col_class") == "cat"), keys,
+            exclude_null_level=exclude_null_level,
+            rare_level_n_threshold=rare_level_n_threshold,
+            rare_level_prop_threshold=rare_level_prop_threshold
+        )
+        col_profile = col_profile.drop("level", "level_freq").join(
+            col_cat.drop("group_n"), on=keys + ["column"], how="left", nulls_equal=True, maintain_order="left"
+        )
+        row_profile_list.append(_group_row_rare_ind(df, keys, cat_cols, col_cat, exclude_null_level=exclude_null_level))
+
+    row_profile = _row_output(row_profile_list, row_output, df_n)
+
+    # --- Data Overall Summary, one row per group ---
+    summaries = [pl.col("group_n").first().alias("number_of_rows")]
+    if get_miss_stats:
+        summaries.append(pl.col("missing_prop").max().alias("col_max_miss_prop"))
+    if get_dup_stats:
+        summaries.append((pl.col("dup_ind").sum() > 0).cast(pl.UInt32).alias("col_dups_ind"))
+    if get_num_stats and len(num_cols) > 0:
+        summaries += [pl.col(f"{ind}_ind").max().alias(f"num_col_{ind}_ind")
+                      for ind in ("nan", "inf", "high_skew", "high_kurtosis", "high_cv", "high_sparsity")]
+    if get_outlier_stats and len(num_cols) > 0:
+        summaries.append(pl.col("outliers_ind").max().alias("num_col_outliers_n"))
+    if get_cat_stats and len(cat_cols) > 0 and "rare_level_ind" in col_profile.columns:
+        summaries.append((pl.col("rare_level_ind").sum() > 0).cast(pl.UInt32).alias("cat_col_rare_level_ind"))
+    data_profile = col_profile.group_by(keys, maintain_order=True).agg(summaries)
+    if len(row_profile_list) > 0:
+        data_profile = (
+            data_profile
+            .join(_group_row_summaries(df, keys, row_profile_list), on=keys, how="left", nulls_equal=True, maintain_order="left")
+            .with_columns(pl.col("^row_(dups_ind|outliers_n)$").fill_null(0)) # Groups without rows in the section
+        )
+
+    return data_profile, col_profile, row_profile
+
+# --- Main Profile Function ---
+def profile(df:FrameLike,
+
+            # Col Classification thresholds
+            unique_n_threshold:int = 10,
+            unique_prop_threshold:float = None,
+            unique_count: str = "early_exit",
+
+            # Toggles for sections
+            get_miss_stats:bool = True,
+            get_dup_stats:bool = True,
+            get_num_stats:bool = True,
+            get_outlier_stats:bool = True,
+            get_cat_stats:bool = True,
+
+            # Num stats thresholds
+            skew_threshold: float = 3.0,
+            kurtosis_threshold: float = 3.0,
+            sparsity_threshold: float = 0.5,
+            cv_threshold: float = 1.0,
+
+            # Outlier stats threshold multiplier
+            IQR_multi:float = 5.0,
+
+            # Cat stats thresholds/options
+            exclude_null_level: bool = True,
+            rare_level_n_threshold: int = 5,
+            rare_level_prop_threshold: float = None,
+
+            # Top-k stats of high-cardinality columns
+            top_k: int = None,
+
+            # Time-windowed column stats
+            time_column: str = None,
+            every: str = None,
+
+            # Grouped profile
+            by: Union[str, list] = None,
+
+            # Sampling options
+            sample: Union[int, float] = None,
+            sample_seed: int = 0,
+
+            # Column batching options (very wide frames)
+            column_batch_size: int = None,
+            column_batch_workers: int = None,
+
+            # Row profile layout
+            row_output: str = "full",
+
+            # Instrumentation
+            on_stage: Callable[[dict], None] = None
+
+            ) -> Tuple[pl.DataFrame, ...]:
+    """
+    Generates a comprehensive data profile for a Polars DataFrame or LazyFrame.
+
+    Computes statistics for columns and rows including:
+    - Column type classification (numeric, categorical, time, etc.)
+    - Missing data proportions (column-wise and row-wise)
+    - Duplicate indicators (column-wise and row-wise, based on values)
+    - Numeric column statistics (mean, std, quantiles, skew, kurtosis, etc.)
+    - Outlier detection for numeric columns (IQR method on scaled data)
+    - Categorical column analysis (level frequencies, Gini, rare levels)
+
+    :param df: Input Polars DataFrame, or LazyFrame (e.g. from `pl.scan_parquet`) to profile on the
+        streaming engine (peak memory is still O(rows)). `memory_size_kb` is null for LazyFrames.
+    :param unique_n_threshold: Max unique values for 'categorical' classification.
+    :param unique_prop_threshold: Proportion unique values threshold for 'categorical'.
+    :param unique_count: Unique value counting of the column classification: "early_exit", "approx"
+        or "exact" (see `column_type_ident`).
+    :param get_miss_stats: Whether to compute missing value statistics.
+    :param get_dup_stats: Whether to compute duplicate statistics.
+    :param get_num_stats: Whether to compute numeric descriptive statistics.
+    :param get_outlier_stats: Whether to compute numeric outlier statistics.
+    :param get_cat_stats: Whether to compute categorical statistics.
+    :param skew_threshold: Absolute threshold to flag high skewness.
+    :param kurtosis_threshold: Absolute threshold to flag high kurtosis.
+    :param sparsity_threshold: Threshold (proportion of zeros) to flag high sparsity.
+    :param cv_threshold: Absolute threshold to flag high coefficient of variation.
+    :param IQR_multi: Multiplier for IQR range in outlier detection.
+    :param exclude_null_level: If True, Nulls are ignored in categorical analysis.
+    :param rare_level_n_threshold: Absolute count threshold for rare category levels.
+    :param rare_level_prop_threshold: Proportion threshold for rare category levels.
+    :param top_k: If set, adds the `top_k` most frequent values of the high-cardinality ("other")
+        String/Categorical/Binary columns, from a bounded-memory sketch (see `top_k_stats`).
+    :param time_column: If set with `every`, also returns the column stats per time window of this
+        column (missing, num, outlier and categorical level stats, see `window_stats`), computed in one
+        pass with the column classification of the whole frame.
+    :param every: Interval between the time windows, e.g. "1h" or "1d".
+    :param by: Group column(s). If set, profiles each group of these columns in one group_by pass with
+        the column classification of the whole frame: data_profile has one row per group, col_profile one
+        row per group and column (keyed by the group columns, with the group rows in `group_n`), and the
+        row outlier and rare level flags use the bounds and rare levels of the row's group. Duplicate
+        columns and rows are searched within each group. Cannot be combined with sample, time_column,
+        top_k or column_batch_size.
+    :param sample: Profile a random sample of rows instead of the full data: a float between 0 and 1
+        keeps each row with that probability (Bernoulli), an int keeps that many rows (reservoir).
+        Counts (`missing_n`, `n`, `sum`, `outliers_n`, `level_freq`) are scaled up to the full row count,
+        `rare_level_n_threshold` applies to the scaled counts, and num/cat/missing stats get standard
+        errors and 95% confidence intervals. Rare levels are flagged as estimates (`rare_level_estimate_ind`),
+        duplicates are only searched within the sample, and the row profile covers the sampled
+        rows (with their original `row_index`).
+    :param sample_seed: Seed of the sample, for reproducibility.
+    :param column_batch_size: Profile the columns in batches of at most this many columns, so memory
+        is bounded by the batch width rather than the frame width (for frames with thousands of columns).
+        Row-level results are accumulated across batches; outputs are the same as without batches.
+    :param column_batch_workers: Number of batches profiled concurrently on threads (default: number of CPUs).
+        Peak memory grows with the number of concurrent batches.
+    :param row_output: Layout of the row profile: "full" (one row per input row), "flagged" (only rows
+        with a missing value, duplicate, outlier or rare level) or "bitmask" (a single UInt8 `row_flags`
+        column in input order, with the bits of `ROW_FLAG_BITS`; plus the original `row_index` when sampling).
+    :param on_stage: Opt-in instrumentation: called with a metrics record (wall time, rows and columns
+        processed, estimated input/output bytes, peak memory increase, and the optimized scan plan for
+        LazyFrames) after each stage. A `ProfileMetrics` instance collects them into a DataFrame.
+
+    :return: A tuple containing three DataFrames (four with `time_column`):
+        1. data_profile: Overall summary statistics for the dataset.
+        2. col_profile: Detailed statistics for each column.
+        3. row_profile: Statistics for each row.
+        4. window_profile: Statistics for each time window and column.
+    :rtype: Tuple[pl.DataFrame, ...]
+    :raises ValueError: If the DataFrame is empty or thresholds are invalid.
+    """
+    df_n, df_width = _frame_dims(df)
+    memory_size_kb = df.estimated_size("kb") if isinstance(df, pl.DataFrame) else None # Unknown before a LazyFrame is collected
+
+    if column_batch_size is not None and (not isinstance(column_batch_size, int) or column_batch_size <= 0):
+        raise ValueError("column_batch_size must be a positive integer, or None.")
+    if column_batch_workers is not None and (not isinstance(column_batch_workers, int) or column_batch_workers <= 0):
+        raise ValueError("column_batch_workers must be a positive integer, or None.")
+    if row_output not in ("full", "flagged", "bitmask"):
+        raise ValueError("row_output must be 'full', 'flagged' or 'bitmask'.")
+    if (time_column is None) != (every is None):
+        raise ValueError("time_column and every must be given together.")
+    if time_column is not None and sample is not None:
+        raise ValueError("time_column cannot be combined with sample.")
+    if by is not None:
+        keys = _group_keys(df.lazy().collect_schema(), by)
+        if sample is not None or time_column is not None or top_k is not None or column_batch_size is not None:
+            raise ValueError("by cannot be combined with sample, time_column, top_k or column_batch_size.")
+
+    # --- Grouped Profile ---
+    if by is not None:
+        all_cols = df.lazy().collect_schema().names()
+        with _stage(on_stage, "column_type_ident", df, df_n, all_cols) as stage:
+            df_col_types = column_type_ident(
+                df=df,
+                unique_n_threshold=unique_n_threshold,
+                unique_prop_threshold=unique_prop_threshold,
+                unique_count=unique_count
+            )
+            stage["outputs"] = [df_col_types]
+        with _stage(on_stage, "group_stats", df, df_n, all_cols) as stage:
+            data_profile, col_profile, row_profile = _profile_by(
+                df, keys, df_col_types,
+                get_miss_stats=get_miss_stats, get_dup_stats=get_dup_stats, get_num_stats=get_num_stats,
+                get_outlier_stats=get_outlier_stats, get_cat_stats=get_cat_stats,
+                num_stats_params=dict(skew_threshold=skew_threshold, kurtosis_threshold=kurtosis_threshold,
+                                      sparsity_threshold=sparsity_threshold, cv_threshold=cv_threshold),
+                IQR_multi=IQR_multi,
+                exclude_null_level=exclude_null_level,
+                rare_level_n_threshold=rare_level_n_threshold,
+                rare_level_prop_threshold=rare_level_prop_threshold,
+                row_output=row_output
+            )
+            stage["outputs"] = [data_profile, col_profile, row_profile]
+        return data_profile, col_profile, row_profile
+
+    # --- 0. Sampling ---
+    data_info = {"number_of_rows": df_n, "number_of_cols": df_width, "memory_size_kb": memory_size_kb}
+    if sample is not None:
+        full_n = df_n
+        with _stage(on_stage, "sample", df, df_n, df.lazy().collect_schema().names()) as stage:
+            df, sample_row_index = _sample_frame(df, sample, seed=sample_seed)
+            stage["outputs"] = [df]
+        df_n = df.height
+        scale = full_n / df_n # Inverse sampling fraction to scale counts up to the full row count
+        data_info["number_of_sampled_rows"] = df_n
+        # Rare level counts are compared on the sample scale
+        if rare_level_n_threshold is not None:
+            rare_level_n_threshold = int(rare_level_n_threshold / scale)
+
+    # --- 1-2. Column Classification and Statistics ---
+    all_cols = df.lazy().collect_schema().names()
+    if column_batch_size is not None and df_width > column_batch_size:
+        # Profile bounded batches of columns concurrently (very wide frames)
+        with _stage(on_stage, "column_batches", df, df_n, all_cols) as stage:
+            df_col_types, col_profile_list, row_profile_list = _profile_column_batches(
+                df, column_batch_size, workers=column_batch_workers,
+                unique_n_threshold=unique_n_threshold, unique_prop_threshold=unique_prop_threshold,
+                unique_count=unique_count,
+                get_miss_stats=get_miss_stats, get_dup_stats=get_dup_stats, get_num_stats=get_num_stats,
+                get_outlier_stats=get_outlier_stats, get_cat_stats=get_cat_stats,
+                num_stats_params=dict(skew_threshold=skew_threshold, kurtosis_threshold=kurtosis_threshold,
+                                      sparsity_threshold=sparsity_threshold, cv_threshold=cv_threshold),
+                IQR_multi=IQR_multi,
+                exclude_null_level=exclude_null_level,
+                rare_level_n_threshold=rare_level_n_threshold,
+                rare_level_prop_threshold=rare_level_prop_threshold
+            )
+            stage["outputs"] = col_profile_list + row_profile_list
+        num_cols = df_col_types.filter(pl.col("col_class") == "num").get_column("column").to_list()
+        cat_cols = df_col_types.filter(pl.col("col_class") == "cat").get_column("column").to_list()
+    else:
+        # --- 1. Initial Column Classification ---
+        with _stage(on_stage, "column_type_ident", df, df_n, all_cols) as stage:
+            df_col_types = column_type_ident(
+                df=df,
+                unique_n_threshold=unique_n_threshold,
+                unique_prop_threshold=unique_prop_threshold,
+                unique_count=unique_count
+            )
+            stage["outputs"] = [df_col_types]
+        num_cols = df_col_types.filter(pl.col("col_class") == "num").get_column("column").to_list()
+        cat_cols = df_col_types.filter(pl.col("col_class") == "cat").get_column("column").to_list()
+
+        # --- Initialize Profile Components ---
+        # Base column profile starts with type identification
+        col_profile_list = [df_col_types]
+        row_profile_list = [] # Start empty, add row index later if needed
+
+        # Schemas for empty results if sections are skipped
+        col_empty_df = pl.DataFrame(schema={"column":pl.String})
+        row_empty_df = pl.DataFrame(schema={"row_index":pl.UInt32}) # Ensure correct schema for empty case
+        # col_empty_df = pl.DataFrame({"column": df.columns}) # Use actual columns for joins
+        # row_empty_df = pl.DataFrame({"row_index":pl.UInt32})
+
+        # --- 2. Compute Optional Statistics ---
+        # Missing Stats
+        col_miss = col_empty_df
+        row_miss = row_empty_df
+        if get_miss_stats:
+            with _stage(on_stage, "missing", df, df_n, all_cols) as stage:
+                col_miss = column_missing_prop(df)
+                row_miss = row_missing_prop(df)
+                stage["outputs"] = [col_miss, row_miss]
+            col_profile_list.append(col_miss)
+            row_profile_list.append(row_miss)
+
+        # Duplicate Stats
+        col_dup = col_empty_df
+        row_dup = row_empty_df
+        if get_dup_stats:
+            with _stage(on_stage, "duplicates", df, df_n, all_cols) as stage:
+                col_dup = column_dup_ind(df)
+                row_dup = row_dup_ind(df) # Assumes row_index is generated internally or joined
+                stage["outputs"] = [col_dup, row_dup]
+            col_profile_list.append(col_dup)
+            row_profile_list.append(row_dup)
+
+
+        # Numeric Stats
+        col_num = col_empty_df
+        if get_num_stats and len(num_cols)>0:
+            with _stage(on_stage, "num_stats", df, df_n, num_cols) as stage:
+                col_num = num_stats(
+                    df=df, df_col_types=df_col_types,
+                    skew_threshold=skew_threshold, kurtosis_threshold=kurtosis_threshold,
+                    sparsity_threshold=sparsity_threshold, cv_threshold=cv_threshold
+                )
+                stage["outputs"] = [col_num]
+            # Select only stat columns to avoid joining 'column' twice
+            col_profile_list.append(col_num)
+
+        # Outlier Stats
+        col_outlier = col_empty_df
+        row_outlier = row_empty_df
+        if get_outlier_stats and len(num_cols)>0:
+            with _stage(on_stage, "num_outlier_stats", df, df_n, num_cols) as stage:
+                col_outlier, row_outlier = num_outlier_stats(
+                    df=df, df_col_types=df_col_types, IQR_multi=IQR_multi
+                )
+                stage["outputs"] = [col_outlier, row_outlier]
+            col_profile_list.append(col_outlier)
+            row_profile_list.append(row_outlier)
+
+        # Categorical Stats
+        col_cat = col_empty_df
+        row_rare = row_empty_df
+        if get_cat_stats and len(cat_cols):
+            with _stage(on_stage, "cat_stats", df, df_n, cat_cols) as stage:
+                col_cat, row_rare = cat_stats(
+                    df=df, df_col_types=df_col_types,
+                    exclude_null_level=exclude_null_level,
+                    rare_level_n_threshold=rare_level_n_threshold,
+                    rare_level_prop_threshold=rare_level_prop_threshold
+                )
+                stage["outputs"] = [col_cat, row_rare]
+            col_profile_list.append(col_cat)
+            row_profile_list.append(row_rare)
+
+    # Top-k Stats (heavy hitters of the high-cardinality columns)
+    top_k_cols = _top_k_default_cols(df_col_types, df.lazy().collect_schema()) if top_k is not None else []
+    if len(top_k_cols) > 0:
+        with _stage(on_stage, "top_k_stats", df, df_n, top_k_cols) as stage:
+            col_top_k = top_k_stats(
+                df=df, df_col_types=df_col_types, k=top_k,
+                exclude_null_level=exclude_null_level
+            )
+            stage["outputs"] = [col_top_k]
+        col_profile_list.append(col_top_k)
+
+    # Time-windowed stats
+    if time_column is not None:
+        with _stage(on_stage, "window_stats", df, df_n, all_cols) as stage:
+            window_profile = window_stats(
+                df=df, time_column=time_column, every=every, df_col_types=df_col_types,
+                skew_threshold=skew_threshold, kurtosis_threshold=kurtosis_threshold,
+                sparsity_threshold=sparsity_threshold, cv_threshold=cv_threshold,
+                IQR_multi=IQR_multi, exclude_null_level=exclude_null_level
+            )
+            stage["outputs"] = [window_profile]
+
+    # --- 3. Assemble Column, Row and Data Overall Profiles ---
+    with _stage(on_stage, "assemble", df, df_n, []) as stage:
+        # Scale sample counts up and add standard errors / confidence intervals
+        if sample is not None:
+            col_profile_list = [
+                _sample_adjust(col_df, df, num_cols, scale) if col_df is not df_col_types else col_df
+                for col_df in col_profile_list
+            ]
+
+        data_profile, col_profile, row_profile = _assemble_profile(
+            col_profile_list=col_profile_list,
+            row_profile_list=row_profile_list,
+            data_info=data_info,
+            num_cols=num_cols, cat_cols=cat_cols,
+            get_miss_stats=get_miss_stats, get_dup_stats=get_dup_stats, get_num_stats=get_num_stats,
+            get_outlier_stats=get_outlier_stats, get_cat_stats=get_cat_stats,
+            row_output=row_output
+        )
+
+        # Report the original row_index of the sampled rows
+        if sample is not None and row_output == "bitmask":
+            row_profile = row_profile.insert_column(0, sample_row_index.alias("row_index"))
+        elif sample is not None and row_profile.height > 0:
+            row_profile = row_profile.with_columns(
+                pl.col(c).map_batches(lambda s: sample_row_index.gather(s - 1), return_dtype=pl.UInt32)
+                for c in ["row_index", "dup_first_row_index"] if c in row_profile.columns
+            )
+        stage["outputs"] = [data_profile, col_profile, row_profile]
+
+    if time_column is not None:
+        return data_profile, col_profile, row_profile, window_profile
+
     return data_profile, col_profile, row_profile
\ No newline at end of file
@@ -0,0 +1,378 @@
+# polarspulse/result.py
+import re
+import polars as pl
+from typing import Tuple # Added for type hints
+
+from .profiling import (
+    FrameLike,
+    _assemble_profile,
+    _cat_freq_stats,
+    _check_rare_thresholds,
+    _check_unique_thresholds,
+    _col_type_classify,
+    _engine,
+    _UNIQUE_PREFIX_ROWS,
+    _cat_n_threshold,
+    _frame_dims,
+    _num_col_aggs,
+    _num_stats_derive,
+    _outlier_bound_exprs,
+    column_dup_ind,
+    column_missing_prop,
+    column_type_ident,
+    row_dup_ind,
+    row_missing_prop,
+)
+from .state import _CAT_DTYPES
+
+# profile() parameters supported by ProfileResult.rethreshold, with their profile() defaults
+_RETHRESHOLD_DEFAULTS = {
+    "unique_n_threshold": 10, "unique_prop_threshold": None,
+    "get_miss_stats": True, "get_dup_stats": True, "get_num_stats": True,
+    "get_outlier_stats": True, "get_cat_stats": True,
+    "skew_threshold": 3.0, "kurtosis_threshold": 3.0, "sparsity_threshold": 0.5, "cv_threshold": 1.0,
+    "IQR_multi": 5.0,
+    "exclude_null_level": True, "rare_level_n_threshold": 5, "rare_level_prop_threshold": None,
+}
+
+# --- Helper Functions ---
+
+# Helper to rebuild the unique counts profile() reports with its default "early_exit" counting
+def _early_exit_counts(n_unique: pl.DataFrame, df_n: int, cat_n_threshold_use: int) -> pl.DataFrame:
+    """
+    Time and Boolean columns keep their counts from the schema. Frames with at most
+    `_UNIQUE_PREFIX_ROWS` rows get the exact counts; in larger frames, columns over the
+    threshold in the first rows are not counted (null), and the others get their approximate count.
+    """
+    if df_n <= _UNIQUE_PREFIX_ROWS:
+        counted = pl.col("prefix_n_unique")
+    else:
+        counted = pl.when(pl.col("prefix_n_unique") <= cat_n_threshold_use).then(pl.col("approx_n_unique"))
+    return n_unique.select(
+        "column",
+        approx_n_unique=pl.when(pl.col("schema_counted")).then(pl.col("early_exit_n_unique")).otherwise(counted)
+    )
+
+# Helper to build the outlier score of each value of a numeric column
+def _outlier_score_expr(col: str, q1: float, q3: float) -> pl.Expr:
+    """
+    The score is the distance of the value outside the quartile box in IQR units, so a value
+    is an outlier for `IQR_multi` when its score is above `IQR_multi`. With a zero IQR, values
+    outside the box have an infinite score. Null for Null, NaN and Infinite values.
+    """
+    value = pl.col(col).cast(pl.Float64)
+    if q1 is None or q3 is None: # No finite values
+        return pl.lit(None, dtype=pl.Float32).alias(col)
+    distance = pl.max_horizontal(pl.lit(q1) - value, value - pl.lit(q3))
+    iqr = q3 - q1
+    score = distance / iqr if iqr > 0 else pl.when(distance > 0).then(float("inf")).otherwise(0.0)
+    return pl.when(value.is_finite()).then(score).cast(pl.Float32).alias(col)
+
+# --- Profile Result ---
+
+class ProfileResult:
+    """
+    Threshold-independent aggregates of a `profile()` run, to regenerate the profile
+    outputs for new thresholds without scanning the data again.
+
+    The result holds:
+    - The unique value counts of column_type_ident, reclassified for each threshold.
+    - The missing and duplicate sections, which do not depend on any threshold.
+    - The base numeric stats (moments, quantiles, indicators) of every numeric column.
+    - The level frequencies of every column that can be categorical (at most `max_levels` levels).
+    - With `keep_rows`, compact per-row values: a Float32 outlier score per numeric value
+      (its distance outside the quartiles in IQR units) and a UInt32 level code per
+      categorical value, from which the row-level outlier and rare level sections and the
+      outlier counts are recomputed.
+
+    Without `keep_rows`, only the outlier scores above `min_IQR_multi` are kept (sorted per
+    column), so `IQR_multi` can be lowered down to `min_IQR_multi` only, and the row profile
+    is empty.
+
+    Outlier scores are stored as Float32, so values within float precision of an outlier
+    bound may be classified differently than by `profile()`.
+    """
+
+    def __init__(self, n_rows: int, schema: pl.Schema, memory_size_kb: float, n_unique: pl.DataFrame,
+                 missing: Tuple[pl.DataFrame, pl.DataFrame], dups: Tuple[pl.DataFrame, pl.DataFrame],
+                 num_base: dict, level_freqs: dict, outlier_scores, level_codes: pl.DataFrame = None,
+                 min_IQR_multi: float = None, params: dict = None):
+        self.n_rows = n_rows
+        self.schema = schema
+        self.memory_size_kb = memory_size_kb
+        self.n_unique = n_unique
+        self.missing = missing
+        self.dups = dups
+        self.num_base = num_base
+        self.level_freqs = level_freqs
+        self.outlier_scores = outlier_scores
+        self.level_codes = level_codes
+        self.min_IQR_multi = min_IQR_multi
+        self.params = params or {}
+
+    def __repr__(self) -> str:
+        return f"ProfileResult(n_rows={self.n_rows}, n_cols={len(self.schema)}, keep_rows={self.level_codes is not None})"
+
+    @classmethod
+    def from_frame(cls,
+                   df: FrameLike,
+                   max_levels: int = 1000,
+                   keep_rows: bool = True,
+                   min_IQR_multi: float = 1.0,
+                   **profile_params
+                   ) -> "ProfileResult":
+        """
+        Scans a DataFrame or LazyFrame once and keeps the aggregates of its profile.
+
+        :param df: Input Polars DataFrame or LazyFrame.
+        :param max_levels: Max number of levels counted per column for cat_stats.
+        :param keep_rows: Whether to keep the row-level sections and the compact per-row values.
+        :param min_IQR_multi: Lowest IQR_multi supported by `rethreshold` without `keep_rows`.
+        :param profile_params: Default thresholds of `rethreshold` (as for `profile()`).
+        :return: The ProfileResult of the frame.
+        :rtype: ProfileResult
+        :raises ValueError: If the DataFrame is empty or parameters are invalid.
+        """
+        if not isinstance(max_levels, int) or max_levels <= 0:
+            raise ValueError("max_levels must be a positive integer.")
+        if not isinstance(min_IQR_multi, (int, float)) or min_IQR_multi <= 0:
+            raise ValueError("min_IQR_multi must be a positive number.")
+
+        df_n, _ = _frame_dims(df)
+        schema = df.lazy().collect_schema()
+        memory_size_kb = df.estimated_size("kb") if isinstance(df, pl.DataFrame) else None
+
+        # Unique counts over all rows, exact counts over the first rows, and the counts of time and
+        # Boolean columns from the schema, to redo the "early_exit" counts of profile() for each threshold
+        n_unique = pl.concat([
+            column_type_ident(df, unique_count="approx").select("column", "approx_n_unique"),
+            column_type_ident(df.head(_UNIQUE_PREFIX_ROWS), unique_count="exact").select(prefix_n_unique="approx_n_unique"),
+            column_type_ident(df, unique_n_threshold=1).select(early_exit_n_unique="approx_n_unique"),
+        ], how="horizontal").with_columns(
+            schema_counted=pl.Series([dtype.is_temporal() or dtype == pl.Boolean for dtype in schema.values()])
+        )
+        unique_counts = dict(n_unique.select("column", "approx_n_unique").iter_rows())
+
+        # Threshold-independent sections
+        missing = (column_missing_prop(df), row_missing_prop(df) if keep_rows else None)
+        dups = (column_dup_ind(df), row_dup_ind(df) if keep_rows else None)
+
+        # Base numeric stats of every column that can be classified numeric
+        num_cols = [c for c, dtype in schema.items() if (dtype.is_integer() or dtype.is_float()) and unique_counts[c] > 1]
+        num_base = {}
+        if len(num_cols) > 0:
+            main_stats = df.lazy().select(_num_col_aggs(c, schema[c]) for c in num_cols).collect(engine=_engine(df))
+            num_base = {c: main_stats[c].struct.unnest() for c in num_cols}
+
+        # Outlier scores from the quartiles: per row, or the sorted tail of each column
+        score_exprs = [_outlier_score_expr(c, num_base[c]["25th"].item(), num_base[c]["75th"].item()) for c in num_cols]
+        outlier_scores = None
+        if len(num_cols) > 0 and keep_rows:
+            outlier_scores = df.lazy().select(score_exprs).collect(engine=_engine(df))
+        elif len(num_cols) > 0:
+            tails = (
+                df.lazy()
+                .select(score.filter(score > min_IQR_multi).sort().implode() for score in score_exprs)
+                .collect(engine=_engine(df))
+            )
+            outlier_scores = {c: tails[c].explode().drop_nulls() for c in num_cols}
+
+        # Level frequencies of every column that can be classified categorical
+        cat_cols = [c for c, dtype in schema.items() if re.search(_CAT_DTYPES, str(dtype)) and 1 < unique_counts[c] <= 1.5 * max_levels]
+        level_freqs = {}
+        level_codes = None
+        if len(cat_cols) > 0:
+            level_counts = (
+                df.lazy()
+                .select(pl.col(c).value_counts(sort=False, name="level_freq").implode().alias(c) for c in cat_cols)
+                .collect(engine=_engine(df))
+            )
+            natives = {}
+            for c in cat_cols:
+                col_levels = level_counts[c].explode().struct.unnest()
+                if col_levels.height > max_levels + 1: # Levels plus the null level
+                    continue
+                # Native values with their code, String level and frequency
+                col_levels = col_levels.with_row_index("code").with_columns(level=pl.col(c).cast(pl.String))
+                natives[c] = col_levels[c]
+                level_freqs[c] = col_levels.select("code", "level", "level_freq")
+            if keep_rows:
+                level_codes = df.lazy().select(
+                    pl.col(c).replace_strict(natives[c].drop_nulls(), level_freqs[c].filter(natives[c].is_not_null())["code"], default=None)
+                    for c in natives
+                ).collect(engine=_engine(df))
+
+        return cls(n_rows=df_n, schema=schema, memory_size_kb=memory_size_kb, n_unique=n_unique,
+                   missing=missing, dups=dups, num_base=num_base, level_freqs=level_freqs,
+                   outlier_scores=outlier_scores, level_codes=level_codes,
+                   min_IQR_multi=None if keep_rows else min_IQR_multi, params=profile_params)
+
+    def rethreshold(self, **profile_params) -> Tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+        """
+        Regenerates the `profile()` outputs (data_profile, col_profile, row_profile) for new
+        thresholds from the kept aggregates, without scanning the data.
+
+        Accepts the threshold and section toggle parameters of `profile()` (all but sampling).
+        Parameters that are not given keep their previous value (the `from_frame` parameters
+        at first, then the `profile()` defaults), so thresholds can be tuned one at a time.
+        The values used are stored in `params`.
+
+        Columns are classified and their unique counts reported as by `profile()` with its default
+        `unique_count="early_exit"`, from the counts kept by `from_frame`: exact counts for frames
+        with at most 10,000 rows, else null for the columns over the categorical threshold in the
+        first 10,000 rows and the approximate count for the others. With an effective threshold over
+        1,000 (where `profile()` counts more first rows) the counts may differ from `profile()`'s.
+
+        :param profile_params: Thresholds and section toggles, as for `profile()`.
+        :return: A tuple containing three DataFrames: data_profile, col_profile, row_profile.
+        :rtype: Tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]
+        :raises ValueError: If a parameter is unknown or thresholds are invalid.
+        """
+        unknown = [p for p in {**self.params, **profile_params} if p not in _RETHRESHOLD_DEFAULTS]
+        if unknown:
+            raise ValueError(f"Unknown profile() parameters: {unknown}.")
+        params = {**_RETHRESHOLD_DEFAULTS, **self.params, **profile_params}
+
+        _check_unique_thresholds(params["unique_n_threshold"], params["unique_prop_threshold"])
+        if not isinstance(params["IQR_multi"], (int, float)) or params["IQR_multi"] <= 0:
+             raise ValueError("IQR_multi must be a positive number.")
+        if self.min_IQR_multi is not None and params["get_outlier_stats"] and params["IQR_multi"] < self.min_IQR_multi:
+            raise ValueError(f"IQR_multi must be at least min_IQR_multi={self.min_IQR_multi} without keep_rows.")
+        _check_rare_thresholds(params["rare_level_n_threshold"], params["rare_level_prop_threshold"])
+        self.params = params
+
+        df_n = self.n_rows
+        cols = self.schema.names()
+        keep_rows = self.level_codes is not None or isinstance(self.outlier_scores, pl.DataFrame)
+
+        # --- 1. Column Classification ---
+        cat_n_threshold_use = _cat_n_threshold(df_n, params["unique_n_threshold"], params["unique_prop_threshold"])
+        df_col_types = _col_type_classify(_early_exit_counts(self.n_unique, df_n, cat_n_threshold_use), self.schema, df_n,
+                                          unique_n_threshold=params["unique_n_threshold"],
+                                          unique_prop_threshold=params["unique_prop_threshold"])
+        num_cols = df_col_types.filter(pl.col("col_class") == "num").get_column("column").to_list()
+        cat_cols = df_col_types.filter(pl.col("col_class") == "cat").get_column("column").to_list()
+        uncounted_cols = [c for c in cat_cols if c not in self.level_freqs]
+        if len(uncounted_cols) > 0:
+            print(f"Warning: Levels of {uncounted_cols} were not counted (more than max_levels), no categorical stats computed.")
+            cat_cols = [c for c in cat_cols if c not in uncounted_cols]
+
+        col_profile_list = [df_col_types]
+        row_profile_list = []
+
+        # --- 2. Missing and Duplicate Stats ---
+        for get_stats, (col_df, row_df) in [(params["get_miss_stats"], self.missing), (params["get_dup_stats"], self.dups)]:
+            if get_stats:
+                col_profile_list.append(col_df)
+                if row_df is not None:
+                    row_profile_list.append(row_df)
+
+        # --- 3. Numeric Stats (cast to the common supertype of the numeric columns) ---
+        non_num_col_set = pl.DataFrame({"column": [c for c in cols if c not in num_cols]}, schema={"column": pl.String})
+        if len(num_cols) > 0:
+            value_dtype = pl.DataFrame(schema={c: self.schema[c] for c in num_cols}).unpivot()["value"].dtype
+            main_stats = pl.concat([
+                self.num_base[c].with_columns(pl.col("sum", "min", "max").cast(value_dtype)).select(pl.lit(c).alias("column"), pl.all())
+                for c in num_cols
+            ])
+
+        if params["get_num_stats"] and len(num_cols) > 0:
+            col_profile_list.append(
+                _num_stats_derive(main_stats,
+                                  skew_threshold=params["skew_threshold"], kurtosis_threshold=params["kurtosis_threshold"],
+                                  sparsity_threshold=params["sparsity_threshold"], cv_threshold=params["cv_threshold"])
+                .join(non_num_col_set, on="column", how="full", coalesce=True)
+                .sort("column")
+            )
+
+        # --- 4. Outlier Stats (from the outlier scores) ---
+        if params["get_outlier_stats"] and len(num_cols) > 0:
+            m = params["IQR_multi"]
+            if keep_rows:
+                outliers_n = self.outlier_scores.select((pl.col(c) > m).sum().cast(pl.UInt32) for c in num_cols).row(0)
+            else:
+                outliers_n = [len(self.outlier_scores[c]) - self.outlier_scores[c].search_sorted(m, side="right") for c in num_cols]
+            col_profile_list.append(
+                main_stats
+                .select("column", *_outlier_bound_exprs(m))
+                .with_columns(outliers_n=pl.Series(outliers_n, dtype=pl.UInt32))
+                .with_columns(
+                    outliers_prop=pl.col("outliers_n")/pl.lit(df_n),
+                    outliers_ind=(pl.col("outliers_n")>1).cast(pl.UInt8)
+                )
+                .select(["column", "outlier_LB", "outlier_UB", "outliers_ind", "outliers_n", "outliers_prop"])
+                .join(non_num_col_set, on="column", how="full", coalesce=True)
+            )
+            if keep_rows: # Rows with at least one finite numeric value
+                row_profile_list.append(
+                    self.outlier_scores
+                    .with_row_index("row_index", offset=1)
+                    .filter(pl.any_horizontal(pl.col(num_cols).is_not_null()))
+                    .select(
+                        "row_index",
+                        outliers_n=pl.sum_horizontal((pl.col(c) > m).fill_null(False) for c in num_cols).cast(pl.UInt32)
+                    )
+                    .with_columns(
+                        outliers_prop=pl.col("outliers_n")/pl.lit(len(num_cols)), # Prop in reference to number or num columns per sample
+                        outliers_ind=(pl.col("outliers_n")>0).cast(pl.UInt8)
+                    )
+                    .select(["row_index", "outliers_ind", "outliers_n", "outliers_prop"])
+                )
+
+        # --- 5. Categorical Stats (from the level frequencies) ---
+        if params["get_cat_stats"] and len(cat_cols) > 0:
+            exclude_null_level = params["exclude_null_level"]
+            freq_counts = []
+            for c in cat_cols:
+                col_levels = self.level_freqs[c]
+                if exclude_null_level:
+                    col_levels = col_levels.drop_nulls("level")
+                freq_counts.append(
+                    col_levels
+                    .with_columns(pl.col("level").fill_null("NULL")) # Add a null as a level if not excluded
+                    .group_by("level", maintain_order=True)
+                    .agg(pl.col("level_freq").sum().cast(pl.UInt32))
+                    .select(pl.lit(c, dtype=pl.String).alias("column"), "level", "level_freq")
+                )
+            df_freq_counts = pl.concat(freq_counts).with_columns(level_prop=pl.col("level_freq")/pl.lit(df_n))
+            cat_long_n = df_freq_counts["level_freq"].sum()
+
+            non_cat_col_set = pl.DataFrame({"column": [c for c in cols if c not in cat_cols]}, schema={"column": pl.String})
+            col_cat_freq, df_cat_rare_levels = _cat_freq_stats(
+                df_freq_counts.lazy(), non_cat_col_set, cat_long_n,
+                exclude_null_level=exclude_null_level,
+                rare_level_n_threshold=params["rare_level_n_threshold"],
+                rare_level_prop_threshold=params["rare_level_prop_threshold"]
+            )
+            col_cat_freq, df_cat_rare_levels = pl.collect_all([col_cat_freq, df_cat_rare_levels])
+            col_profile_list.append(col_cat_freq)
+
+            if keep_rows:
+                # Codes of the rare levels of each column (Null values have no code)
+                rare_levels = dict(df_cat_rare_levels.select("column", "rare_level").iter_rows()) if "rare_level" in df_cat_rare_levels.columns else {}
+                rare_flags = [pl.lit(False)]
+                for c, levels in rare_levels.items():
+                    level = pl.col("level") if exclude_null_level else pl.col("level").fill_null("NULL")
+                    rare_codes = self.level_freqs[c].filter(level.is_in(levels))
+                    rare_flag = pl.col(c).is_in(rare_codes.drop_nulls("level")["code"].implode()).fill_null(False)
+                    if rare_codes["level"].null_count() > 0: # Null level is rare (exclude_null_level=False)
+                        rare_flag = rare_flag | pl.col(c).is_null()
+                    rare_flags.append(rare_flag)
+
+                row_rare_level_ind = self.level_codes.with_row_index("row_index", offset=1)
+                if exclude_null_level: # Rows without any non-null categorical value have no levels
+                    row_rare_level_ind = row_rare_level_ind.filter(pl.any_horizontal(pl.col(cat_cols).is_not_null()))
+                row_profile_list.append(
+                    row_rare_level_ind.select("row_index", rare_level_ind=pl.any_horizontal(rare_flags).cast(pl.UInt8))
+                )
+
+        # --- 6. Assemble Column, Row and Data Overall Profiles ---
+        return _assemble_profile(
+            col_profile_list=col_profile_list,
+            row_profile_list=row_profile_list,
+            data_info={"number_of_rows": df_n, "number_of_cols": len(cols), "memory_size_kb": self.memory_size_kb},
+            num_cols=num_cols, cat_cols=cat_cols,
+            get_miss_stats=params["get_miss_stats"], get_dup_stats=params["get_dup_stats"],
+            get_num_stats=params["get_num_stats"], get_outlier_stats=params["get_outlier_stats"],
+            get_cat_stats=params["get_cat_stats"]
+        )
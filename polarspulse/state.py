@@ -0,0 +1,681 @@
+# polarspulse/state.py
+import math
+import re
+import polars as pl
+from typing import Tuple # Added for type hints
+
+from .profiling import (
+    FrameLike,
+    _NUM_QUANTILES,
+    _assemble_profile,
+    _cat_freq_stats,
+    _check_rare_thresholds,
+    _check_unique_thresholds,
+    _col_type_classify,
+    _dup_col_frame,
+    _dup_compare_dtype,
+    _dup_fingerprint_expr,
+    _dup_row_frame,
+    _engine,
+    _frame_dims,
+    _num_stats_derive,
+    _outlier_bound_exprs,
+    _row_hash_expr,
+    _row_hash_groups,
+)
+
+# HyperLogLog precision: 2**12 registers per column (about 1.6% relative error)
+_HLL_PRECISION = 12
+_HLL_M = 2 ** _HLL_PRECISION
+
+# Dtypes whose levels are counted for cat_stats (same as the "cat" classification)
+_CAT_DTYPES = "Utf8|String|Binary|Boolean|Categorical|Enum|Int|UInt|Float"
+
+# --- Sketch Helpers ---
+
+# Helper to normalize values before hashing, so partitions with different
+# Categorical encodings hash the same values alike
+def _state_value_expr(col: str, dtype: pl.DataType) -> pl.Expr:
+    if isinstance(dtype, (pl.Categorical, pl.Enum)):
+        return pl.col(col).cast(pl.String)
+    return pl.col(col)
+
+# Helper to build the HyperLogLog (register, rank) codes of a column
+def _hll_codes_expr(col: str, dtype: pl.DataType) -> pl.Expr:
+    """
+    Each value hash is split into a register (top bits) and a rank (leading zeros of
+    the remaining bits + 1), encoded as `register * 64 + rank`. Only the distinct codes
+    are returned, so the output is bounded by 64 * number of registers.
+    """
+    value = _state_value_expr(col, dtype)
+    if dtype.is_float():
+        value = value.fill_nan(None) # Treat NaN and Null as the same for uniqueness
+    h = value.hash(seed=2)
+    low_bits = 64 - _HLL_PRECISION
+    register = h // pl.lit(2 ** low_bits, dtype=pl.UInt64)
+    rank = (h & pl.lit(2 ** low_bits - 1, dtype=pl.UInt64)).bitwise_leading_zeros().cast(pl.UInt64) - _HLL_PRECISION + 1
+    return (register * 64 + rank).unique().implode().alias(col)
+
+# Helper to turn distinct HyperLogLog codes into the register array of a column
+def _hll_registers(codes: pl.Series) -> pl.Series:
+    ranks = (
+        pl.DataFrame({"code": codes})
+        .group_by(register=pl.col("code") // 64)
+        .agg(rank=(pl.col("code") % 64).max().cast(pl.UInt8))
+    )
+    return (
+        pl.DataFrame({"register": pl.arange(0, _HLL_M, dtype=pl.UInt64, eager=True)})
+        .join(ranks, on="register", how="left")
+        .get_column("rank")
+        .fill_null(0)
+    )
+
+# Helper to estimate the number of distinct values from the register array
+def _hll_estimate(registers: pl.Series) -> int:
+    alpha = 0.7213 / (1 + 1.079 / _HLL_M)
+    estimate = alpha * _HLL_M ** 2 / (2.0 ** -registers.cast(pl.Float64)).sum()
+    zeros = (registers == 0).sum()
+    if estimate <= 2.5 * _HLL_M and zeros > 0:
+        estimate = _HLL_M * math.log(_HLL_M / zeros) # Linear counting for small cardinalities
+    return int(round(estimate))
+
+# Helper to build the quantile sketch sample of a column
+def _sketch_sample_expr(finite: pl.Expr, sketch_size: int) -> pl.Expr:
+    """
+    Takes `sketch_size` evenly spaced order statistics of the finite values, or all
+    of them (exact quantiles) when there are no more than `sketch_size`.
+    """
+    n = finite.len()
+    size = pl.min_horizontal(n, pl.lit(sketch_size, dtype=pl.UInt32)).cast(pl.Int64)
+    index = (pl.int_range(0, size) * 2 + 1) * n.cast(pl.Int64) // (size * 2)
+    return finite.sort().gather(index).cast(pl.Float64).implode()
+
+# Helper to shrink a weighted quantile sketch back to `sketch_size` points
+def _sketch_compress(sketch: pl.DataFrame, sketch_size: int) -> pl.DataFrame:
+    """
+    Keeps the points found at evenly spaced cumulative weights, each carrying an equal
+    share of the total weight. Sketches with at most `sketch_size` points are kept as is.
+    """
+    sketch = sketch.sort("value")
+    if sketch.height <= sketch_size:
+        return sketch
+    total = sketch["weight"].sum()
+    targets = pl.Series([(k + 0.5) * total / sketch_size for k in range(sketch_size)])
+    index = sketch["weight"].cum_sum().search_sorted(targets, side="left")
+    return pl.DataFrame({
+        "value": sketch["value"].gather(index),
+        "weight": pl.Series([total / sketch_size] * sketch_size, dtype=pl.Float64),
+    })
+
+# Helper to read a quantile from a weighted quantile sketch
+def _sketch_quantile(sketch: pl.DataFrame, q: float):
+    """
+    Uses the 'nearest' rank rule of Polars quantiles, so sketches holding every
+    value (all weights 1) give exact quantiles.
+    """
+    if sketch.height == 0:
+        return None
+    cum_weight = sketch["weight"].cum_sum()
+    rank = math.floor(q * (cum_weight[-1] - 1) + 0.5)
+    index = min(cum_weight.search_sorted(rank, side="right"), sketch.height - 1)
+    return sketch["value"][index]
+
+# Helper to combine the moments of two partitions (parallel update of Pebay, 2008)
+def _moments_merge(a: dict, b: dict) -> dict:
+    flags = {"nan_ind": a["nan_ind"] or b["nan_ind"], "inf_ind": a["inf_ind"] or b["inf_ind"]}
+    if a["n"] == 0:
+        return {**b, **flags}
+    if b["n"] == 0:
+        return {**a, **flags}
+    na, nb = a["n"], b["n"]
+    n = na + nb
+    delta = b["mean"] - a["mean"]
+    m2 = a["m2"] + b["m2"] + delta ** 2 * na * nb / n
+    m3 = (a["m3"] + b["m3"] + delta ** 3 * na * nb * (na - nb) / n ** 2
+          + 3 * delta * (na * b["m2"] - nb * a["m2"]) / n)
+    m4 = (a["m4"] + b["m4"] + delta ** 4 * na * nb * (na ** 2 - na * nb + nb ** 2) / n ** 3
+          + 6 * delta ** 2 * (na ** 2 * b["m2"] + nb ** 2 * a["m2"]) / n ** 2
+          + 4 * delta * (na * b["m3"] - nb * a["m3"]) / n)
+    return {
+        "n": n,
+        "sum": a["sum"] + b["sum"],
+        "mean": a["mean"] + delta * nb / n,
+        "m2": m2, "m3": m3, "m4": m4,
+        "min": min(a["min"], b["min"]),
+        "max": max(a["max"], b["max"]),
+        "zero_n": a["zero_n"] + b["zero_n"],
+        **flags,
+    }
+
+# --- Profile State ---
+
+class ProfileState:
+    """
+    Mergeable summary of a DataFrame, for profiling data that is split into partitions
+    (e.g. daily files). Build one state per partition with `ProfileState.from_frame`,
+    combine them with `merge`, and produce the `profile()` outputs with `finalize`.
+
+    A state holds only mergeable summaries:
+    - Row count, Null counts, NaN/Inf indicators and moment sums (n, sum, mean,
+      central moments, min, max, zeros) for mean, std, skew, kurtosis and sparsity.
+    - A weighted quantile sketch of `sketch_size` points for the percentiles of num_stats
+      and the outlier bounds. Quantiles are exact while a column has no more than
+      `sketch_size` finite values; after that their rank error is about 1 / sketch_size.
+    - A HyperLogLog sketch per column for the column_type_ident unique counts.
+    - Level counters for cat_stats, kept while a column has at most `max_levels` levels.
+      Columns with more levels keep only the HyperLogLog estimate.
+    - Column fingerprints for the duplicate column check.
+    - With `keep_rows`, a (missing_n, row_hash) pair per row for the row-level
+      missing and duplicate sections.
+
+    Duplicates are matched on their 64-bit hashes only, as the values are not kept.
+    The outlier counts are estimated from the quantile sketch, and the row-level outlier
+    and rare level sections are not produced, as they need the row values.
+    """
+
+    def __init__(self, n_rows: int, schema: pl.Schema, null_n: dict, hll: pl.DataFrame,
+                 fingerprints: dict, moments: dict, sketches: dict, level_counts: dict,
+                 rows: pl.DataFrame = None, sketch_size: int = 2048, max_levels: int = 1000):
+        self.n_rows = n_rows
+        self.schema = schema
+        self.null_n = null_n
+        self.hll = hll
+        self.fingerprints = fingerprints
+        self.moments = moments
+        self.sketches = sketches
+        self.level_counts = level_counts
+        self.rows = rows
+        self.sketch_size = sketch_size
+        self.max_levels = max_levels
+
+    def __repr__(self) -> str:
+        return f"ProfileState(n_rows={self.n_rows}, n_cols={len(self.schema)}, keep_rows={self.rows is not None})"
+
+    @classmethod
+    def from_frame(cls,
+                   df: FrameLike,
+                   sketch_size: int = 2048,
+                   max_levels: int = 1000,
+                   keep_rows: bool = True,
+                   ) -> "ProfileState":
+        """
+        Summarizes a DataFrame or LazyFrame (one partition) into a ProfileState.
+
+        :param df: Input Polars DataFrame or LazyFrame (collected on the streaming engine).
+        :param sketch_size: Number of points kept by the quantile sketch of each numeric column.
+        :param max_levels: Max number of levels counted per column for cat_stats.
+        :param keep_rows: Whether to keep the per-row data of the row-level missing and duplicate sections.
+        :return: The ProfileState of the frame.
+        :rtype: ProfileState
+        :raises ValueError: If the DataFrame is empty or parameters are invalid.
+        """
+        if not isinstance(sketch_size, int) or sketch_size <= 0:
+            raise ValueError("sketch_size must be a positive integer.")
+        if not isinstance(max_levels, int) or max_levels <= 0:
+            raise ValueError("max_levels must be a positive integer.")
+
+        df_n, _ = _frame_dims(df)
+        schema = df.lazy().collect_schema()
+        cols = schema.names()
+        num_cols = [c for c, dtype in schema.items() if dtype.is_integer() or dtype.is_float()]
+
+        # Column summaries in one wide-form pass: a struct of scalars per column
+        col_aggs = []
+        for c, dtype in schema.items():
+            fields = [
+                pl.col(c).null_count().alias("null_n"),
+                _dup_fingerprint_expr(c, dtype).alias("fingerprint"),
+                _hll_codes_expr(c, dtype).alias("hll_codes"),
+            ]
+            if c in num_cols:
+                value = pl.col(c)
+                finite = value.filter(value.is_finite()) # filter out NaN and Infinite values
+                centered = finite.cast(pl.Float64) - finite.cast(pl.Float64).mean()
+                fields += [
+                    finite.len().alias("n"),
+                    finite.sum().alias("sum"),
+                    finite.cast(pl.Float64).mean().alias("mean"),
+                    *((centered ** k).sum().alias(f"m{k}") for k in (2, 3, 4)),
+                    finite.min().alias("min"),
+                    finite.max().alias("max"),
+                    (finite == 0).sum().alias("zero_n"),
+                    value.is_nan().any().alias("nan_ind"),
+                    value.is_infinite().any().alias("inf_ind"),
+                    _sketch_sample_expr(finite, sketch_size).alias("sample"),
+                ]
+            col_aggs.append(pl.struct(fields).alias(c))
+        queries = [df.lazy().select(col_aggs)]
+        if keep_rows:
+            queries.append(
+                df.lazy().select(
+                    pl.sum_horizontal(pl.all().is_null()).cast(pl.UInt32).alias("missing_n"),
+                    _row_hash_expr([_state_value_expr(c, dtype) for c, dtype in schema.items()]),
+                )
+            )
+        results = pl.collect_all(queries, engine=_engine(df))
+        summaries = results[0].row(0, named=True)
+        rows = results[1] if keep_rows else None
+
+        null_n = {c: summaries[c]["null_n"] for c in cols}
+        fingerprints = {c: [summaries[c]["fingerprint"]] for c in cols}
+        hll = pl.DataFrame({c: _hll_registers(pl.Series(summaries[c]["hll_codes"], dtype=pl.UInt64)) for c in cols})
+        moments = {
+            c: {k: summaries[c][k] for k in ("n", "sum", "mean", "m2", "m3", "m4", "min", "max", "zero_n", "nan_ind", "inf_ind")}
+            for c in num_cols
+        }
+        sketches = {}
+        for c in num_cols:
+            sample = pl.Series("value", summaries[c]["sample"], dtype=pl.Float64)
+            weight = moments[c]["n"] / len(sample) if len(sample) > 0 else 1.0
+            sketches[c] = pl.DataFrame({"value": sample, "weight": pl.Series([weight] * len(sample), dtype=pl.Float64)})
+
+        # Count levels of the columns that can have at most max_levels levels
+        count_cols = [
+            c for c, dtype in schema.items()
+            if re.search(_CAT_DTYPES, str(dtype)) and _hll_estimate(hll[c]) <= 1.5 * max_levels
+        ]
+        level_counts = {c: None for c in cols}
+        if len(count_cols) > 0:
+            # Count on the native dtype, then cast only the distinct levels to String
+            counts = (
+                df.lazy()
+                .select(pl.col(c).drop_nulls().value_counts(name="level_freq").implode().alias(c) for c in count_cols)
+                .collect(engine=_engine(df))
+            )
+            for c in count_cols:
+                col_levels = counts[c].explode().struct.unnest()
+                if col_levels.height <= max_levels:
+                    level_counts[c] = dict(col_levels.select(pl.col(c).cast(pl.String), "level_freq").iter_rows())
+
+        return cls(n_rows=df_n, schema=schema, null_n=null_n, hll=hll, fingerprints=fingerprints,
+                   moments=moments, sketches=sketches, level_counts=level_counts, rows=rows,
+                   sketch_size=sketch_size, max_levels=max_levels)
+
+    def merge(self, other: "ProfileState") -> "ProfileState":
+        """
+        Combines this state with the state of another partition of the same table.
+        Rows of `other` follow the rows of this state (row_index and duplicate order).
+        The inputs are not modified.
+
+        :param other: ProfileState of another partition with the same schema.
+        :return: The ProfileState of both partitions.
+        :rtype: ProfileState
+        :raises ValueError: If the states have different schemas or sketch parameters.
+        """
+        if not isinstance(other, ProfileState):
+            raise TypeError("other must be a ProfileState.")
+        if self.schema != other.schema:
+            raise ValueError("ProfileState objects must have the same schema to be merged.")
+        if (self.sketch_size, self.max_levels) != (other.sketch_size, other.max_levels):
+            raise ValueError("ProfileState objects must have the same sketch_size and max_levels to be merged.")
+
+        cols = self.schema.names()
+
+        # Level counters are dropped once a column exceeds max_levels
+        level_counts = {}
+        for c in cols:
+            a, b = self.level_counts[c], other.level_counts[c]
+            counts = None
+            if a is not None and b is not None:
+                counts = dict(a)
+                for level, freq in b.items():
+                    counts[level] = counts.get(level, 0) + freq
+                if len(counts) > self.max_levels:
+                    counts = None
+            level_counts[c] = counts
+
+        rows = None
+        if self.rows is not None and other.rows is not None:
+            rows = pl.concat([self.rows, other.rows], how="diagonal_relaxed", rechunk=False) # Row flags may exist on one side only
+
+        return ProfileState(
+            n_rows=self.n_rows + other.n_rows,
+            schema=self.schema,
+            null_n={c: self.null_n[c] + other.null_n[c] for c in cols},
+            hll=self.hll.select(pl.max_horizontal(pl.col(c), other.hll[c]).alias(c) for c in cols), # Register-wise max
+            fingerprints={c: self.fingerprints[c] + other.fingerprints[c] for c in cols},
+            moments={c: _moments_merge(self.moments[c], other.moments[c]) for c in self.moments},
+            sketches={
+                c: _sketch_compress(pl.concat([self.sketches[c], other.sketches[c]]), self.sketch_size)
+                for c in self.sketches
+            },
+            level_counts=level_counts,
+            rows=rows,
+            sketch_size=self.sketch_size,
+            max_levels=self.max_levels,
+        )
+
+    # Helper to get the unique value count of a column: exact from the level counters, else HyperLogLog
+    def _n_unique(self, col: str) -> int:
+        counts = self.level_counts[col]
+        if counts is None:
+            return _hll_estimate(self.hll[col])
+        n_unique = len(counts)
+        missing = self.null_n[col] > 0
+        if self.schema[col].is_float() and "NaN" in counts:
+            n_unique -= 1 # Treat NaN and Null as the same for uniqueness
+            missing = True
+        return n_unique + int(missing)
+
+    # Helper to classify the columns, returning the types frame and the num and cat columns
+    def _col_types(self, unique_n_threshold: int = 10, unique_prop_threshold: float = None) -> Tuple[pl.DataFrame, list, list]:
+        cols = self.schema.names()
+        df_col_types = _col_type_classify(
+            pl.DataFrame({"column": cols, "approx_n_unique": [self._n_unique(c) for c in cols]},
+                         schema={"column": pl.String, "approx_n_unique": pl.UInt32}),
+            self.schema, self.n_rows,
+            unique_n_threshold=unique_n_threshold, unique_prop_threshold=unique_prop_threshold
+        )
+        num_cols = df_col_types.filter(pl.col("col_class") == "num").get_column("column").to_list()
+        cat_cols = df_col_types.filter(pl.col("col_class") == "cat").get_column("column").to_list()
+
+        # Categorical columns whose levels were not counted can only be classified
+        uncounted_cols = [c for c in cat_cols if self.level_counts[c] is None]
+        if len(uncounted_cols) > 0:
+            print(f"Warning: Levels of {uncounted_cols} exceed max_levels={self.max_levels}, no categorical stats computed.")
+            cat_cols = [c for c in cat_cols if c not in uncounted_cols]
+
+        return df_col_types, num_cols, cat_cols
+
+    # Helper to get the outlier bounds of numeric columns from the sketch quartiles
+    def _outlier_bounds(self, num_cols: list, IQR_multi: float = 5.0) -> pl.DataFrame:
+        return (
+            pl.DataFrame(
+                [{"column": c, **{name: _sketch_quantile(self.sketches[c], q) for q, name in _NUM_QUANTILES}} for c in num_cols],
+                schema={"column": pl.String, **{name: pl.Float64 for _, name in _NUM_QUANTILES}}
+            )
+            .select("column", *_outlier_bound_exprs(IQR_multi))
+        )
+
+    # Helper to get the column-level categorical stats and rare levels from the level counters
+    def _cat_freq_stats(self,
+                        cat_cols: list,
+                        exclude_null_level: bool = True,
+                        rare_level_n_threshold: int = 5,
+                        rare_level_prop_threshold: float = None
+                        ) -> Tuple[pl.LazyFrame, pl.LazyFrame]:
+        freq_counts = []
+        for c in cat_cols:
+            counts = dict(self.level_counts[c])
+            if not exclude_null_level and self.null_n[c] > 0:
+                counts["NULL"] = counts.get("NULL", 0) + self.null_n[c] # Add a null as a level
+            freq_counts += [{"column": c, "level": level, "level_freq": freq} for level, freq in counts.items()]
+        df_freq_counts = (
+            pl.LazyFrame(freq_counts, schema={"column": pl.String, "level": pl.String, "level_freq": pl.UInt32})
+            .with_columns(level_prop=pl.col("level_freq")/pl.lit(self.n_rows))
+        )
+        cat_long_n = self.n_rows * len(cat_cols)
+        if exclude_null_level:
+            cat_long_n -= sum(self.null_n[c] for c in cat_cols)
+        return _cat_freq_stats(
+            df_freq_counts,
+            pl.DataFrame({"column": [c for c in self.schema.names() if c not in cat_cols]}, schema={"column": pl.String}),
+            cat_long_n,
+            exclude_null_level=exclude_null_level,
+            rare_level_n_threshold=rare_level_n_threshold,
+            rare_level_prop_threshold=rare_level_prop_threshold
+        )
+
+    def finalize(self,
+
+                 # Col Classification thresholds
+                 unique_n_threshold:int = 10,
+                 unique_prop_threshold:float = None,
+
+                 # Toggles for sections
+                 get_miss_stats:bool = True,
+                 get_dup_stats:bool = True,
+                 get_num_stats:bool = True,
+                 get_outlier_stats:bool = True,
+                 get_cat_stats:bool = True,
+
+                 # Num stats thresholds
+                 skew_threshold: float = 3.0,
+                 kurtosis_threshold: float = 3.0,
+                 sparsity_threshold: float = 0.5,
+                 cv_threshold: float = 1.0,
+
+                 # Outlier stats threshold multiplier
+                 IQR_multi:float = 5.0,
+
+                 # Cat stats thresholds/options
+                 exclude_null_level: bool = True,
+                 rare_level_n_threshold: int = 5,
+                 rare_level_prop_threshold: float = None
+
+                 ) -> Tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+        """
+        Produces the `profile()` outputs (data_profile, col_profile, row_profile) from the state.
+        Parameters are the same as for `profile()`. `memory_size_kb` is null.
+        Row-level outlier and rare level indicators are included for the rows added with
+        `update`, as computed when they were added (null for other rows).
+
+        :return: A tuple containing three DataFrames: data_profile, col_profile, row_profile.
+        :rtype: Tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]
+        :raises ValueError: If thresholds are invalid.
+        """
+        _check_unique_thresholds(unique_n_threshold, unique_prop_threshold)
+        if not isinstance(IQR_multi, (int, float)) or IQR_multi <= 0:
+             raise ValueError("IQR_multi must be a positive number.")
+        _check_rare_thresholds(rare_level_n_threshold, rare_level_prop_threshold)
+
+        df_n = self.n_rows
+        cols = self.schema.names()
+
+        # --- 1. Column Classification ---
+        df_col_types, num_cols, cat_cols = self._col_types(unique_n_threshold, unique_prop_threshold)
+
+        col_profile_list = [df_col_types]
+        row_profile_list = []
+        rows = None
+        if self.rows is not None:
+            rows = self.rows.with_row_index("row_index", offset=1)
+
+        # --- 2. Missing Stats ---
+        if get_miss_stats:
+            col_profile_list.append(pl.DataFrame({
+                "column": cols,
+                "missing_n": pl.Series([self.null_n[c] for c in cols], dtype=pl.UInt32),
+            }).with_columns(missing_prop=(pl.col("missing_n") / df_n).round(4)))
+            if rows is not None:
+                row_profile_list.append(
+                    rows.select(
+                        "row_index", "missing_n",
+                        (pl.col("missing_n") / pl.lit(len(cols))).round(4).alias("missing_prop")
+                    )
+                )
+
+        # --- 3. Duplicate Stats (on fingerprints and row hashes) ---
+        if get_dup_stats:
+            candidates = {}
+            for c in cols:
+                candidates.setdefault((_dup_compare_dtype(self.schema[c]), tuple(self.fingerprints[c])), []).append(c)
+            col_profile_list.append(_dup_col_frame(cols, [group for group in candidates.values() if len(group) > 1]))
+            if rows is not None:
+                row_profile_list.append(_dup_row_frame(_row_hash_groups(rows.select("row_index", "row_hash"))))
+
+        # --- 4. Numeric Stats ---
+        non_num_col_set = pl.DataFrame({"column": [c for c in cols if c not in num_cols]}, schema={"column": pl.String})
+        value_dtype = pl.DataFrame(schema={c: self.schema[c] for c in num_cols}).unpivot()["value"].dtype if num_cols else pl.Float64
+
+        if get_num_stats and len(num_cols) > 0:
+            main_stats = []
+            for c in num_cols:
+                m = self.moments[c]
+                n = m["n"]
+                var = m["m2"] / (n - 1) if n > 1 else None
+                main_stats.append({
+                    "column": c,
+                    "n": n,
+                    "sum": m["sum"] if n > 0 else 0,
+                    "mean": m["mean"],
+                    "std": math.sqrt(var) if var is not None else None,
+                    "min": m["min"],
+                    **{name: _sketch_quantile(self.sketches[c], q) for q, name in _NUM_QUANTILES},
+                    "max": m["max"],
+                    # Population (biased) skew and excess kurtosis, as Polars computes them
+                    "skew": (math.sqrt(n) * m["m3"] / m["m2"] ** 1.5 if m["m2"] > 0 else float("nan")) if n > 0 else None,
+                    "kurtosis": (n * m["m4"] / m["m2"] ** 2 - 3 if m["m2"] > 0 else float("nan")) if n > 0 else None,
+                    "sparsity": m["zero_n"] / n if n > 0 else None,
+                    "nan_ind": int(m["nan_ind"]),
+                    "inf_ind": int(m["inf_ind"]),
+                })
+            main_stats = pl.DataFrame(main_stats, schema={
+                "column": pl.String, "n": pl.UInt32, "sum": value_dtype, "mean": pl.Float64, "std": pl.Float64,
+                "min": value_dtype, **{name: pl.Float64 for _, name in _NUM_QUANTILES}, "max": value_dtype,
+                "skew": pl.Float64, "kurtosis": pl.Float64, "sparsity": pl.Float64, "nan_ind": pl.UInt8, "inf_ind": pl.UInt8,
+            })
+            col_profile_list.append(
+                _num_stats_derive(main_stats,
+                                  skew_threshold=skew_threshold, kurtosis_threshold=kurtosis_threshold,
+                                  sparsity_threshold=sparsity_threshold, cv_threshold=cv_threshold)
+                .join(non_num_col_set, on="column", how="full", coalesce=True)
+                .sort("column")
+            )
+
+        # --- 5. Outlier Stats (bounds from the sketch quartiles, counts estimated from the sketch) ---
+        if get_outlier_stats and len(num_cols) > 0:
+            outlier_bounds = self._outlier_bounds(num_cols, IQR_multi)
+            outliers_n = []
+            for c, lb, ub in outlier_bounds.iter_rows():
+                sketch = self.sketches[c]
+                outliers_n.append(round(sketch.filter(pl.col("value").is_between(lb, ub, closed="both").not_())["weight"].sum()))
+            col_profile_list.append(
+                outlier_bounds
+                .with_columns(outliers_n=pl.Series(outliers_n, dtype=pl.UInt32))
+                .with_columns(
+                    outliers_prop=pl.col("outliers_n")/pl.lit(df_n),
+                    outliers_ind=(pl.col("outliers_n")>1).cast(pl.UInt8)
+                )
+                .select(["column", "outlier_LB", "outlier_UB", "outliers_ind", "outliers_n", "outliers_prop"])
+                .join(non_num_col_set, on="column", how="full", coalesce=True)
+            )
+            if rows is not None and "outliers_n" in rows.columns:
+                row_profile_list.append(rows.select(["row_index", "outliers_ind", "outliers_n", "outliers_prop"]))
+
+        # --- 6. Categorical Stats (from the level counters) ---
+        if get_cat_stats and len(cat_cols) > 0:
+            col_cat_freq, _ = self._cat_freq_stats(
+                cat_cols,
+                exclude_null_level=exclude_null_level,
+                rare_level_n_threshold=rare_level_n_threshold,
+                rare_level_prop_threshold=rare_level_prop_threshold
+            )
+            col_profile_list.append(col_cat_freq.collect())
+            if rows is not None and "rare_level_ind" in rows.columns:
+                row_profile_list.append(rows.select(["row_index", "rare_level_ind"]))
+
+        # --- 7. Assemble Column, Row and Data Overall Profiles ---
+        return _assemble_profile(
+            col_profile_list=col_profile_list,
+            row_profile_list=row_profile_list,
+            data_info={
+                "number_of_rows": df_n,
+                "number_of_cols": len(cols),
+                "memory_size_kb": None, # The state does not hold the data
+            },
+            num_cols=num_cols, cat_cols=cat_cols,
+            get_miss_stats=get_miss_stats, get_dup_stats=get_dup_stats, get_num_stats=get_num_stats,
+            get_outlier_stats=get_outlier_stats, get_cat_stats=get_cat_stats
+        )
+
+# --- Incremental Updates ---
+
+# Function to fold a new batch of rows into a profile state
+def update(profile_state: ProfileState,
+           new_batch: FrameLike,
+
+           # Col Classification thresholds
+           unique_n_threshold:int = 10,
+           unique_prop_threshold:float = None,
+
+           # Outlier stats threshold multiplier
+           IQR_multi:float = 5.0,
+
+           # Cat stats thresholds/options
+           exclude_null_level: bool = True,
+           rare_level_n_threshold: int = 5,
+           rare_level_prop_threshold: float = None,
+
+           # Sketch parameters, used when profile_state is None
+           sketch_size: int = 2048,
+           max_levels: int = 1000,
+           keep_rows: bool = True,
+           ) -> ProfileState:
+    """
+    Folds a new batch of an append-only table into its profile state, so the cost of
+    an update depends on the batch size rather than the table size.
+
+    Column statistics, missing counts, level frequencies, and with them the rare level
+    sets and outlier bounds, are updated through `ProfileState.merge`. Row-level sections
+    are computed for the new rows only: their outlier and rare level indicators use the
+    outlier bounds and rare levels of the updated state, while earlier rows keep the
+    indicators computed when they were added.
+
+    :param profile_state: State of the rows seen so far, or None to start from the first batch.
+    :param new_batch: New rows, as a Polars DataFrame or LazyFrame with the same schema.
+    :param unique_n_threshold: Max unique values for 'categorical' classification.
+    :param unique_prop_threshold: Proportion unique values threshold for 'categorical'.
+    :param IQR_multi: Multiplier for IQR range in outlier detection.
+    :param exclude_null_level: If True, Nulls are ignored in categorical analysis.
+    :param rare_level_n_threshold: Absolute count threshold for rare category levels.
+    :param rare_level_prop_threshold: Proportion threshold for rare category levels.
+    :param sketch_size: Number of points kept by the quantile sketch of each numeric column.
+    :param max_levels: Max number of levels counted per column for cat_stats.
+    :param keep_rows: Whether to keep the row-level sections.
+    :return: The updated ProfileState (the input state is not modified).
+    :rtype: ProfileState
+    :raises ValueError: If the batch is empty, its schema differs, or thresholds are invalid.
+    """
+    _check_unique_thresholds(unique_n_threshold, unique_prop_threshold)
+    if not isinstance(IQR_multi, (int, float)) or IQR_multi <= 0:
+         raise ValueError("IQR_multi must be a positive number.")
+    _check_rare_thresholds(rare_level_n_threshold, rare_level_prop_threshold)
+
+    # Summarize the batch with the sketch parameters of the existing state
+    if profile_state is not None:
+        sketch_size, max_levels = profile_state.sketch_size, profile_state.max_levels
+        keep_rows = profile_state.rows is not None
+    batch_state = ProfileState.from_frame(new_batch, sketch_size=sketch_size, max_levels=max_levels, keep_rows=keep_rows)
+    state = batch_state if profile_state is None else profile_state.merge(batch_state)
+
+    if not keep_rows:
+        return state
+
+    # Row-level outlier and rare level indicators of the new rows, against the updated state
+    _, num_cols, cat_cols = state._col_types(unique_n_threshold, unique_prop_threshold)
+    row_flags = []
+    if len(num_cols) > 0:
+        outlier_bounds = state._outlier_bounds(num_cols, IQR_multi)
+        outliers_n = pl.sum_horizontal(
+            (pl.col(c).is_finite() & pl.col(c).is_between(lb, ub, closed="both").not_()) # NaNs and infinite values are ignored
+            for c, lb, ub in outlier_bounds.iter_rows()
+        ).cast(pl.UInt32)
+        row_flags += [
+            (outliers_n > 0).cast(pl.UInt8).alias("outliers_ind"),
+            outliers_n.alias("outliers_n"),
+            (outliers_n / pl.lit(len(num_cols))).alias("outliers_prop"), # Prop in reference to number or num columns per sample
+        ]
+    if len(cat_cols) > 0:
+        _, df_cat_rare_levels = state._cat_freq_stats(
+            cat_cols,
+            exclude_null_level=exclude_null_level,
+            rare_level_n_threshold=rare_level_n_threshold,
+            rare_level_prop_threshold=rare_level_prop_threshold
+        )
+        rare_levels = dict(df_cat_rare_levels.select("column", "rare_level").collect().iter_rows()) if "rare_level" in df_cat_rare_levels.collect_schema() else {}
+        levels = {c: pl.col(c).cast(pl.String) if exclude_null_level else pl.col(c).cast(pl.String).fill_null("NULL") for c in cat_cols}
+        row_flags.append(
+            pl.any_horizontal(pl.lit(False), *(levels[c].is_in(rare_levels[c]).fill_null(False) for c in cat_cols if c in rare_levels))
+            .cast(pl.UInt8).alias("rare_level_ind")
+        )
+
+    if len(row_flags) > 0:
+        batch_rows = pl.concat(
+            [batch_state.rows, new_batch.lazy().select(row_flags).collect(engine=_engine(new_batch))],
+            how="horizontal"
+        )
+        rows = [batch_rows] if profile_state is None else [profile_state.rows, batch_rows]
+        state.rows = pl.concat(rows, how="diagonal_relaxed", rechunk=False)
+
+    return state
@@ -0,0 +1,258 @@
+# polarspulse/store.py
+import json
+import os
+import shutil
+import tempfile
+import polars as pl
+from typing import Sequence, Tuple, Union # Added for type hints
+
+# Identifier and version of the on-disk profile format
+_FORMAT = "polarspulse-profile"
+_FORMAT_VERSION = 1
+
+# Names of the profile frames, in the order of the profile() output (window_profile only with time_column)
+_FRAME_NAMES = ("data_profile", "col_profile", "row_profile", "window_profile")
+
+# File extension of each storage format
+_EXTENSIONS = {"ipc": ".arrow", "parquet": ".parquet"}
+
+_MANIFEST = "manifest.json"
+
+# Quantiles compared by diff_profiles, in IQR units of the first profile
+_DIFF_QUANTILES = ("5th", "25th", "50th", "75th", "95th")
+
+ProfileSource = Union[str, os.PathLike, Tuple[pl.DataFrame, ...], pl.DataFrame]
+
+# --- Helper Functions ---
+
+# Helper to read and check the manifest of a stored profile
+def _read_manifest(path: str) -> dict:
+    """
+    :raises ValueError: If the directory is not a stored profile or its format version is not supported.
+    """
+    try:
+        with open(os.path.join(path, _MANIFEST)) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        raise ValueError(f"'{path}' is not a stored profile (no {_MANIFEST}).") from None
+    if manifest.get("format") != _FORMAT:
+        raise ValueError(f"'{path}' is not a stored profile.")
+    if manifest.get("format_version", 0) > _FORMAT_VERSION:
+        raise ValueError(f"Profile format version {manifest['format_version']} of '{path}' is newer than "
+                         f"the supported version {_FORMAT_VERSION}; upgrade polarspulse to read it.")
+    return manifest
+
+# Helper to get the file of a stored frame
+def _frame_file(path: str, manifest: dict, name: str) -> str:
+    return os.path.join(path, name + _EXTENSIONS[manifest["storage"]])
+
+# Helper to read one stored frame, optionally only some of its columns
+def _read_frame(path: str, manifest: dict, name: str, columns: list = None) -> pl.DataFrame:
+    """
+    IPC files are stored uncompressed, so Polars memory-maps them instead of copying the data.
+    """
+    file = _frame_file(path, manifest, name)
+    if manifest["storage"] == "ipc":
+        return pl.read_ipc(file, columns=columns)
+    return pl.read_parquet(file, columns=columns)
+
+# Helper to get the column profile of a diff_profiles input, with only the needed columns
+def _diff_col_profile(source: ProfileSource, columns: Sequence[str]) -> pl.DataFrame:
+    """
+    :raises TypeError: If source is not a stored profile path, a profile() tuple or a col_profile frame.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        manifest = _read_manifest(path)
+        file = _frame_file(path, manifest, "col_profile")
+        stored = list(pl.read_ipc_schema(file) if manifest["storage"] == "ipc" else pl.read_parquet_schema(file)) # Footer only
+        col_profile = _read_frame(path, manifest, "col_profile", columns=[c for c in stored if c in columns or c in stored[:stored.index("column") + 1]])
+    elif isinstance(source, tuple):
+        col_profile = source[1]
+    elif isinstance(source, pl.DataFrame):
+        col_profile = source
+    else:
+        raise TypeError("Profiles must be stored profile paths, profile() results or col_profile DataFrames.")
+    return col_profile.select(c for c in col_profile.columns if c in columns or c in _key_cols(col_profile))
+
+# Helper to get the key columns of a column profile: the group columns of profile(by=...) and 'column'
+def _key_cols(col_profile: pl.DataFrame) -> list:
+    return col_profile.columns[:col_profile.columns.index("column") + 1]
+
+# --- Main Functions ---
+
+def save_profile(result: Tuple[pl.DataFrame, ...],
+                 path: Union[str, os.PathLike],
+                 storage: str = "ipc",
+                 metadata: dict = None,
+                 overwrite: bool = False) -> None:
+    """
+    Saves a `profile()` result to a profile directory: one file per frame plus a versioned
+    `manifest.json` (format version, library versions, frames, their shapes and `metadata`).
+
+    With `storage="ipc"` (default) the frames are uncompressed Arrow IPC files, which
+    `load_profile` memory-maps without copying. `storage="parquet"` writes compressed Parquet
+    files instead, smaller on disk but decoded on load. Nested columns (e.g. `level`,
+    `level_freq`, `rare_level`) are stored natively in both formats.
+
+    The directory is written to a temporary directory first and renamed into place, so readers
+    never see a partially written profile.
+
+    :param result: The (data_profile, col_profile, row_profile[, window_profile]) tuple of `profile()`.
+    :param path: Directory of the stored profile.
+    :param storage: "ipc" or "parquet".
+    :param metadata: JSON-serializable information stored in the manifest (e.g. the table name or run date).
+    :param overwrite: If True, replaces an existing profile at `path`.
+    :raises ValueError: If result, storage or path is invalid.
+    """
+    if storage not in _EXTENSIONS:
+        raise ValueError("storage must be 'ipc' or 'parquet'.")
+    if not isinstance(result, tuple) or not (3 <= len(result) <= len(_FRAME_NAMES)) or not all(isinstance(f, pl.DataFrame) for f in result):
+        raise ValueError("result must be the tuple of DataFrames returned by profile().")
+    path = os.fspath(path)
+    if os.path.exists(path) and not overwrite:
+        raise ValueError(f"'{path}' already exists; pass overwrite=True to replace it.")
+
+    from . import __version__ # Deferred: the package imports this module
+
+    manifest = {
+        "format": _FORMAT,
+        "format_version": _FORMAT_VERSION,
+        "polarspulse_version": __version__,
+        "polars_version": pl.__version__,
+        "storage": storage,
+        "frames": {name: {"rows": frame.height, "cols": frame.width} for name, frame in zip(_FRAME_NAMES, result)},
+        "metadata": metadata or {},
+    }
+
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=parent, prefix=".tmp-")
+    try:
+        for name, frame in zip(_FRAME_NAMES, result):
+            file = _frame_file(tmp_dir, manifest, name)
+            if storage == "ipc":
+                frame.write_ipc(file, compression="uncompressed")
+            else:
+                frame.write_parquet(file)
+        with open(os.path.join(tmp_dir, _MANIFEST), "w") as f:
+            json.dump(manifest, f, indent=2, default=str)
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.replace(tmp_dir, path)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+def load_profile(path: Union[str, os.PathLike],
+                 frames: Sequence[str] = None) -> Tuple[pl.DataFrame, ...]:
+    """
+    Loads a profile saved by `save_profile`. IPC profiles are memory-mapped, so loading costs
+    only the pages actually read.
+
+    :param path: Directory of the stored profile.
+    :param frames: Names of the frames to load ("data_profile", "col_profile", "row_profile",
+        "window_profile"). Defaults to all stored frames.
+    :return: The stored frames, in the order of the profile() output (or of `frames`).
+    :rtype: Tuple[pl.DataFrame, ...]
+    :raises ValueError: If path is not a stored profile, its format version is not supported,
+        or a frame is not stored.
+    """
+    path = os.fspath(path)
+    manifest = _read_manifest(path)
+    frames = list(manifest["frames"]) if frames is None else list(frames)
+    missing = [name for name in frames if name not in manifest["frames"]]
+    if missing:
+        raise ValueError(f"Frames not stored in '{path}': {missing}.")
+    return tuple(_read_frame(path, manifest, name) for name in frames)
+
+def profile_metadata(path: Union[str, os.PathLike]) -> dict:
+    """
+    Returns the manifest of a stored profile (format and library versions, frame shapes and
+    the `metadata` given to `save_profile`) without reading any frame.
+
+    :raises ValueError: If path is not a stored profile or its format version is not supported.
+    """
+    return _read_manifest(os.fspath(path))
+
+def diff_profiles(a: ProfileSource,
+                  b: ProfileSource,
+                  quantiles: Sequence[str] = _DIFF_QUANTILES) -> pl.DataFrame:
+    """
+    Compares the column profiles of two profiles, e.g. of the same table on two days, without
+    the source data. Stored profiles are read for the compared columns only.
+
+    For each column (and group, for `profile(by=...)` profiles), from `a` to `b`:
+    - `status`: "both", "added" (only in `b`) or "removed" (only in `a`).
+    - `col_class_a`, `col_class_b`, `col_class_changed_ind`.
+    - `missing_prop_a`, `missing_prop_b`, `missing_prop_diff`.
+    - `<q>_shift` for each quantile: (b - a) in units of the IQR of `a` (Null for a zero IQR),
+      and `max_quantile_shift`, the largest absolute shift.
+    - `outliers_prop_a`, `outliers_prop_b`, `outliers_prop_diff`.
+    - `new_levels` / `vanished_levels`: categorical levels only in `b` / only in `a`, and their counts.
+    Statistics missing from either profile (sections not computed) are left out.
+
+    :param a: Reference profile: a stored profile path, a profile() result, or a col_profile DataFrame.
+    :param b: Compared profile, in the same forms.
+    :param quantiles: Quantile columns compared (e.g. "50th").
+    :return: A DataFrame with one row per column (and group).
+    :rtype: pl.DataFrame
+    :raises ValueError: If the profiles do not have the same key columns.
+    """
+    columns = ["col_class", "missing_prop", "iqr", "outliers_prop", "level", *quantiles]
+    col_a = _diff_col_profile(a, columns)
+    col_b = _diff_col_profile(b, columns)
+    keys = _key_cols(col_a)
+    if keys != _key_cols(col_b):
+        raise ValueError(f"Profiles have different key columns: {keys} vs {_key_cols(col_b)}.")
+
+    # A profile without categorical columns has no levels: all levels of the other are new or vanished
+    if "level" in col_a.columns or "level" in col_b.columns:
+        col_a, col_b = (
+            col if "level" in col.columns else col.with_columns(level=pl.lit(None, dtype=pl.List(pl.String)))
+            for col in (col_a, col_b)
+        )
+
+    diff = (
+        col_a.with_columns(_in_a=pl.lit(True))
+        .join(col_b.with_columns(_in_b=pl.lit(True)), on=keys, how="full", coalesce=True, nulls_equal=True, suffix="_b")
+        .rename({c: c + "_a" for c in col_a.columns if c not in keys and c in col_b.columns})
+        .with_columns(
+            status=pl.when(pl.col("_in_a") & pl.col("_in_b")).then(pl.lit("both"))
+                .when(pl.col("_in_a")).then(pl.lit("removed")).otherwise(pl.lit("added"))
+        )
+    )
+    shared = [c for c in columns if c in col_a.columns and c in col_b.columns]
+
+    out = [pl.col(keys), pl.col("status")]
+    if "col_class" in shared:
+        out += [pl.col("col_class_a"), pl.col("col_class_b"),
+                (pl.col("col_class_a") != pl.col("col_class_b")).cast(pl.UInt8).alias("col_class_changed_ind")]
+    for stat in ("missing_prop",):
+        if stat in shared:
+            out += [pl.col(f"{stat}_a"), pl.col(f"{stat}_b"), (pl.col(f"{stat}_b") - pl.col(f"{stat}_a")).alias(f"{stat}_diff")]
+    shifts = [
+        ((pl.col(f"{q}_b") - pl.col(f"{q}_a")) / pl.when(pl.col("iqr_a") > 0).then(pl.col("iqr_a"))).alias(f"{q}_shift")
+        for q in quantiles if q in shared and "iqr" in col_a.columns
+    ]
+    if shifts:
+        out += shifts + [pl.max_horizontal(s.abs() for s in shifts).alias("max_quantile_shift")]
+    if "outliers_prop" in shared:
+        out += [pl.col("outliers_prop_a"), pl.col("outliers_prop_b"),
+                (pl.col("outliers_prop_b") - pl.col("outliers_prop_a")).alias("outliers_prop_diff")]
+    if "level" in shared:
+        # Null for columns without levels in either profile
+        has_levels = pl.col("level_a").is_not_null() | pl.col("level_b").is_not_null()
+        level_a, level_b = pl.col("level_a").fill_null([]), pl.col("level_b").fill_null([])
+        out += [
+            pl.when(has_levels).then(level_b.list.set_difference(level_a)).alias("new_levels"),
+            pl.when(has_levels).then(level_a.list.set_difference(level_b)).alias("vanished_levels"),
+        ]
+
+    diff = diff.select(out)
+    if "level" in shared:
+        diff = diff.with_columns(
+            new_levels_n=pl.col("new_levels").list.len().cast(pl.UInt32),
+            vanished_levels_n=pl.col("vanished_levels").list.len().cast(pl.UInt32),
+        )
+    return diff
@@ -0,0 +1,34 @@
+# tests/test_column_dup_ind.py
+import polars as pl
+
+import polarspulse as pp
+
+# Integers above 2**53 that round to the same Float64
+BIG = 2 ** 60
+
+def test_large_integers_are_compared_exactly():
+    df = pl.DataFrame({"x": [BIG, BIG + 1, 3], "y": [BIG + 1, BIG, 3], "z": [BIG, BIG + 1, 3]})
+    result = pp.column_dup_ind(df)
+    assert result["dup_ind"].to_list() == [1, 0, 1]
+    assert result["dup_first_column"].to_list() == ["x", None, "x"]
+
+def test_large_integers_in_column_batches_groups_and_states():
+    df = pl.DataFrame({"x": [BIG, BIG + 1, 3] * 2, "y": [BIG + 1, BIG, 3] * 2, "g": [1, 1, 1, 2, 2, 2]})
+    _, col_profile, _ = pp.profile(df.drop("g"), column_batch_size=1)
+    assert col_profile["dup_ind"].to_list() == [0, 0]
+    _, col_profile, _ = pp.profile(df, by="g")
+    assert col_profile["dup_ind"].to_list() == [0, 0, 0, 0]
+    _, col_profile, _ = pp.ProfileState.from_frame(df.drop("g")).finalize()
+    assert col_profile["dup_ind"].to_list() == [0, 0]
+
+def test_integer_and_float_columns_match_only_on_integral_values():
+    df = pl.DataFrame({
+        "i": [1, None, 3],
+        "u": pl.Series([1, None, 3], dtype=pl.UInt8),
+        "f": [1.0, None, 3.0],
+        "g": [1.0, None, 3.5],
+        "big": [2 ** 63 - 1, 0, 0],
+        "big_f": [float(2 ** 63 - 1), 0.0, 0.0], # Rounds to 2**63
+    })
+    result = pp.column_dup_ind(df)
+    assert result["dup_group"].to_list() == [1, 1, 1, None, None, None]